@@ -0,0 +1,94 @@
+# 1337 Speak Translator - Benchmark
+#
+# Compares the original per-character replace_chars() loop with the precompiled
+# translation tables used by translate(), on generated English text.
+# With --decode, also measures LeetDecoder on the translated text.  With --random, the
+# text is made of random words instead of one repeated sentence.
+#
+# Usage:
+#   python benchmark_translate.py                      # 1 KB, 1 MB and 100 MB at every level
+#   python benchmark_translate.py --sizes 1KB,10MB --levels 2,3 --decode
+#   python benchmark_translate.py --sizes 10MB --decode --random
+
+
+import argparse
+import random
+import string
+import time
+
+from leet_decoder import LeetDecoder
+from leet_speak_translator import replace_chars, replacements_by_level, translate
+
+
+SAMPLE_TEXT = (
+    "The quick brown fox jumps over the lazy dog. "
+    "Pack my box with five dozen liquor jugs! 0123456789\n"
+)
+
+UNITS = {'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+# Function to parse sizes such as "1KB" or "100MB" into a number of characters
+def parse_size(size):
+    size = size.strip().upper()
+    for unit, factor in UNITS.items():
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * factor)
+    return int(size)
+
+
+# Function to build a sample text of exactly the requested length
+def make_text(length):
+    repeats = length // len(SAMPLE_TEXT) + 1
+    return (SAMPLE_TEXT * repeats)[:length]
+
+
+# Function to build a text of random words that never repeats a sentence
+def make_random_text(length, seed=0):
+    rng = random.Random(seed)
+    words, size = [], 0
+    while size < length:
+        word = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 10)))
+        if rng.random() < 0.1:
+            word = word.capitalize()
+        if rng.random() < 0.1:
+            word += rng.choice('.,!?')
+        words.append(word)
+        size += len(word) + 1
+    return ' '.join(words)[:length]
+
+
+# Function to time a single call, returning the elapsed seconds
+def time_call(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark replace_chars() against translate().")
+    parser.add_argument('--sizes', default='1KB,1MB,100MB',
+                        help='Comma separated input sizes (default = 1KB,1MB,100MB)')
+    parser.add_argument('--levels', default='1,2,3,4',
+                        help='Comma separated complexity levels (default = 1,2,3,4)')
+    parser.add_argument('--decode', action='store_true',
+                        help='Also benchmark decoding the translated text back to English')
+    parser.add_argument('--random', action='store_true',
+                        help='Use random words instead of a repeated sample sentence')
+    args = parser.parse_args()
+
+    print(f"{'size':>8} {'level':>5} {'loop (s)':>10} {'table (s)':>10} {'table MB/s':>11} {'speed-up':>9}")
+    for size_label in args.sizes.split(','):
+        text = (make_random_text if args.random else make_text)(parse_size(size_label))
+        megabytes = len(text) / UNITS['MB']
+        for level in (int(level) for level in args.levels.split(',')):
+            loop_seconds = time_call(replace_chars, text, replacements_by_level[level])
+            table_seconds = time_call(translate, text, level)
+            print(f"{size_label.strip():>8} {level:>5} {loop_seconds:>10.4f} {table_seconds:>10.4f} "
+                  f"{megabytes / max(table_seconds, 1e-9):>11.1f} {loop_seconds / max(table_seconds, 1e-9):>8.1f}x")
+
+            if args.decode:
+                leet = translate(text, level)
+                decode_seconds = time_call(LeetDecoder(level).decode, leet)
+                print(f"{'':>8} {'':>5} decoded {len(leet.encode('utf-8')) / UNITS['MB']:.1f} MB of 1337 "
+                      f"at {len(leet.encode('utf-8')) / UNITS['MB'] / max(decode_seconds, 1e-9):.1f} MB/s")
@@ -0,0 +1,292 @@
+# 1337 Speak Decoder
+#
+# Translates 1337 speak back into English.  The intermediate and advanced tables are
+# ambiguous to read back, because their outputs are multi-character and overlap
+# ('|_', '|_|', '|<', '|>', ...).  The decoder builds a trie from the inverted
+# replacement dictionaries, compiles it into a single regular expression and takes
+# the longest match at every position, so decoding is one linear pass.  Characters
+# that can never be part of a multi-character token are decoded with str.translate,
+# and only the runs of the remaining characters go through the regular expression.
+#
+# Optionally, words that do not decode to a known English word are re-segmented
+# and scored against the word frequencies in frequency_dictionary_en_82_765.txt
+# (shipped with the PDF to MP3 Converter project).
+#
+# Usage:
+#   python leet_decoder.py leet.txt -l 2 -o english.txt
+#   echo "|-|3|_|_0" | python leet_decoder.py - -l 2 --disambiguate
+
+
+import argparse
+import re
+import string
+from pathlib import Path
+
+from leet_speak_translator import DEFAULT_CHUNK_SIZE, open_text, replacements_by_level
+
+
+# Word frequency list used for disambiguation.
+FREQUENCY_DICTIONARY = (Path(__file__).resolve().parent.parent
+                        / "PDF to MP3 Converter" / "frequency_dictionary_en_82_765.txt")
+
+# Key marking the end of a complete 1337 token inside the trie.
+END = ''
+
+# Longer words are left as greedily decoded during disambiguation.
+MAX_WORD_LENGTH = 48
+
+# Decoded token runs remembered between calls; the cache is emptied once it is full.
+RUN_CACHE_SIZE = 65536
+
+# Text with at least this many words per distinct word is decoded word by word.
+REPEATED_WORDS = 4
+
+
+# Function to map every 1337 output back to the characters that produce it
+def invert_replacements(replacements):
+    inverse = {}
+    for char, leet in replacements.items():
+        # Deleted characters (empty outputs) cannot be recovered
+        if leet:
+            inverse.setdefault(leet, []).append(char)
+    return inverse
+
+
+# Function to build a character trie from a collection of tokens
+def build_trie(tokens):
+    trie = {}
+    for token in tokens:
+        node = trie
+        for char in token:
+            node = node.setdefault(char, {})
+        node[END] = token
+    return trie
+
+
+# Function to turn a trie into an equivalent regular expression that prefers longer tokens
+def trie_to_regex(node):
+    branches = [re.escape(char) + trie_to_regex(child)
+                for char, child in sorted(node.items()) if char != END]
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if END in node:
+        # A token ends here, but a longer one is tried first (greedy)
+        pattern = '(?:' + pattern + ')?'
+    return pattern
+
+
+# Function to load word frequencies from a "word count" per line dictionary file
+def load_frequencies(path=FREQUENCY_DICTIONARY):
+    frequencies = {}
+    with open(path, encoding='utf-8-sig') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                frequencies[parts[0]] = int(parts[1])
+    return frequencies
+
+
+class LeetDecoder:
+    """
+    Decodes 1337 speak produced at one complexity level back into English.
+
+    :param level: Complexity level the text was encoded with (1, 2, 3, or 4).
+    :param frequencies: (Optional) Word frequencies used to re-segment words that do not
+                        decode to a known word, e.g. from load_frequencies().
+    :param max_candidates: Maximum number of alternative readings scored per word.
+    """
+
+    def __init__(self, level, frequencies=None, max_candidates=256):
+        try:
+            replacements = replacements_by_level[int(level)]
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid complexity level: {level!r} (expected 1, 2, 3, or 4).") from None
+
+        self.inverse = invert_replacements(replacements)
+        self.trie = build_trie(self.inverse)
+        self.pattern = re.compile(trie_to_regex(self.trie) + '|.', re.DOTALL)
+        # Greedy decoding uses the first character listed for each token (lowercase first)
+        self.mapping = {token: chars[0] for token, chars in self.inverse.items()}
+        # Tokens never cross a character that is not part of a multi-character token, so
+        # the other single-character tokens are translated directly, unless they decode
+        # into a character that would then be read again as part of a token.
+        token_chars = {char for token in self.mapping if len(token) > 1 for char in token}
+        while True:
+            chained = {token for token, char in self.mapping.items()
+                       if len(token) == 1 and token not in token_chars and char in token_chars}
+            if not chained:
+                break
+            token_chars |= chained
+        self.token_chars = ''.join(sorted(token_chars))
+        self.table = str.maketrans({token: char for token, char in self.mapping.items()
+                                    if len(token) == 1 and token not in token_chars})
+        self.runs = re.compile('[' + re.escape(self.token_chars) + ']+') if token_chars else None
+        self.longest = max(map(len, self.mapping))
+        self.run_cache = {}
+        # Readings tried during disambiguation, ignoring case-only differences
+        self.choices = {}
+        for token, chars in self.inverse.items():
+            seen = {}
+            for char in chars:
+                seen.setdefault(char.lower(), char)
+            self.choices[token] = list(seen.values())
+        self.frequencies = frequencies
+        self.max_candidates = max_candidates
+
+    def decode(self, text):
+        """
+        Decodes text by taking the longest known 1337 token at every position.
+        Characters that do not start a token are kept as they are.
+        """
+        decoded = None
+        if self.runs:
+            # Tokens never contain spaces, so in repetitive text every distinct word is
+            # decoded once, all together, and mapped back in place.
+            words = text.split(' ')
+            vocabulary = set(words)
+            if len(vocabulary) * REPEATED_WORDS <= len(words):
+                vocabulary = list(vocabulary)
+                decoded = dict(zip(vocabulary, self._decode_text(' '.join(vocabulary)).split(' ')))
+                decoded = ' '.join(map(decoded.__getitem__, words))
+        if decoded is None:
+            decoded = self._decode_text(text)
+        if self.frequencies:
+            decoded = self._disambiguate(text, decoded)
+        return decoded
+
+    def _decode_text(self, text):
+        decoded = text.translate(self.table)
+        if self.runs:
+            decoded = self.runs.sub(self._decode_run, decoded)
+        return decoded
+
+    def _decode_run(self, match):
+        run = match.group()
+        try:
+            return self.run_cache[run]
+        except KeyError:
+            if len(self.run_cache) >= RUN_CACHE_SIZE:
+                self.run_cache.clear()
+            tokens = self.pattern.findall(run)
+            decoded = self.run_cache[run] = ''.join(map(self.mapping.get, tokens, tokens))
+            return decoded
+
+    def decode_stream(self, source, destination, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Decodes a text stream chunk by chunk.  Tokens never contain whitespace, so each
+        chunk is cut after its last whitespace character and the rest is carried over.
+        Text without whitespace is cut where no token can span the cut instead, so the
+        carry never grows beyond a chunk.
+
+        :return: The number of characters read.
+        """
+        limit = max(chunk_size, MAX_WORD_LENGTH)
+        carry, total = '', 0
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            total += len(chunk)
+            text = carry + chunk
+            cut = self._cut(text, limit)
+            destination.write(self.decode(text[:cut]))
+            carry = text[cut:]
+        destination.write(self.decode(carry))
+        destination.flush()
+        return total
+
+    def _cut(self, text, limit):
+        # After the last whitespace character, if that leaves at most limit characters
+        if text[-1].isspace():
+            return len(text)
+        cut = len(text) - len(text.rsplit(None, 1)[-1])
+        if len(text) - cut <= limit:
+            return cut
+        # After the last character that cannot be part of a multi-character token
+        cut = len(text.rstrip(self.token_chars))
+        if len(text) - cut <= limit:
+            return cut
+        # Inside one long run, after the last token whose longest match is already known
+        while cut < len(text) - self.longest:
+            cut = self.pattern.match(text, cut).end()
+        return cut
+
+    def _score(self, word):
+        return self.frequencies.get(word.strip(string.punctuation).lower(), 0)
+
+    def _disambiguate(self, text, decoded):
+        # Whitespace always decodes to itself, so both texts split into matching words
+        leet_words = re.split(r'(\s+)', text)
+        words = re.split(r'(\s+)', decoded)
+        for i in range(0, len(words), 2):
+            if words[i] and not self._score(words[i]):
+                candidates = self._readings(leet_words[i])
+                best = max(candidates, key=self._score, default=words[i])
+                if self._score(best):
+                    words[i] = best
+        return ''.join(words)
+
+    def _readings(self, word):
+        # Enumerate alternative readings of one word, longest tokens first
+        readings = []
+
+        def walk(position, prefix):
+            if len(readings) >= self.max_candidates:
+                return
+            if position == len(word):
+                readings.append(''.join(prefix))
+                return
+            node, end, options = self.trie, position, []
+            while end < len(word) and word[end] in node:
+                node = node[word[end]]
+                end += 1
+                if END in node:
+                    options.append((end, self.choices[node[END]]))
+            for end, chars in reversed(options):
+                for char in chars:
+                    prefix.append(char)
+                    walk(end, prefix)
+                    prefix.pop()
+            # The character may also be plain punctuation rather than part of a token
+            prefix.append(word[position])
+            walk(position + 1, prefix)
+            prefix.pop()
+
+        if len(word) <= MAX_WORD_LENGTH:
+            walk(0, [])
+        return readings
+
+
+# Function to decode 1337 speak at the given complexity level
+def decode(text, level, frequencies=None):
+    """
+    Decodes 1337 speak back into English.
+
+    :param text: The 1337 text to be decoded.
+    :param level: Complexity level the text was encoded with (1, 2, 3, or 4).
+    :param frequencies: (Optional) Word frequencies used for disambiguation.
+    :return: The decoded text.
+    """
+    return LeetDecoder(level, frequencies).decode(text)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Translate 1337 speak back into English.')
+    parser.add_argument('input', help="Text file to decode, or '-' for stdin")
+    parser.add_argument('-o', '--output', default='-',
+                        help='File to write the decoded text to (default = stdout)')
+    parser.add_argument('-l', '--level', type=int, required=True, choices=sorted(replacements_by_level),
+                        help='Complexity level the text was encoded with')
+    parser.add_argument('--disambiguate', action='store_true',
+                        help='Re-segment unknown words using word frequencies')
+    parser.add_argument('--dictionary', default=str(FREQUENCY_DICTIONARY),
+                        help='Word frequency dictionary used by --disambiguate')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Characters read per chunk (default={DEFAULT_CHUNK_SIZE})')
+    args = parser.parse_args()
+
+    frequencies = load_frequencies(args.dictionary) if args.disambiguate else None
+    decoder = LeetDecoder(args.level, frequencies)
+    with open_text(args.input, 'r') as source, open_text(args.output, 'w') as destination:
+        decoder.decode_stream(source, destination, args.chunk_size)
@@ -0,0 +1,113 @@
+# 1337 Speak Translator - HTTP Load Test
+#
+# Sends translation requests to a running leet_server.py over keep-alive connections
+# and reports latency percentiles and requests per second.
+#
+# Usage:
+#   python leet_server.py &
+#   python leet_load_test.py --requests 20000 --concurrency 50 --level 3
+#   python leet_load_test.py --batch 100 --distinct 500
+
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+from leet_server import DEFAULT_PORT
+
+
+WORDS = ("the quick brown fox jumps over the lazy dog while five boxing wizards "
+         "jump quickly and my mum packs liquor jugs").split()
+
+
+# Function to build a pool of request texts; fewer distinct texts means more cache hits
+def make_texts(distinct, seed=0):
+    rng = random.Random(seed)
+    return [' '.join(rng.choices(WORDS, k=rng.randint(3, 30))) for _ in range(distinct)]
+
+
+# Function to read one HTTP response and return its status code and body
+async def read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('Server closed the connection')
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    body = await reader.readexactly(length)
+    return int(status_line.split()[1]), body
+
+
+# Function run by each simulated client: send requests back to back on one connection
+async def client(host, port, path, bodies, count, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(count):
+            body = bodies[i % len(bodies)]
+            request = (f"POST {path} HTTP/1.1\r\nHost: {host}\r\n"
+                       f"Content-Length: {len(body)}\r\n\r\n").encode('latin-1') + body
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, _ = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(host, port, level, requests, concurrency, distinct, batch):
+    texts = make_texts(distinct)
+    if batch:
+        path = f"/translate/batch?level={level}"
+        bodies = [json.dumps(texts[i:i + batch]).encode('utf-8') for i in range(0, len(texts), batch)]
+    else:
+        path = f"/translate?level={level}"
+        bodies = [text.encode('utf-8') for text in texts]
+
+    latencies, errors = [], []
+    per_client = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, path, bodies[i::concurrency] or bodies, count, latencies, errors)
+                           for i, count in enumerate(per_client) if count))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    print(f"Requests:    {len(latencies)} ({len(errors)} errors) with {concurrency} connections")
+    print(f"Throughput:  {len(latencies) / elapsed:,.0f} requests/s"
+          + (f" ({len(latencies) * batch / elapsed:,.0f} texts/s)" if batch else ''))
+    print(f"Latency p50: {cuts[49] * 1000:.2f} ms")
+    print(f"Latency p99: {cuts[98] * 1000:.2f} ms")
+
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /stats HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+    _, body = await read_response(reader)
+    writer.close()
+    print(f"Server:      {body.decode('utf-8')}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Load-test a running leet_server.py instance.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--level', type=int, default=2, choices=[1, 2, 3, 4])
+    parser.add_argument('--requests', type=int, default=10000, help='Total number of requests (default=10000)')
+    parser.add_argument('--concurrency', type=int, default=20, help='Number of parallel connections (default=20)')
+    parser.add_argument('--distinct', type=int, default=1000,
+                        help='Number of distinct texts sent; fewer means more cache hits (default=1000)')
+    parser.add_argument('--batch', type=int, default=0,
+                        help='Use the batch endpoint with this many texts per request (default=0, off)')
+    args = parser.parse_args()
+
+    asyncio.run(run(args.host, args.port, args.level, args.requests, args.concurrency, args.distinct, args.batch))
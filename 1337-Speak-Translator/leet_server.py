@@ -0,0 +1,156 @@
+# 1337 Speak Translator - HTTP Service
+#
+# A small asyncio HTTP/1.1 server (standard library only) so other services can call
+# the translator.  Results for repeated inputs come from a bounded LRU cache.
+#
+# Endpoints:
+#   POST /translate?level=3         body: UTF-8 text             -> text/plain translation
+#   POST /translate/batch?level=3   body: JSON list of strings   -> JSON list of translations
+#   GET  /stats                     cache hit/miss statistics    -> JSON
+#
+# Usage:
+#   python leet_server.py --port 8337
+#   curl -X POST --data "hello world" "http://127.0.0.1:8337/translate?level=2"
+
+
+import argparse
+import asyncio
+import functools
+import json
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from leet_speak_translator import translate
+
+
+DEFAULT_PORT = 8337
+CACHE_SIZE = 4096                      # Number of translations kept in the LRU cache
+MAX_CACHED_LENGTH = 64 * 1024          # Longer texts are translated but never cached
+MAX_BODY_SIZE = 16 * 1024 * 1024       # Larger requests are rejected with 413
+
+
+class LeetServer:
+    """
+    Serves translations over HTTP with keep-alive connections.
+
+    :param cache_size: Maximum number of cached translations.
+    :param max_cached_length: Texts longer than this are not cached, which bounds the cache memory.
+    """
+
+    def __init__(self, cache_size=CACHE_SIZE, max_cached_length=MAX_CACHED_LENGTH):
+        self.cached_translate = functools.lru_cache(maxsize=cache_size)(translate)
+        self.max_cached_length = max_cached_length
+
+    def translate(self, text, level):
+        if len(text) > self.max_cached_length:
+            return translate(text, level)
+        return self.cached_translate(text, level)
+
+    def stats(self):
+        info = self.cached_translate.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'cache_hits': info.hits,
+            'cache_misses': info.misses,
+            'cache_hit_rate': round(info.hits / lookups, 4) if lookups else 0.0,
+            'cache_size': info.currsize,
+            'cache_max_size': info.maxsize
+        }
+
+    def route(self, method, target, body):
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+
+        if url.path == '/stats' and method == 'GET':
+            return HTTPStatus.OK, 'application/json', json.dumps(self.stats())
+        if url.path not in ('/translate', '/translate/batch'):
+            return HTTPStatus.NOT_FOUND, 'text/plain', 'Not found'
+        if method != 'POST':
+            return HTTPStatus.METHOD_NOT_ALLOWED, 'text/plain', 'Use POST'
+
+        level = query.get('level', ['1'])[0]
+        if level not in ('1', '2', '3', '4'):
+            return HTTPStatus.BAD_REQUEST, 'text/plain', 'level must be 1, 2, 3, or 4'
+        level = int(level)
+
+        try:
+            text = body.decode('utf-8')
+        except UnicodeDecodeError:
+            return HTTPStatus.BAD_REQUEST, 'text/plain', 'Body must be UTF-8'
+
+        if url.path == '/translate':
+            return HTTPStatus.OK, 'text/plain; charset=utf-8', self.translate(text, level)
+
+        try:
+            texts = json.loads(text)
+        except json.JSONDecodeError:
+            texts = None
+        if not isinstance(texts, list) or not all(isinstance(item, str) for item in texts):
+            return HTTPStatus.BAD_REQUEST, 'text/plain', 'Body must be a JSON list of strings'
+        return HTTPStatus.OK, 'application/json', json.dumps([self.translate(item, level) for item in texts],
+                                                             ensure_ascii=False)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode('latin-1').split(maxsplit=2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY_SIZE:
+                    self.respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'text/plain', 'Body too large', False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, content_type, payload = self.route(method, target, body)
+                keep_alive = (version.strip() == 'HTTP/1.1'
+                              and headers.get('connection', '').lower() != 'close')
+                self.respond(writer, status, content_type, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def respond(writer, status, content_type, payload, keep_alive):
+        body = payload.encode('utf-8')
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+
+
+async def serve(host='127.0.0.1', port=DEFAULT_PORT, cache_size=CACHE_SIZE):
+    service = LeetServer(cache_size)
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"[INFO] Serving 1337 translations on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve the 1337 translator over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default=127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to listen on (default={DEFAULT_PORT})')
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE,
+                        help=f'Number of translations kept in the LRU cache (default={CACHE_SIZE})')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.cache_size))
+    except KeyboardInterrupt:
+        pass
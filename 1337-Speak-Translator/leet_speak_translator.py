@@ -0,0 +1,498 @@
+# 1337 Speak Translator
+# Author:  Joshua Paul Barnard
+# Date: January 29th, 2024
+
+# This is my 1337 speak translator.  There are many like it, but this one is mine.
+# There are many different ways to use 1337 speak, and some letters can have tens of variations.
+# I created this translator to be able to quickly convert text into my style of 1337.
+#
+# Usage:
+#   python leet_speak_translator.py                         # interactive prompts
+#   python leet_speak_translator.py book.txt -l 2 -o out.txt
+#   cat dump.txt | python leet_speak_translator.py - -l 3 > dump.1337
+#   python leet_speak_translator.py corpus/ -l 2 -o corpus-1337/ --workers 8
+
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Function to replace characters
+def replace_chars(input_string, replacements):
+    modified_string = ""
+    for char in input_string:
+        modified_string += replacements.get(char, char)
+    return modified_string
+
+# Define the characters to be replaced, with complexity == 1 (basic 1337).
+replacements_basic = {
+    'a' : '4',
+    'A' : '4',
+    'e' : '3',
+    'E' : '3',
+    'i' : '1',
+    'I' : '1',
+    'l' : '|',
+    'L' : '|',
+    'o' : '0',
+    'O' : '0'
+}
+
+# Define the characters to be replaced, with complexity == 2 (intermediate 1337).
+replacements_intermediate = {
+    '1' : 'i',
+    '2' : 'Z',
+    '3' : 'E',
+    '4' : 'A',
+    '5' : 'S',
+    '6' : 'b',
+    '7' : 'T',
+    '8' : 'B',
+    '9' : 'q',
+    '0' : 'o',
+    'a': '/-\\',
+    'A': '/-\\',
+    'b': '8',
+    'B': '8',
+    'c': '(',
+    'C': '(',
+    'd': '[)',
+    'D': '[)',
+    'e': '3',
+    'E': '3',
+    'f': '|=',
+    'F': '|=',
+    'g': '6',
+    'G': '6',
+    'h': '|-|',
+    'H': '|-|',
+    'i': '1',
+    'I': '1',
+    'j': '_|',
+    'J': '_|',
+    'k': '|<',
+    'K': '|<',
+    'l': '|_',
+    'L': '|_',
+    'm': '/\\/\\',
+    'M': '/\\/\\',
+    'n': '/\\/',
+    'N': '/\\/',
+    'o': '0',
+    'O': '0',
+    'p': '|>',
+    'P': '|>',
+    'q': '(,)',
+    'Q': '(,)',
+    'r': '|2',
+    'R': '|2',
+    's': '5',
+    'S': '5',
+    't': '7',
+    'T': '7',
+    'u': '|_|',
+    'U': '|_|',
+    'v': '\\/',
+    'V': '\\/',
+    'w': '\\/\\/',
+    'W': '\\/\\/',
+    'x': '><',
+    'X': '><',
+    'y': '`/',
+    'Y': '`/',
+    'z': '-/_',
+    'Z': '-/_'
+}
+
+# Define the characters to be replaced, with complexity == 3 (advanced 1337).
+replacements_advanced = {
+    '1' : 'i',
+    '2' : 'Z',
+    '3' : 'E',
+    '4' : 'A',
+    '5' : 'S',
+    '6' : 'b',
+    '7' : 'T',
+    '8' : 'B',
+    '9' : 'q',
+    '0' : 'o',
+    'a': '@',
+    'A': '/-\\',
+    'b': '6',
+    'B': '|3',
+    'c': '©',
+    'C': '¢',
+    'd': 'ꞇ|',
+    'D': '[)',
+    'e': 'ë',
+    'E': '[-',
+    'f': 'ƒ',
+    'F': '|=',
+    'g': '9',
+    'G': '(_+',
+    'h': 'ר|',
+    'H': ']-[',
+    'i': '1',
+    'I': '][',
+    'j': '_|',
+    'J': '_]',
+    'k': '|<',
+    'K': '|{',
+    'l': '|',
+    'L': '|_',
+    'm': '^^',
+    'M': '|\\/|',
+    'n': '^/',
+    'N': '|\\|',
+    'o': '0',
+    'O': '()',
+    'p': '|*',
+    'P': '|°',
+    'q': '9',
+    'Q': '(_,)',
+    'r': '®',
+    'R': '®',
+    's': '$',
+    'S': '5',
+    't': '-|-',
+    'T': '7',
+    'u': '(_)',
+    'U': '|_|',
+    'v': '|/',
+    'V': '\/',
+    'w': '\\^/',
+    'W': '\\/\\/',
+    'x': '><',
+    'X': '}{',
+    'y': '`/',
+    'Y': '\|/',
+    'z': '%',
+    'Z': '%'
+}
+
+# Define the characters to be replaced, with complexity == 4 (ultra 1337).
+replacements_ultra = {
+    '1' : 'i',
+    '2' : 'Z',
+    '3' : 'E',
+    '4' : 'A',
+    '5' : 'S',
+    '6' : 'b',
+    '7' : 'T',
+    '8' : 'B',
+    '9' : 'q',
+    '0' : 'o',
+    'a': '',
+    'A': '',
+    'b': '',
+    'B': '',
+    'c': '',
+    'C': '',
+    'd': '',
+    'D': '',
+    'e': '',
+    'E': '',
+    'f': '',
+    'F': '',
+    'g': '',
+    'G': '',
+    'h': '',
+    'H': '',
+    'i': '',
+    'I': '',
+    'j': '',
+    'J': '',
+    'k': '',
+    'K': '',
+    'l': '',
+    'L': '',
+    'm': '',
+    'M': '',
+    'n': '',
+    'N': '',
+    'o': '',
+    'O': '',
+    'p': '',
+    'P': '',
+    'q': '',
+    'Q': '',
+    'r': '',
+    'R': '',
+    's': '',
+    'S': '',
+    't': '',
+    'T': '',
+    'u': '',
+    'U': '',
+    'v': '',
+    'V': '',
+    'w': '',
+    'W': '',
+    'x': '',
+    'X': '',
+    'y': '',
+    'Y': '',
+    'z': '',
+    'Z': ''
+}
+
+
+# Map each complexity level to its replacement dictionary.
+replacements_by_level = {
+    1: replacements_basic,
+    2: replacements_intermediate,
+    3: replacements_advanced,
+    4: replacements_ultra
+}
+
+# Compile each dictionary once into a translation table for str.translate(),
+# so whole documents are converted in a single pass instead of one character at a time.
+translation_tables = {
+    level: str.maketrans(replacements)
+    for level, replacements in replacements_by_level.items()
+}
+
+
+# Number of characters read per chunk when streaming files or stdin.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Number of bytes handed to each worker process per chunk with --workers.
+DEFAULT_PARALLEL_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+# Function to look up the translation table for a complexity level
+def get_translation_table(level):
+    try:
+        return translation_tables[int(level)]
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid complexity level: {level!r} (expected 1, 2, 3, or 4).") from None
+
+
+# Function to translate text into 1337 at the given complexity level
+def translate(text, level):
+    """
+    Translates English text into 1337 speak using the precompiled translation tables.
+
+    :param text: The text to be translated.
+    :param level: Complexity level (1 is basic, 2 is intermediate, 3 is advanced, and 4 is ultra).
+    :return: The translated text.
+    """
+    return text.translate(get_translation_table(level))
+
+
+# Function to translate a text stream chunk by chunk
+def translate_stream(source, destination, level, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Translates everything read from source and writes it to destination incrementally,
+    so memory use is bounded by chunk_size no matter how large the input is.
+
+    Every character is replaced on its own, so a chunk boundary can never split a
+    multi-character replacement such as '/\\/\\' for 'm'.
+
+    :param source: Readable text stream (a file opened in text mode, or sys.stdin).
+    :param destination: Writable text stream (a file opened in text mode, or sys.stdout).
+    :param level: Complexity level (1 is basic, 2 is intermediate, 3 is advanced, and 4 is ultra).
+    :param chunk_size: Number of characters read per chunk.
+    :return: The number of characters read.
+    """
+    table = get_translation_table(level)
+    total = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        destination.write(chunk.translate(table))
+        total += len(chunk)
+    destination.flush()
+    return total
+
+
+# Function to open a path for streaming, where '-' means stdin or stdout
+def open_text(path, mode):
+    if path == '-':
+        return contextlib.nullcontext(sys.stdin if mode == 'r' else sys.stdout)
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+# Function to translate a file (or stdin) into another file (or stdout)
+def translate_file(input_path, output_path, level, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Translates input_path into output_path in fixed-size chunks.
+
+    :param input_path: Path of the text file to translate, or '-' for stdin.
+    :param output_path: Path of the file to write, or '-' for stdout.
+    :param level: Complexity level (1 is basic, 2 is intermediate, 3 is advanced, and 4 is ultra).
+    :param chunk_size: Number of characters read per chunk.
+    :return: The number of characters read.
+    """
+    with open_text(input_path, 'r') as source, open_text(output_path, 'w') as destination:
+        return translate_stream(source, destination, level, chunk_size)
+
+
+# Function to split a UTF-8 file into byte ranges that never cut a character in half
+def split_file(path, chunk_size=DEFAULT_PARALLEL_CHUNK_SIZE):
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        start = 0
+        while start < size:
+            end = min(start + chunk_size, size)
+            f.seek(end)
+            # Move the boundary past any UTF-8 continuation bytes (0b10xxxxxx)
+            while end < size and f.read(1)[0] & 0xC0 == 0x80:
+                end += 1
+            yield start, end
+            start = end
+
+
+# Function run inside each worker process to translate one byte range of a file
+def _translate_range(path, start, end, level):
+    began = time.perf_counter()
+    with open(path, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+    translated = text.translate(translation_tables[level])
+    return translated, os.getpid(), end - start, time.perf_counter() - began
+
+
+# Function to translate a large file, or a directory of files, across a process pool
+def translate_parallel(input_path, output_path, level, workers, chunk_size=DEFAULT_PARALLEL_CHUNK_SIZE):
+    """
+    Splits the input into chunks, translates them in parallel and writes the results
+    back in their original order. Only a couple of chunks per worker are in flight at
+    any time, so memory stays bounded. Throughput per worker is reported on stderr.
+
+    :param input_path: Text file to translate, or a directory whose files are all translated.
+    :param output_path: File to write ('-' for stdout), or a directory when input_path is one.
+    :param level: Complexity level (1 is basic, 2 is intermediate, 3 is advanced, and 4 is ultra).
+    :param workers: Number of worker processes.
+    :param chunk_size: Number of bytes translated per task.
+    :return: Dictionary of per-worker statistics keyed by process id.
+    """
+    level = int(level)
+    get_translation_table(level)
+
+    if os.path.isdir(input_path):
+        names = sorted(name for name in os.listdir(input_path)
+                       if os.path.isfile(os.path.join(input_path, name)))
+        os.makedirs(output_path, exist_ok=True)
+        jobs = [(os.path.join(input_path, name), os.path.join(output_path, name)) for name in names]
+    else:
+        jobs = [(input_path, output_path)]
+
+    tasks = ((index, path, start, end)
+             for index, (path, _) in enumerate(jobs)
+             for start, end in split_file(path, chunk_size))
+
+    stats = {}
+    destination, current = None, -1
+
+    # Write results strictly in order, opening each output file as its first chunk arrives
+    def write_result(index, future):
+        nonlocal destination, current
+        translated, pid, size, seconds = future.result()
+        while current < index:
+            if destination not in (None, sys.stdout):
+                destination.close()
+            current += 1
+            out_path = jobs[current][1]
+            destination = sys.stdout if out_path == '-' else open(out_path, 'w', encoding='utf-8', newline='')
+        destination.write(translated)
+        worker = stats.setdefault(pid, {'chunks': 0, 'bytes': 0, 'seconds': 0.0})
+        worker['chunks'] += 1
+        worker['bytes'] += size
+        worker['seconds'] += seconds
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for index, path, start, end in tasks:
+            pending.append((index, pool.submit(_translate_range, path, start, end, level)))
+            if len(pending) >= workers * 2:
+                write_result(*pending.popleft())
+        while pending:
+            write_result(*pending.popleft())
+
+    # Create outputs for any trailing empty files, then close the last one
+    while current < len(jobs) - 1:
+        if destination not in (None, sys.stdout):
+            destination.close()
+        current += 1
+        destination = open(jobs[current][1], 'w', encoding='utf-8', newline='')
+    if destination is sys.stdout:
+        destination.flush()
+    elif destination is not None:
+        destination.close()
+    elapsed = time.perf_counter() - started
+
+    megabyte = 1024 * 1024
+    for pid, worker in sorted(stats.items()):
+        rate = worker['bytes'] / megabyte / max(worker['seconds'], 1e-9)
+        print(f"[INFO] Worker {pid}: {worker['chunks']} chunks, {worker['bytes'] / megabyte:.1f} MB "
+              f"in {worker['seconds']:.2f}s ({rate:.1f} MB/s)", file=sys.stderr)
+    total = sum(worker['bytes'] for worker in stats.values())
+    print(f"[DONE] {total / megabyte:.1f} MB from {len(jobs)} file(s) in {elapsed:.2f}s with {workers} workers "
+          f"({total / megabyte / max(elapsed, 1e-9):.1f} MB/s)", file=sys.stderr)
+    return stats
+
+
+# Function to run the original interactive prompts
+def interactive():
+    # Request input for the degree of complexity of 1337 speak.
+    complexity_level = input("Enter the level of complexity (1 is basic, 2 is intermediate, 3 is advanced, and 4 is ultra): ")
+
+    # Check if the user inputted a valid number for complexity level.
+    if complexity_level.isdigit():
+        # Convert the input to an integer.
+        number = int(complexity_level)
+        # Check if the input is within the valid range.
+        if number in [1, 2, 3, 4]:
+            print(" ")
+        else:
+            print("Input is not within the valid range.")
+    else:
+        print("Input is not a valid number.")
+
+    # Request input for the english words to be converted.
+    original_input = input("Enter your English to be translated to 1337: ")
+
+    # Perform replacement based on the chosen dictionary.
+    if complexity_level in ['1', '2', '3', '4']:
+        leet_speak = translate(original_input, complexity_level)
+        print(leet_speak)
+    else:
+        print("Error:  Could not modify original input.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Translate English text into 1337 speak.')
+    parser.add_argument('input', nargs='?',
+                        help="Text file or directory to translate, or '-' for stdin (default = interactive prompts)")
+    parser.add_argument('-o', '--output', default='-',
+                        help='File (or directory, for a directory input) to write the translation to (default = stdout)')
+    parser.add_argument('-l', '--level', type=int, choices=sorted(translation_tables),
+                        help='1 is basic, 2 is intermediate, 3 is advanced, and 4 is ultra')
+    parser.add_argument('--chunk-size', type=int,
+                        help=f'Characters read per chunk (default={DEFAULT_CHUNK_SIZE}), '
+                             f'or bytes per task with --workers (default={DEFAULT_PARALLEL_CHUNK_SIZE})')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Translate in parallel with this many worker processes (default=1)')
+    args = parser.parse_args()
+
+    if args.input is None:
+        interactive()
+    elif args.level is None:
+        parser.error('--level is required when translating a file or stdin')
+    elif args.workers > 1 or os.path.isdir(args.input):
+        if args.input == '-':
+            parser.error('--workers needs a file or directory, not stdin')
+        if os.path.isdir(args.input) and args.output == '-':
+            parser.error('--output must be a directory when translating a directory')
+        translate_parallel(args.input, args.output, args.level, max(args.workers, 1),
+                           args.chunk_size or DEFAULT_PARALLEL_CHUNK_SIZE)
+    else:
+        translate_file(args.input, args.output, args.level, args.chunk_size or DEFAULT_CHUNK_SIZE)
@@ -0,0 +1,222 @@
+# 1337 Speak Variants
+#
+# Some letters can have tens of variations in 1337, but each complexity table maps a
+# character to exactly one output.  This module gives every character a weighted list
+# of variants, built from the basic, intermediate and advanced tables plus the extra
+# spellings in the References folder, and generates many distinct leet variants of a
+# text in batches.
+#
+# Variant choices are drawn for a whole batch at once: with NumPy installed, every
+# character's cumulative weights are flattened into one sorted array and a single
+# searchsorted() call picks the variant for every position of every output.  Without
+# NumPy, random.choices() picks one column of the batch at a time.  Both are seeded,
+# so the same seed always gives the same variants (on the same code path).
+#
+# Usage:
+#   python leet_variants.py "hello world" -n 10 --seed 42
+#   python leet_variants.py "password" -n 1000000 -o variants.txt
+
+
+import argparse
+import itertools
+import math
+import random
+import sys
+import time
+
+from leet_speak_translator import replacements_advanced, replacements_basic, replacements_intermediate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Weight given to the output of each complexity table.
+level_weights = [
+    (replacements_basic, 3),
+    (replacements_intermediate, 2),
+    (replacements_advanced, 2)
+]
+
+# Extra spellings for each letter, each with a weight of 1 (applied to both cases).
+extra_variants = {
+    'a': ['4', '/\\', '@', '^', 'Д'],
+    'b': ['|3', '8', '13', 'ß'],
+    'c': ['(', '[', '<', '{', '©'],
+    'd': ['|)', '|]', '[)', 'cl'],
+    'e': ['3', '&', '€', '[-'],
+    'f': ['|=', '|#', 'ph', 'ƒ'],
+    'g': ['6', '9', '&', '(_+', 'C-'],
+    'h': ['#', '|-|', '}{', '/-/', ']-['],
+    'i': ['1', '!', '|', ']['],
+    'j': ['_|', ',_|', '_)'],
+    'k': ['|<', '|{', '|X'],
+    'l': ['1', '|', '£', '|_'],
+    'm': ['|\\/|', '/\\/\\', '(V)', '^^'],
+    'n': ['|\\|', '/\\/', '^/'],
+    'o': ['0', '()', '[]', '<>'],
+    'p': ['|*', '|o', '|>', '|"'],
+    'q': ['0_', '(,)', '9'],
+    'r': ['|2', '12', '|?', '®'],
+    's': ['5', '$', 'z'],
+    't': ['7', '+', '-|-', "']['"],
+    'u': ['|_|', '(_)', 'µ'],
+    'v': ['\\/', '|/'],
+    'w': ['\\/\\/', 'vv', '\\^/', '\\|/'],
+    'x': ['><', '}{', ')('],
+    'y': ['`/', 'j', '¥'],
+    'z': ['2', '7_', '%']
+}
+
+
+# Function to merge the complexity tables and extra spellings into weighted variants
+def build_variant_replacements():
+    variants = {}
+    characters = dict.fromkeys(itertools.chain(*(table for table, _ in level_weights)))
+    for char in characters:
+        weights = variants.setdefault(char, {})
+        for table, weight in level_weights:
+            # A table that leaves the character alone contributes the character itself
+            output = table.get(char, char)
+            if output:
+                weights[output] = weights.get(output, 0) + weight
+    for letter, outputs in extra_variants.items():
+        for char in (letter, letter.upper()):
+            weights = variants.setdefault(char, {})
+            for output in outputs:
+                weights[output] = weights.get(output, 0) + 1
+    return {char: list(weights.items()) for char, weights in variants.items()}
+
+
+# Weighted variants for each character: {char: [(variant, weight), ...]}.
+variant_replacements = build_variant_replacements()
+
+
+class VariantGenerator:
+    """
+    Samples weighted leet variants of a text in batches.
+
+    :param variants: Dictionary of {char: [(variant, weight), ...]}.
+    :param seed: (Optional) Seed for reproducible results.
+    :param use_numpy: Use the NumPy sampler when NumPy is installed.
+    """
+
+    def __init__(self, variants=variant_replacements, seed=None, use_numpy=True):
+        self.variants = {char: [output for output, _ in options] for char, options in variants.items()}
+        self.cumulative = {}
+        for char, options in variants.items():
+            total = float(sum(weight for _, weight in options))
+            running, bounds = 0.0, []
+            for _, weight in options:
+                running += weight
+                bounds.append(running / total)
+            bounds[-1] = 1.0
+            self.cumulative[char] = bounds
+
+        self.use_numpy = use_numpy and np is not None
+        if self.use_numpy:
+            self.rng = np.random.default_rng(seed)
+            # Flattened table: char number i owns the bounds i + c for its cumulative weights c,
+            # so searchsorted(bounds, i + u) lands on the variant chosen by u in [0, 1)
+            self.codes = {char: i for i, char in enumerate(self.variants)}
+            self.flat = np.array([output for options in self.variants.values() for output in options],
+                                 dtype=object)
+            self.bounds = np.array([self.codes[char] + bound
+                                    for char in self.variants for bound in self.cumulative[char]])
+        else:
+            self.rng = random.Random(seed)
+
+    def combinations(self, text):
+        """Returns how many different variants of text exist."""
+        return math.prod(len(self.variants.get(char, [char])) for char in text)
+
+    def sample(self, text, count):
+        """Returns count randomly chosen variants of text (duplicates possible)."""
+        columns = [i for i, char in enumerate(text) if char in self.variants]
+        if not columns or count <= 0:
+            return [text] * max(count, 0)
+        if self.use_numpy:
+            return self._sample_numpy(text, columns, count)
+        return self._sample_python(text, columns, count)
+
+    def _sample_numpy(self, text, columns, count):
+        codes = np.array([self.codes[text[i]] for i in columns], dtype=np.float64)
+        picks = np.searchsorted(self.bounds, codes + self.rng.random((count, len(columns))), side='right')
+        pieces = [[char] * count for char in text]
+        for i, column in zip(columns, self.flat[picks].T.tolist()):
+            pieces[i] = column
+        return list(map(''.join, zip(*pieces)))
+
+    def _sample_python(self, text, columns, count):
+        pieces = [[char] * count for char in text]
+        for i in columns:
+            char = text[i]
+            pieces[i] = self.rng.choices(self.variants[char], cum_weights=self.cumulative[char], k=count)
+        return list(map(''.join, zip(*pieces)))
+
+    def iter_variants(self, text, count, distinct=True, batch_size=65536):
+        """
+        Yields count variants of text.  With distinct=True no variant is repeated, and
+        the count is capped at the number of variants that exist.
+        """
+        if not distinct:
+            while count > 0:
+                batch = min(count, batch_size)
+                yield from self.sample(text, batch)
+                count -= batch
+            return
+
+        total = self.combinations(text)
+        if total <= count:
+            # Every variant is needed, so list them all instead of sampling
+            yield from (''.join(pieces) for pieces in itertools.product(
+                *(self.variants.get(char, [char]) for char in text)))
+            return
+
+        seen = set()
+        while len(seen) < count:
+            for variant in self.sample(text, min(batch_size, 2 * (count - len(seen)))):
+                if variant not in seen:
+                    seen.add(variant)
+                    yield variant
+                    if len(seen) == count:
+                        return
+
+
+# Function to generate a list of leet variants of a text
+def generate_variants(text, count, seed=None, distinct=True):
+    """
+    Generates leet variants of a text using the weighted variant table.
+
+    :param text: The text to be translated.
+    :param count: Number of variants to generate.
+    :param seed: (Optional) Seed for reproducible results.
+    :param distinct: If True, never return the same variant twice.
+    :return: List of variants.
+    """
+    return list(VariantGenerator(seed=seed).iter_variants(text, count, distinct))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generate many weighted 1337 variants of a text.')
+    parser.add_argument('text', help='English text to generate variants of')
+    parser.add_argument('-n', '--count', type=int, default=10, help='Number of variants (default=10)')
+    parser.add_argument('--seed', type=int, help='Seed for reproducible results')
+    parser.add_argument('--allow-duplicates', action='store_true',
+                        help='Skip the distinctness check (faster for very large counts)')
+    parser.add_argument('-o', '--output', help='File to write the variants to (default = stdout)')
+    args = parser.parse_args()
+
+    generator = VariantGenerator(seed=args.seed)
+    start = time.perf_counter()
+    destination = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    produced = 0
+    for variant in generator.iter_variants(args.text, args.count, not args.allow_duplicates):
+        destination.write(variant + '\n')
+        produced += 1
+    if destination is not sys.stdout:
+        destination.close()
+    elapsed = time.perf_counter() - start
+    print(f"[DONE] {produced} variants in {elapsed:.2f}s ({produced / max(elapsed, 1e-9) * 60:,.0f} per minute)",
+          file=sys.stderr)
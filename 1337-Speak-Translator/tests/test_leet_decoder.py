@@ -0,0 +1,75 @@
+import io
+import random
+import re
+
+import pytest
+
+from leet_decoder import MAX_WORD_LENGTH, LeetDecoder, trie_to_regex
+from leet_speak_translator import replacements_by_level, translate
+
+
+# Function to decode token by token, as one regular expression match per character
+def decode_tokens(decoder, text):
+    tokens = re.findall(trie_to_regex(decoder.trie) + '|.', text, re.DOTALL)
+    return ''.join(map(decoder.mapping.get, tokens, tokens))
+
+
+# Function to generate text that mixes 1337 tokens, their characters and whitespace
+def mixed_text(level, length, whitespace=True, seed=0):
+    rng = random.Random(seed)
+    pieces = list(LeetDecoder(level).mapping) + list("abcxyz.,!'é")
+    if whitespace:
+        pieces += [' ', ' ', '\n']
+    return ''.join(rng.choice(pieces) for _ in range(length))
+
+
+@pytest.mark.parametrize("level", sorted(replacements_by_level))
+def test_decode_matches_token_by_token_decoding(level):
+    decoder = LeetDecoder(level)
+    text = mixed_text(level, 5000)
+    assert decoder.decode(text) == decode_tokens(decoder, text)
+    # Decoded runs are cached, so a second pass must give the same result
+    assert decoder.decode(text) == decode_tokens(decoder, text)
+
+
+def test_decode_disambiguates_unknown_words():
+    decoder = LeetDecoder(2, frequencies={'hello': 100})
+    assert decoder.decode(translate("hello\nhello there", 2)) == "hello\nhello there"
+
+
+@pytest.mark.parametrize("whitespace", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+@pytest.mark.parametrize("level", [2, 3])
+def test_decode_stream_matches_decode(level, chunk_size, whitespace):
+    decoder = LeetDecoder(level)
+    text = mixed_text(level, 3000, whitespace)
+    destination = io.StringIO()
+    assert decoder.decode_stream(io.StringIO(text), destination, chunk_size) == len(text)
+    assert destination.getvalue() == decoder.decode(text)
+
+
+class RecordingWriter(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.sizes = []
+
+    def write(self, text):
+        self.sizes.append(len(text))
+        return super().write(text)
+
+
+def test_decode_stream_does_not_carry_text_without_whitespace():
+    decoder = LeetDecoder(2)
+    text = '|_' * 50000
+    destination = RecordingWriter()
+    decoder.decode_stream(io.StringIO(text), destination, 256)
+    assert destination.getvalue() == decoder.decode(text)
+    # Every chunk is flushed as it is read instead of all at the end
+    assert max(destination.sizes) <= 2 * max(256, MAX_WORD_LENGTH)
+
+
+@pytest.mark.parametrize("level", sorted(replacements_by_level))
+def test_decode_repetitive_text_word_by_word(level):
+    decoder = LeetDecoder(level)
+    text = ' '.join([mixed_text(level, 300, seed=1)] * 20)
+    assert decoder.decode(text) == decode_tokens(decoder, text)
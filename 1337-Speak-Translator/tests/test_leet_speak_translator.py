@@ -0,0 +1,47 @@
+import io
+import string
+
+import pytest
+
+from leet_speak_translator import (replace_chars, replacements_by_level, split_file, translate, translate_parallel,
+                                   translate_stream)
+
+SAMPLE = string.printable + "Ünïcödé – ‘quotes’ and emoji 🙂\n" * 3
+
+
+@pytest.mark.parametrize("level", sorted(replacements_by_level))
+def test_translate_matches_replace_chars(level):
+    assert translate(SAMPLE, level) == replace_chars(SAMPLE, replacements_by_level[level])
+
+
+def test_translate_rejects_unknown_level():
+    with pytest.raises(ValueError):
+        translate("hello", 5)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_translate_stream_matches_translate(chunk_size):
+    destination = io.StringIO()
+    read = translate_stream(io.StringIO(SAMPLE), destination, 4, chunk_size)
+    assert read == len(SAMPLE)
+    assert destination.getvalue() == translate(SAMPLE, 4)
+
+
+def test_split_file_never_cuts_a_character(tmp_path):
+    path = tmp_path / "in.txt"
+    path.write_text(SAMPLE, encoding="utf-8", newline="")
+    data = path.read_bytes()
+    ranges = list(split_file(str(path), chunk_size=5))
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert "".join(data[start:end].decode("utf-8") for start, end in ranges) == SAMPLE
+
+
+def test_translate_parallel_matches_translate(tmp_path):
+    source, output = tmp_path / "in", tmp_path / "out"
+    source.mkdir()
+    texts = {"a.txt": SAMPLE * 20, "b.txt": "", "c.txt": "Hello World\n"}
+    for name, text in texts.items():
+        (source / name).write_text(text, encoding="utf-8", newline="")
+    translate_parallel(str(source), str(output), 3, workers=2, chunk_size=64)
+    for name, text in texts.items():
+        assert (output / name).read_bytes().decode("utf-8") == translate(text, 3)
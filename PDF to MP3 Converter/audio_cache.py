@@ -0,0 +1,65 @@
+# Content-addressed cache of synthesized audio chunks
+#
+# Every chunk's MP3 segment is stored under the SHA-256 of (chunk text, voice,
+# synthesizer settings such as rate and pitch).  When a book is re-converted after
+# a few corrections, only the chunks whose text changed are synthesized again and
+# the rest are read back from disk.  The cache is bounded by total size: the least
+# recently used segments (by file mtime, refreshed on every hit) are evicted first.
+
+import hashlib, json, os
+from pathlib import Path
+
+CACHE_DIR = '.audio_cache'
+MAX_BYTES = 2 * 1024 ** 3   # 2 GB
+
+def chunk_key(text: str, voice: str, settings: dict) -> str:
+    blob = json.dumps({'text': text, 'voice': voice, 'settings': settings}, sort_keys=True)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+class AudioChunkCache:
+    def __init__(self, directory: Path, max_bytes: int = MAX_BYTES):
+        self.directory, self.max_bytes = Path(directory), max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.total_bytes = sum(p.stat().st_size for p in self.directory.glob('*/*.mp3'))
+        self.hits = self.misses = self.evictions = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.mp3"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            audio = path.read_bytes()
+            os.utime(path)      # Mark as recently used
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return audio
+
+    def put(self, key: str, audio: bytes):
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(audio)
+        os.replace(tmp, path)
+        self.total_bytes += len(audio)
+
+    def evict(self):
+        """Deletes least recently used segments until the cache fits in max_bytes."""
+        if self.total_bytes <= self.max_bytes:
+            return
+        entries = []
+        for path in self.directory.glob('*/*.mp3'):
+            st = path.stat()
+            entries.append((st.st_mtime_ns, st.st_size, path))
+        self.total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if self.total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
@@ -0,0 +1,163 @@
+"""
+============================================================================
+PDF Text Pipeline Benchmarks
+============================================================================
+
+corrections: Applies N spelling corrections to a generated text, once with
+             the original per-word re.sub() loop and once with the
+             single-pass spell_rewrite.apply_corrections(), and checks that
+             both produce the same text.
+clean:       Cleans generated PDF-like text (hyphenated line breaks, hard
+             line breaks, runs of spaces) at several sizes, once with the
+             original three re.sub() passes and once with the fused
+             single-pass cleaner from pdf_batch_cleaner, and checks that
+             both produce the same text.
+
+Usage:
+    python benchmark_text.py                          # all benchmarks
+    python benchmark_text.py corrections --size 5MB --corrections 5000
+    python benchmark_text.py clean --sizes 1MB,20MB,100MB
+
+"""
+
+
+import argparse
+import random
+import re
+import string
+import time
+
+from pdf_batch_cleaner import clean_text
+from spell_rewrite import apply_corrections
+
+
+UNITS = {'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+def parse_size(size):
+    size = size.strip().upper()
+    for unit, factor in UNITS.items():
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * factor)
+    return int(size)
+
+
+def make_corrections(count, rng):
+    """Returns {misspelling: word}; words use a-p and misspellings add a 'z', so no
+    replacement can itself be corrected again and both methods must agree."""
+    letters = string.ascii_lowercase[:16]
+    corrections = {}
+    while len(corrections) < count:
+        word = ''.join(rng.choices(letters, k=rng.randint(4, 12)))
+        cut = rng.randint(1, len(word) - 1)
+        corrections[word[:cut] + 'z' + word[cut:]] = word
+    return corrections
+
+
+def make_text(length, corrections, rng, error_rate=0.05):
+    """Builds a text of about `length` characters where error_rate of the words are misspelled."""
+    misspelled, correct = list(corrections), list(corrections.values())
+    words, size = [], 0
+    while size < length:
+        word = rng.choice(misspelled) if rng.random() < error_rate else rng.choice(correct)
+        words.append(word + rng.choice(('', '', '', ',', '.', '.\n')))
+        size += len(words[-1]) + 1
+    return ' '.join(words)
+
+
+def per_word_sub(text, corrections):
+    """The rewrite the spell-check functions used before spell_rewrite."""
+    for wrong, right in corrections.items():
+        text = re.sub(rf"\b{re.escape(wrong)}\b", right, text)
+    return text
+
+
+def make_pdf_text(length, rng, line_length=72):
+    """Builds text shaped like PDF extraction output: hard line breaks every line,
+    some hyphenated or followed by indentation, and the odd run of spaces."""
+    words = ['the', 'quick', 'brown', 'fox', 'extraordinary', 'consciousness',
+             'meditation', 'and', 'of', 'a', 'universal', 'mind']
+    parts, size, line = [], 0, 0
+    while size < length:
+        word = rng.choice(words)
+        line += len(word) + 1
+        if line > line_length:
+            line = 0
+            roll = rng.random()
+            separator = '-\n' if roll < 0.1 else '\n   ' if roll < 0.2 else '\n'
+        else:
+            separator = '  ' if rng.random() < 0.01 else ' '
+        parts += (word, separator)
+        size += len(word) + len(separator)
+    return ''.join(parts)
+
+
+HYPHEN_BREAK = re.compile(r"([A-Za-z])-\n([a-z])")
+MULTI_SPACE = re.compile(r" {2,}")
+LINE_END_HARD = re.compile(r"\s*\n\s+")
+
+
+def three_passes(raw):
+    """pdf_batch_cleaner.clean_text() before the fused cleaner."""
+    fixes = {}
+    txt = HYPHEN_BREAK.sub(lambda m: m.group(1) + m.group(2), raw)
+    if txt != raw:
+        fixes['hyphen_join'] = 1
+    txt2 = MULTI_SPACE.sub(' ', txt)
+    if txt2 != txt:
+        fixes['multispace'] = 1
+    txt3 = LINE_END_HARD.sub(' ', txt2)
+    if txt3 != txt2:
+        fixes['linebreak_merge'] = 1
+    return txt3, fixes
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def bench_corrections(size, count, seed):
+    rng = random.Random(seed)
+    corrections = make_corrections(count, rng)
+    text = make_text(size, corrections, rng)
+    megabytes = len(text) / UNITS['MB']
+    print(f"{megabytes:.1f} MB of text, {len(corrections)} corrections")
+
+    single, single_seconds = time_call(apply_corrections, text, corrections)
+    print(f"  single pass    {single_seconds:>9.3f} s  {megabytes / max(single_seconds, 1e-9):>8.1f} MB/s")
+    loop, loop_seconds = time_call(per_word_sub, text, corrections)
+    print(f"  per-word loop  {loop_seconds:>9.3f} s  {megabytes / max(loop_seconds, 1e-9):>8.1f} MB/s")
+    print(f"  speed-up       {loop_seconds / max(single_seconds, 1e-9):>9.1f}x, "
+          f"identical output: {single == loop}")
+
+
+def bench_clean(sizes, seed):
+    rng = random.Random(seed)
+    print(f"{'size':>8} {'3 passes (s)':>13} {'fused (s)':>10} {'fused MB/s':>11} {'speed-up':>9}  fixes")
+    for size_label in sizes:
+        text = make_pdf_text(parse_size(size_label), rng)
+        megabytes = len(text) / UNITS['MB']
+        (passes, _), passes_seconds = time_call(three_passes, text)
+        (fused, fixes), fused_seconds = time_call(clean_text, text)
+        assert fused == passes, 'fused cleaner output differs from the three passes'
+        print(f"{size_label.strip():>8} {passes_seconds:>13.3f} {fused_seconds:>10.3f} "
+              f"{megabytes / max(fused_seconds, 1e-9):>11.1f} {passes_seconds / max(fused_seconds, 1e-9):>8.1f}x  {fixes}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks for the PDF text pipeline.")
+    parser.add_argument('bench', nargs='?', default='all', choices=['all', 'corrections', 'clean'])
+    parser.add_argument('--size', default='5MB', help='Generated text size for corrections (default = 5MB)')
+    parser.add_argument('--sizes', default='1MB,20MB,100MB',
+                        help='Comma separated text sizes for clean (default = 1MB,20MB,100MB)')
+    parser.add_argument('--corrections', type=int, default=5000,
+                        help='Number of distinct corrections (default = 5000)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.bench in ('all', 'corrections'):
+        bench_corrections(parse_size(args.size), args.corrections, args.seed)
+    if args.bench in ('all', 'clean'):
+        bench_clean(args.sizes.split(','), args.seed)
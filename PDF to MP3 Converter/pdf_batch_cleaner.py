@@ -1,46 +1,50 @@
-import argparse, json, re, datetime
+import argparse, json, re, datetime, time
+from functools import lru_cache
 from pathlib import Path
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
-from PyPDF2 import PdfReader
 from spellchecker import SpellChecker
 
+from pdf_manifest import Manifest, settings_fingerprint
+from pdf_page_extractor import extract_pages, page_timing_report
+from spell_rewrite import apply_corrections
+from text_cleaner import TextCleaner, join_broken_word
+
 # -------------------------------------------------
 # >>> CHANGE THIS to the directory that holds PDFs
-PDF_FOLDER = Path("~path/to/files").expanduser()   # ← edit me
+PDF_FOLDER = Path("~path/to/files")   # ← edit me
 # -------------------------------------------------
 
 # ---------- Helpers -----------------
-def pdf_to_raw_text(pdf_path: Path) -> str:
-    reader = PdfReader(str(pdf_path))
-    pages = [page.extract_text() or '' for page in reader.pages]
+def pdf_to_raw_text(pdf_path: Path, workers: int | None = None) -> str:
+    pages, _ = extract_pages(pdf_path, workers)
     return '\n'.join(pages)
 
 # Simple heuristics for common artefacts
-HYPHEN_BREAK = re.compile(r"([A-Za-z])-\n([a-z])")  # broken words split by newline
+HYPHEN_BREAK = re.compile(r"(?<=[A-Za-z])-\n(?=[a-z])")  # broken words split by newline
 MULTI_SPACE   = re.compile(r" {2,}")
 LINE_END_HARD = re.compile(r"\s*\n\s+")             # merge single hard line-breaks
+CLEANING_RULES_VERSION = 1  # bump whenever the .txt written for the same PDF changes
 
-def clean_text(raw: str) -> tuple[str, dict]:
-    fixes = Counter()
-
-    txt = HYPHEN_BREAK.sub(lambda m: m.group(1) + m.group(2), raw)
-    if txt != raw:
-        fixes['hyphen_join'] += 1
-
-    txt2 = MULTI_SPACE.sub(' ', txt)
-    if txt2 != txt:
-        fixes['multispace'] += 1
+# One pass over the text for all rules; line-break merging goes before
+# multi-space collapsing so a whole whitespace run around a newline is one fix
+CLEANER = TextCleaner([
+    ('hyphen_join', HYPHEN_BREAK.pattern, join_broken_word),
+    ('linebreak_merge', LINE_END_HARD.pattern, ' '),
+    ('multispace', MULTI_SPACE.pattern, ' '),
+], starts=r"\s-")
 
-    txt3 = LINE_END_HARD.sub(' ', txt2)
-    if txt3 != txt2:
-        fixes['linebreak_merge'] += 1
+def clean_text(raw: str) -> tuple[str, dict]:
+    return CLEANER.clean(raw)
 
-    return txt3, dict(fixes)
+# Loading the dictionary is slow, so each process keeps one checker per language
+@lru_cache(maxsize=None)
+def spell_checker(language='en') -> SpellChecker:
+    return SpellChecker(language=language)
 
 def spellcheck(text: str, language='en') -> tuple[str, dict]:
     words = re.findall(r"[A-Za-z']+", text)
-    sp = SpellChecker(language=language)
+    sp = spell_checker(language)
     miss = sp.unknown(words)
 
     corrections = {}
@@ -49,15 +53,17 @@ def spellcheck(text: str, language='en') -> tuple[str, dict]:
         if suggestion and suggestion.lower() != word.lower():
             corrections[word] = suggestion
 
-    # apply corrections (very simple global replace)
-    for wrong, right in corrections.items():
-        text = re.sub(rf"\b{re.escape(wrong)}\b", right, text)
+    # apply all corrections in one pass over the text
+    text = apply_corrections(text, corrections)
 
     return text, corrections
 
 # ---------- Main workflow ----------
-def process_pdf(pdf_path: Path, lang='en') -> dict:
-    raw = pdf_to_raw_text(pdf_path)
+def process_pdf(pdf_path: Path, lang='en', workers: int | None = None) -> dict:
+    extract_start = time.perf_counter()
+    pages, page_seconds = extract_pages(pdf_path, workers)
+    extract_elapsed = time.perf_counter() - extract_start
+    raw = '\n'.join(pages)
     cleaned, fix_stats = clean_text(raw)
     cleaned, corrections = spellcheck(cleaned, lang)
 
@@ -70,18 +76,57 @@ def process_pdf(pdf_path: Path, lang='en') -> dict:
         'chars_cleaned': len(cleaned),
         'cleaning_fixes': fix_stats,
         'spelling_corrections': len(corrections),
-        'corrections_detail': corrections
+        'corrections_detail': corrections,
+        **page_timing_report(page_seconds, extract_elapsed)
     }
 
-def run(folder: Path, lang='en') -> Path:
+def process_pdf_safe(pdf_path: Path, lang='en', workers: int | None = None) -> dict:
+    try:
+        return process_pdf(pdf_path, lang, workers)
+    except Exception as e:
+        return {'pdf': pdf_path.name, 'error': str(e)}
+
+# Worker processes for --jobs load the spell checker once, then reuse it for every PDF
+def _init_worker(lang: str):
+    spell_checker(lang)
+
+def _process_in_worker(task: tuple[Path, str]) -> dict:
+    pdf_path, lang = task
+    # One PDF per worker already keeps every core busy, so pages are extracted in-process
+    return process_pdf_safe(pdf_path, lang, workers=1)
+
+def run(folder: Path, lang='en', workers: int | None = None, jobs: int = 1, force=False) -> Path:
     report = []
-    for pdf in folder.glob('*.pdf'):
-        try:
-            report.append(process_pdf(pdf, lang))
+    manifest = Manifest(folder)
+    fingerprint = settings_fingerprint(lang=lang, cleaning_rules=CLEANING_RULES_VERSION)
+    all_pdfs = sorted(folder.glob('*.pdf'))
+    pdfs, unchanged = manifest.partition(all_pdfs, fingerprint, force)
+    unchanged = set(unchanged)
+
+    if jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(lang,))
+        results = pool.map(_process_in_worker, [(pdf, lang) for pdf in pdfs])
+    else:
+        pool = None
+        results = (process_pdf_safe(pdf, lang, workers) for pdf in pdfs)
+
+    # Report every PDF in folder order; results arrive in the order of pdfs
+    results = iter(results)
+    for pdf in all_pdfs:
+        if pdf in unchanged:
+            print(f"- Skipped {pdf.name} (unchanged)")
+            report.append({'pdf': pdf.name, 'skipped': 'unchanged'})
+            continue
+        result = next(results)
+        if 'error' in result:
+            print(f"✗ Failed {pdf.name}: {result['error']}")
+        else:
             print(f"✓ Processed {pdf.name}")
-        except Exception as e:
-            print(f"✗ Failed {pdf.name}: {e}")
-            report.append({'pdf': pdf.name, 'error': str(e)})
+            manifest.record(pdf, fingerprint)
+        report.append(result)
+    if pool:
+        pool.shutdown()
+    manifest.save()
 
     ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
     report_path = folder / f"batch_report_{ts}.json"
@@ -97,5 +142,11 @@ if __name__ == '__main__':
                         help='Folder containing PDFs (default = value of PDF_FOLDER var)')
     parser.add_argument('--lang', default='en',
                         help='Language for spell-check (default=en)')
+    parser.add_argument('--extract-workers', type=int,
+                        help='Processes for page text extraction (default = number of CPUs)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='PDFs processed in parallel (default=1)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-process PDFs even if they are unchanged since the last run')
     cli = parser.parse_args()
-    run(Path(cli.folder).expanduser().resolve(), cli.lang)
+    run(Path(cli.folder).expanduser().resolve(), cli.lang, cli.extract_workers, cli.jobs, cli.force)
@@ -0,0 +1,76 @@
+# Incremental folder runs
+#
+# The manifest remembers, for every PDF that was processed successfully, the
+# SHA-256 of its bytes and a fingerprint of the settings that produced its .txt
+# (spell backend, language, whitelist, cleaning-rule version).  A PDF whose hash
+# and fingerprint both match, and whose .txt is still there, is skipped.  Size and
+# mtime are stored too, so unchanged files are not even re-hashed.
+
+import hashlib, json, os
+from pathlib import Path
+
+MANIFEST_NAME = '.pdf_manifest.json'
+HASH_CHUNK = 1 << 20
+
+def settings_fingerprint(**settings) -> str:
+    """Stable hash of the settings that affect a PDF's output text."""
+    blob = json.dumps(settings, sort_keys=True, default=sorted)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        while chunk := fh.read(HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class Manifest:
+    def __init__(self, folder: Path):
+        self.path = folder / MANIFEST_NAME
+        try:
+            self.entries = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.entries = {}
+        self._hashes = {}   # Hashes computed during this run
+
+    def content_hash(self, pdf_path: Path) -> str:
+        if pdf_path.name in self._hashes:
+            return self._hashes[pdf_path.name]
+        st = pdf_path.stat()
+        entry = self.entries.get(pdf_path.name)
+        if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+            digest = entry['sha256']
+        else:
+            digest = file_sha256(pdf_path)
+        self._hashes[pdf_path.name] = digest
+        return digest
+
+    def is_current(self, pdf_path: Path, fingerprint: str) -> bool:
+        entry = self.entries.get(pdf_path.name)
+        return bool(entry
+                    and entry['settings'] == fingerprint
+                    and entry['sha256'] == self.content_hash(pdf_path)
+                    and pdf_path.with_suffix('.txt').exists())
+
+    def partition(self, pdfs: list[Path], fingerprint: str, force=False) -> tuple[list[Path], list[Path]]:
+        """Splits pdfs into (to_process, unchanged)."""
+        if force:
+            return list(pdfs), []
+        todo, unchanged = [], []
+        for pdf in pdfs:
+            (unchanged if self.is_current(pdf, fingerprint) else todo).append(pdf)
+        return todo, unchanged
+
+    def record(self, pdf_path: Path, fingerprint: str):
+        st = pdf_path.stat()
+        self.entries[pdf_path.name] = {
+            'sha256': self.content_hash(pdf_path),
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'settings': fingerprint
+        }
+
+    def save(self):
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.entries, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp, self.path)
@@ -1,93 +1,178 @@
-import argparse, json, re, datetime, asyncio
+import argparse, json, re, datetime, asyncio, time
+from functools import lru_cache
 from pathlib import Path
-from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
-from PyPDF2 import PdfReader
 from spellchecker import SpellChecker
-import edge_tts  # for natural-sounding voice
+
+from pdf_page_extractor import extract_pages, page_timing_report
+from spell_rewrite import apply_literal_corrections
+from text_cleaner import TextCleaner, clean_in_passes, join_broken_word
+from audio_cache import CACHE_DIR, MAX_BYTES, AudioChunkCache
+from tts_synthesis import CHUNK_CHARS, CONCURRENCY, EdgeSynthesizer, synthesize_to_file
 
 # ---------- Configurable Defaults ----------
-PDF_FOLDER = Path("~path/to/files").expanduser()  # update this default path
+PDF_FOLDER = Path("~path/to/files")  # update this default path
 DEFAULT_VOICE = "en-US-GuyNeural"
 # ------------------------------------------
 
 # ---------- Text Processing Utilities ----------
-def pdf_to_raw_text(pdf_path: Path) -> str:
-    reader = PdfReader(str(pdf_path))
-    pages = [page.extract_text() or '' for page in reader.pages]
+def pdf_to_raw_text(pdf_path: Path, workers: int | None = None) -> str:
+    pages, _ = extract_pages(pdf_path, workers)
     return '\\n'.join(pages)
 
-HYPHEN_BREAK = re.compile(r"([A-Za-z])-\\n([a-z])")
+HYPHEN_BREAK = re.compile(r"(?<=[A-Za-z])-\\n(?=[a-z])")
 MULTI_SPACE   = re.compile(r" {2,}")
 LINE_END_HARD = re.compile(r"\\s*\\n\\s+")
 
+HYPHEN_JOIN = ('hyphen_join', HYPHEN_BREAK.pattern, join_broken_word)
+LINEBREAK_MERGE = ('linebreak_merge', LINE_END_HARD.pattern, ' ')
+MULTISPACE = ('multispace', MULTI_SPACE.pattern, ' ')
+
+# One pass over the text for all rules; line-break merging goes before
+# multi-space collapsing so a whole whitespace run around a newline is one fix
+CLEANER = TextCleaner([HYPHEN_JOIN, LINEBREAK_MERGE, MULTISPACE], starts=r"\\ -")
+
 def clean_text(raw: str) -> tuple[str, dict]:
-    fixes = Counter()
-    txt = HYPHEN_BREAK.sub(lambda m: m.group(1) + m.group(2), raw)
-    if txt != raw:
-        fixes['hyphen_join'] += 1
-    txt2 = MULTI_SPACE.sub(' ', txt)
-    if txt2 != txt:
-        fixes['multispace'] += 1
-    txt3 = LINE_END_HARD.sub(' ', txt2)
-    if txt3 != txt2:
-        fixes['linebreak_merge'] += 1
-    return txt3, dict(fixes)
+    # LINE_END_HARD can overlap or be completed by a hyphen join, so where it could
+    # match at all (a literal "\n\" in the text) keep the original order of passes
+    if '\\n\\' in raw:
+        return clean_in_passes(raw, [HYPHEN_JOIN, MULTISPACE, LINEBREAK_MERGE])
+    return CLEANER.clean(raw)
+
+# Loading the dictionary is slow, so each process keeps one checker per language
+@lru_cache(maxsize=None)
+def spell_checker(language='en') -> SpellChecker:
+    return SpellChecker(language=language)
 
 def spellcheck(text: str, language='en') -> tuple[str, dict]:
     words = re.findall(r"[A-Za-z']+", text)
-    sp = SpellChecker(language=language)
+    sp = spell_checker(language)
     miss = sp.unknown(words)
     corrections = {}
     for word in miss:
         suggestion = sp.correction(word)
         if suggestion and suggestion.lower() != word.lower():
             corrections[word] = suggestion
-    for wrong, right in corrections.items():
-        text = re.sub(rf"\\b{re.escape(wrong)}\\b", right, text)
-    return text, corrections
+    return apply_literal_corrections(text, corrections), corrections
 
 # ---------- Main Workflow ----------
-async def text_to_mp3(text_path: Path, voice: str):
+# run() is a two-stage pipeline: extraction, cleaning and spell-check (CPU) run in
+# a process pool and feed a bounded queue, while TTS consumers synthesize the
+# documents already prepared.  Wall time approaches max(CPU stage, TTS stage).
+QUEUE_SIZE = 2      # Prepared documents waiting for TTS
+TTS_DOCUMENTS = 2   # Documents synthesized at the same time
+
+async def text_to_mp3(text_path: Path, voice: str, synthesizer=None, concurrency=CONCURRENCY,
+                      chunk_chars=CHUNK_CHARS, cache: AudioChunkCache | None = None) -> dict:
     mp3_path = text_path.with_suffix('.mp3')
     text = text_path.read_text(encoding='utf-8')
-    communicate = edge_tts.Communicate(text, voice)
-    await communicate.save(str(mp3_path))
-    print(f"🎧 Saved {mp3_path.name}")
+    start = time.perf_counter()
+    stats = await synthesize_to_file(text, voice, mp3_path, synthesizer or EdgeSynthesizer(),
+                                     concurrency=concurrency, max_chars=chunk_chars, cache=cache)
+    stats['tts_seconds'] = round(time.perf_counter() - start, 2)
+    print(f"🎧 Saved {mp3_path.name} ({stats['chunks']} chunks, {stats['cache_hits']} from cache)")
+    return stats
 
-async def process_pdf(pdf_path: Path, lang='en', voice=DEFAULT_VOICE) -> dict:
-    raw = pdf_to_raw_text(pdf_path)
+def prepare_pdf(pdf_path: Path, lang='en', workers: int | None = None) -> dict:
+    """CPU stage: extract, clean and spell-check one PDF and write its .txt."""
+    extract_start = time.perf_counter()
+    pages, page_seconds = extract_pages(pdf_path, workers)
+    extract_elapsed = time.perf_counter() - extract_start
+    raw = '\\n'.join(pages)
     cleaned, fix_stats = clean_text(raw)
     cleaned, corrections = spellcheck(cleaned, lang)
 
     txt_path = pdf_path.with_suffix('.txt')
     txt_path.write_text(cleaned, encoding='utf-8')
 
-    await text_to_mp3(txt_path, voice)
-
     return {
         'pdf': pdf_path.name,
         'chars_original': len(raw),
         'chars_cleaned': len(cleaned),
         'cleaning_fixes': fix_stats,
         'spelling_corrections': len(corrections),
-        'corrections_detail': corrections
+        'corrections_detail': corrections,
+        'prepare_seconds': round(time.perf_counter() - extract_start, 2),
+        **page_timing_report(page_seconds, extract_elapsed)
     }
 
-async def run(folder: Path, lang='en', voice=DEFAULT_VOICE):
-    report = []
-    for pdf in folder.glob('*.pdf'):
-        try:
-            result = await process_pdf(pdf, lang, voice)
-            report.append(result)
-            print(f"✓ Processed {pdf.name}")
-        except Exception as e:
-            print(f"✗ Failed {pdf.name}: {e}")
-            report.append({'pdf': pdf.name, 'error': str(e)})
+async def process_pdf(pdf_path: Path, lang='en', voice=DEFAULT_VOICE, workers: int | None = None,
+                      synthesizer=None, concurrency=CONCURRENCY, chunk_chars=CHUNK_CHARS,
+                      cache: AudioChunkCache | None = None) -> dict:
+    # The CPU stage blocks, so keep it off the event loop
+    result = await asyncio.to_thread(prepare_pdf, pdf_path, lang, workers)
+    result['tts'] = await text_to_mp3(pdf_path.with_suffix('.txt'), voice, synthesizer, concurrency,
+                                      chunk_chars, cache)
+    return result
+
+# Worker processes load the spell checker once, then reuse it for every PDF
+def _init_worker(lang: str):
+    spell_checker(lang)
+
+def _prepare_safe(pdf_path: Path, lang: str, workers: int | None) -> dict:
+    try:
+        return prepare_pdf(pdf_path, lang, workers)
+    except Exception as e:
+        return {'pdf': pdf_path.name, 'error': str(e)}
+
+async def run(folder: Path, lang='en', voice=DEFAULT_VOICE, workers: int | None = None,
+              synthesizer=None, concurrency=CONCURRENCY, chunk_chars=CHUNK_CHARS,
+              cache_bytes: int | None = MAX_BYTES, jobs: int = 1, tts_documents: int = TTS_DOCUMENTS,
+              queue_size: int = QUEUE_SIZE):
+    start = time.perf_counter()
+    pdfs = list(folder.glob('*.pdf'))
+    results = [None] * len(pdfs)
+    cache = AudioChunkCache(folder / CACHE_DIR, cache_bytes) if cache_bytes else None
+    loop = asyncio.get_running_loop()
+    if jobs == 1:
+        # One PDF at a time is prepared in a thread, so page extraction keeps its own pool
+        pool, extract_workers = None, workers
+    else:
+        # With several PDFs in the CPU stage at once, each extracts its pages in-process
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(lang,))
+        extract_workers = 1
+    queue = asyncio.Queue(maxsize=queue_size)
+    cpu_slots = asyncio.Semaphore(jobs)
+
+    async def produce(index: int, pdf: Path):
+        # A slot is held until the document is queued, so the CPU stage cannot run
+        # more than jobs + queue_size documents ahead of TTS
+        async with cpu_slots:
+            prepared = await loop.run_in_executor(pool, _prepare_safe, pdf, lang, extract_workers)
+            await queue.put((index, pdf, prepared))
+
+    async def consume():
+        while (item := await queue.get()) is not None:
+            index, pdf, result = item
+            if 'error' not in result:
+                try:
+                    result['tts'] = await text_to_mp3(pdf.with_suffix('.txt'), voice, synthesizer,
+                                                      concurrency, chunk_chars, cache)
+                except Exception as e:
+                    result = {'pdf': pdf.name, 'error': str(e)}
+            if 'error' in result:
+                print(f"✗ Failed {pdf.name}: {result['error']}")
+            else:
+                print(f"✓ Processed {pdf.name}")
+            results[index] = result
+
+    consumers = [asyncio.create_task(consume()) for _ in range(tts_documents)]
+    try:
+        await asyncio.gather(*(produce(i, pdf) for i, pdf in enumerate(pdfs)))
+        for _ in consumers:
+            await queue.put(None)
+        await asyncio.gather(*consumers)
+    finally:
+        for task in consumers:
+            task.cancel()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
     ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
     report_path = folder / f"batch_audio_report_{ts}.json"
-    report_path.write_text(json.dumps(report, indent=2), encoding='utf-8')
-    print(f"\\n📄 Report saved to {report_path}")
+    report_path.write_text(json.dumps(results, indent=2), encoding='utf-8')
+    print(f"\\n📄 Report saved to {report_path} ({time.perf_counter() - start:.1f}s)")
     return report_path
 
 # ---------- CLI ----------
@@ -96,6 +181,23 @@ if __name__ == '__main__':
     parser.add_argument('folder', nargs='?', default=PDF_FOLDER, help='Folder containing PDFs')
     parser.add_argument('--lang', default='en', help='Language for spell-check (default=en)')
     parser.add_argument('--voice', default=DEFAULT_VOICE, help='Microsoft Edge TTS voice name (e.g., en-US-GuyNeural)')
+    parser.add_argument('--extract-workers', type=int, help='Processes for page text extraction (default = number of CPUs)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='PDFs extracted and spell-checked in parallel (default=1)')
+    parser.add_argument('--tts-documents', type=int, default=TTS_DOCUMENTS,
+                        help=f'Documents synthesized at the same time (default={TTS_DOCUMENTS})')
+    parser.add_argument('--tts-concurrency', type=int, default=CONCURRENCY,
+                        help=f'TTS requests in flight at once per document (default={CONCURRENCY})')
+    parser.add_argument('--chunk-chars', type=int, default=CHUNK_CHARS,
+                        help=f'Maximum characters per TTS request (default={CHUNK_CHARS})')
+    parser.add_argument('--rate', default='+0%', help='Speaking rate, e.g. +10%% or -5%% (default=+0%%)')
+    parser.add_argument('--pitch', default='+0Hz', help='Voice pitch, e.g. +5Hz (default=+0Hz)')
+    parser.add_argument('--audio-cache-mb', type=int, default=MAX_BYTES // 1024 ** 2,
+                        help=f'Size limit of the audio chunk cache in {CACHE_DIR}, 0 disables it '
+                             f'(default={MAX_BYTES // 1024 ** 2})')
     args = parser.parse_args()
 
-    asyncio.run(run(Path(args.folder).expanduser().resolve(), args.lang, args.voice))
\ No newline at end of file
+    asyncio.run(run(Path(args.folder).expanduser().resolve(), args.lang, args.voice, args.extract_workers,
+                    synthesizer=EdgeSynthesizer(args.rate, args.pitch), concurrency=args.tts_concurrency,
+                    chunk_chars=args.chunk_chars, cache_bytes=args.audio_cache_mb * 1024 ** 2,
+                    jobs=args.jobs, tts_documents=args.tts_documents))
\ No newline at end of file
@@ -7,19 +7,31 @@
 # - 4 Spell check engines: pyspellchecker, JamSpell, SymSpell, BERT
 # - Auto JamSpell model downloader (en.bin)
 # - Per-PDF and total execution timing
+# - Parallel page extraction with per-page timing
+# - Parallel batch mode (--jobs) with one spell engine per worker
+# - Incremental runs: unchanged PDFs are skipped via a content-hash manifest
+# - Spelling suggestions memoized in memory and in a SQLite cache shared across runs
+# - Prebuilt SymSpell index, rebuilt automatically when the dictionary changes
 # - Whitelist support
 # - Metadata in final report
 
-import argparse, datetime, json, re, sys, time, urllib.request
-from collections import Counter
+import argparse, datetime, importlib.metadata, json, re, sys, time, urllib.request
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from difflib import SequenceMatcher
-from PyPDF2 import PdfReader
+
+from pdf_manifest import Manifest, settings_fingerprint
+from pdf_page_extractor import extract_pages, page_timing_report
+from spell_rewrite import apply_literal_corrections
+from text_cleaner import TextCleaner, clean_in_passes, join_broken_word
+from suggestion_cache import CACHE_NAME, SuggestionCache, summarize
 
 # --------------------------------------------------------------------#
-PDF_DIR = Path("~path/to/files").expanduser()  # Change to your PDF folder
+PDF_DIR = Path("~path/to/files")  # Change to your PDF folder
 JAMSPELL_MODEL = Path("en.bin")
 JAMSPELL_URL = "https://github.com/bakwc/JamSpell-models/raw/master/en.bin"
+FREQUENCY_DICTIONARY = Path("frequency_dictionary_en_82_765.txt")
+BERT_BATCH_SIZE = 32
 # --------------------------------------------------------------------#
 
 # Try optional spell checker back-ends
@@ -35,6 +47,7 @@ except ImportError:
 
 try:
     from symspellpy import SymSpell, Verbosity
+    from symspell_index import build_index, index_path, load_symspell
 except ImportError:
     SymSpell = None
 
@@ -108,46 +121,80 @@ def ensure_jamspell_model():
         urllib.request.urlretrieve(JAMSPELL_URL, str(JAMSPELL_MODEL))
 
 # PDF text extraction
-def pdf_to_raw_text(pdf_path: Path) -> str:
-    reader = PdfReader(str(pdf_path))
-    return '\\n'.join(page.extract_text() or '' for page in reader.pages)
+def pdf_to_raw_text(pdf_path: Path, workers: int | None = None) -> str:
+    pages, _ = extract_pages(pdf_path, workers)
+    return '\\n'.join(pages)
 
 # Cleaning rules
-HYPHEN_BREAK = re.compile(r"([A-Za-z])-?\\n([a-z])")
+HYPHEN_BREAK = re.compile(r"(?<=[A-Za-z])-?\\n(?=[a-z])")
 MULTI_SPACE   = re.compile(r" {2,}")
 LINE_END_HARD = re.compile(r"\\s*\\n\\s*")
+CLEANING_RULES_VERSION = 7  # bump whenever the .txt written for the same PDF changes
+
+HYPHEN_JOIN = ('hyphen_join', HYPHEN_BREAK.pattern, join_broken_word)
+LINEBREAK_MERGE = ('linebreak_merge', LINE_END_HARD.pattern, ' ')
+MULTISPACE = ('multispace', MULTI_SPACE.pattern, ' ')
+
+# One pass over the text for all rules; line-break merging goes before
+# multi-space collapsing so a whole whitespace run around a newline is one fix
+CLEANER = TextCleaner([HYPHEN_JOIN, LINEBREAK_MERGE, MULTISPACE], starts=r"\\ -")
 
 def clean_text(raw: str) -> tuple[str, dict]:
-    fixes = Counter()
-    txt = HYPHEN_BREAK.sub(lambda m: m.group(1) + m.group(2), raw)
-    if txt != raw: fixes['hyphen_join'] += 1
-    txt2 = MULTI_SPACE.sub(' ', txt)
-    if txt2 != txt: fixes['multispace'] += 1
-    txt3 = LINE_END_HARD.sub(' ', txt2)
-    if txt3 != txt2: fixes['linebreak_merge'] += 1
-    return txt3, dict(fixes)
+    # LINE_END_HARD can overlap or be completed by a hyphen join, so where it could
+    # match at all (a literal "\n\" in the text) keep the original order of passes
+    if '\\n\\' in raw:
+        return clean_in_passes(raw, [HYPHEN_JOIN, MULTISPACE, LINEBREAK_MERGE])
+    return CLEANER.clean(raw)
+
+# Known words, used to skip tokens that need no prediction
+def load_vocabulary(path: Path = FREQUENCY_DICTIONARY) -> set[str]:
+    with open(path, encoding='utf-8-sig') as f:
+        return {line.split(maxsplit=1)[0].lower() for line in f if line.strip()}
+
+# Identifies the data behind a backend, so cached suggestions from other data are not reused
+def library_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return 'unknown'
+
+def backend_data_version(backend: str) -> str:
+    if backend == 'pyspell':
+        return f"pyspellchecker {library_version('pyspellchecker')}"
+    if backend == 'jamspell':
+        return f"jamspell {library_version('jamspell')}"
+    if backend == 'symspell':
+        # The index name carries the dictionary's hash, so editing the dictionary changes it
+        version = f"symspellpy {library_version('symspellpy')}"
+        return f"{version} {index_path(FREQUENCY_DICTIONARY).name}" if SymSpell else version
+    return f"transformers {library_version('transformers')} bert-base-uncased"
+
+# The backend SpellEngine really uses: the requested one if its library is installed, else pyspell
+def effective_backend(backend: str) -> str:
+    backend = backend.lower()
+    installed = {'pyspell': _PySpell, 'jamspell': jamspell, 'symspell': SymSpell, 'bert': pipeline}
+    return backend if installed.get(backend) else 'pyspell'
 
 # Spell Engine
 class SpellEngine:
-    def __init__(self, backend: str = 'pyspell', lang: str = 'en'):
-        self.backend = backend.lower()
+    def __init__(self, backend: str = 'pyspell', lang: str = 'en', cache_path: Path | None = None):
+        self.backend = effective_backend(backend)
         self.lang = lang
 
-        if self.backend == 'pyspell' and _PySpell:
-            self.engine = _PySpell(language=lang)
-        elif self.backend == 'jamspell' and jamspell:
+        if self.backend == 'jamspell':
             ensure_jamspell_model()
             self.engine = jamspell.TSpellCorrector()
             self.engine.LoadLangModel(str(JAMSPELL_MODEL))
-        elif self.backend == 'symspell' and SymSpell:
-            self.engine = SymSpell(max_dictionary_edit_distance=2)
-            self.engine.load_dictionary("frequency_dictionary_en_82_765.txt", term_index=0, count_index=1)
-        elif self.backend == 'bert' and pipeline:
+        elif self.backend == 'symspell':
+            self.engine = load_symspell(FREQUENCY_DICTIONARY, max_edit_distance=2)
+        elif self.backend == 'bert':
             self.engine = pipeline('fill-mask', model='bert-base-uncased')
+            self.vocabulary = load_vocabulary()
         else:
-            print(f"[WARN] Missing backend '{backend}', defaulting to pyspell.")
-            self.backend = 'pyspell'
+            if self.backend != backend.lower() or not _PySpell:
+                print(f"[WARN] Missing backend '{backend}', defaulting to pyspell.")
             self.engine = _PySpell(language=lang) if _PySpell else None
+        self.cache = SuggestionCache(self.backend, lang, cache_path, version=backend_data_version(self.backend))
 
     def _similar(self, a: str, b: str) -> float:
         return SequenceMatcher(None, a.lower(), b.lower()).ratio()
@@ -171,12 +218,10 @@ class SpellEngine:
         for w in miss:
             if w.lower() in WHITELIST: 
                 continue
-            sugg = sp.correction(w)
+            sugg = self.cache.suggest(w, sp.correction)
             if sugg and self._similar(w, sugg) >= SIM_THRESHOLD:
                 changes[w] = sugg
-        for w, s in changes.items():
-            text = re.sub(rf"\\b{re.escape(w)}\\b", s, text)
-        return text, changes
+        return apply_literal_corrections(text, changes), changes
 
     def _correct_jamspell(self, text):
         sentences = text.split('. ')
@@ -191,36 +236,45 @@ class SpellEngine:
 
     def _correct_symspell(self, text):
         changes = {}
-        for t in text.split():
+        # Each distinct token is looked up once, however often it repeats
+        for t in dict.fromkeys(text.split()):
             if t.lower() in WHITELIST or not t.isalpha(): 
                 continue
-            suggs = self.engine.lookup(t, Verbosity.CLOSEST, max_edit_distance=2)
-            if suggs:
-                best = suggs[0].term
-                if best != t and self._similar(t, best) >= SIM_THRESHOLD:
-                    changes[t] = best
-        for w, s in changes.items():
-            text = re.sub(rf"\\b{re.escape(w)}\\b", s, text)
-        return text, changes
+            best = self.cache.suggest(t, self._symspell_best)
+            if best and best != t and self._similar(t, best) >= SIM_THRESHOLD:
+                changes[t] = best
+        return apply_literal_corrections(text, changes), changes
+
+    def _symspell_best(self, word):
+        suggs = self.engine.lookup(word, Verbosity.CLOSEST, max_edit_distance=2)
+        return suggs[0].term if suggs else None
 
     def _correct_bert(self, text):
         tokens, changes = text.split(), {}
-        for i, tok in enumerate(tokens):
-            if tok.lower() in WHITELIST or not tok.isalpha(): 
-                continue
-            masked = tokens[:i] + ['[MASK]'] + tokens[i+1:]
-            pred = self.engine(" ".join(masked[i-4:i+5]))[0]['token_str'].strip()
+        # Only words the dictionary does not know are worth a fill-mask prediction
+        positions = [i for i, tok in enumerate(tokens)
+                     if tok.isalpha() and tok.lower() not in WHITELIST and tok.lower() not in self.vocabulary]
+        contexts = [" ".join(tokens[max(i - 4, 0):i] + ['[MASK]'] + tokens[i + 1:i + 5]) for i in positions]
+        preds = self.engine(contexts, batch_size=BERT_BATCH_SIZE) if contexts else []
+        if len(contexts) == 1:
+            preds = [preds]     # The pipeline unwraps single-item batches
+        for i, pred in zip(positions, preds):
+            tok, pred = tokens[i], pred[0]['token_str'].strip()
             if pred.lower() != tok.lower() and self._similar(tok, pred) >= SIM_THRESHOLD:
                 changes[tok] = pred
                 tokens[i] = pred
         return " ".join(tokens), changes
 
 # PDF processor
-def process_pdf(pdf_path: Path, engine: SpellEngine) -> dict:
+def process_pdf(pdf_path: Path, engine: SpellEngine, workers: int | None = None) -> dict:
     start = time.time()
-    raw = pdf_to_raw_text(pdf_path)
+    pages, page_seconds = extract_pages(pdf_path, workers)
+    extract_elapsed = time.time() - start
+    raw = '\\n'.join(pages)
     cleaned, fix_stats = clean_text(raw)
+    cache_before = engine.cache.stats()
     cleaned, corrections = engine.correct(cleaned)
+    engine.cache.flush()
     out_path = pdf_path.with_suffix('.txt')
     out_path.write_text(cleaned, encoding='utf-8')
     elapsed = time.time() - start
@@ -231,29 +285,87 @@ def process_pdf(pdf_path: Path, engine: SpellEngine) -> dict:
         'cleaning_fixes': fix_stats,
         'spelling_corrections': len(corrections),
         'corrections_detail': corrections,
-        'elapsed_seconds': round(elapsed, 2)
+        'elapsed_seconds': round(elapsed, 2),
+        'suggestion_cache': {k: v - cache_before[k] for k, v in engine.cache.stats().items()},
+        **page_timing_report(page_seconds, extract_elapsed)
     }
 
+def process_pdf_safe(pdf_path: Path, engine: SpellEngine, workers: int | None = None) -> dict:
+    try:
+        return process_pdf(pdf_path, engine, workers)
+    except Exception as e:
+        return {'pdf': pdf_path.name, 'error': str(e)}
+
+# Worker processes for --jobs: the spell engine is loaded once per worker, not per PDF
+_worker_engine = None
+
+def _init_worker(backend: str, lang: str, cache_path: Path | None):
+    global _worker_engine
+    _worker_engine = SpellEngine(backend, lang, cache_path)
+
+def _process_in_worker(pdf_path: Path) -> dict:
+    # One PDF per worker already keeps every core busy, so pages are extracted in-process
+    return process_pdf_safe(pdf_path, _worker_engine, workers=1)
+
 # Main run
-def run(folder: Path, lang='en', backend='pyspell'):
+def run(folder: Path, lang='en', backend='pyspell', workers: int | None = None, jobs: int = 1, force=False,
+        spell_cache=True):
+    # Resolve a missing backend here, so the manifest records the backend that produced the text
+    resolved = effective_backend(backend)
+    if resolved != backend.lower():
+        print(f"[WARN] Missing backend '{backend}', defaulting to pyspell.")
+    backend = resolved
     print(f"[INFO] Using spell checker: {backend}")
-    engine = SpellEngine(backend, lang)
+    cache_path = folder / CACHE_NAME if spell_cache else None
     report, total_start = [], time.time()
-
-    for pdf in folder.glob("*.pdf"):
-        try:
-            result = process_pdf(pdf, engine)
+    manifest = Manifest(folder)
+    fingerprint = settings_fingerprint(backend=backend, backend_data=backend_data_version(backend), lang=lang,
+                                       whitelist=WHITELIST, sim_threshold=SIM_THRESHOLD,
+                                       cleaning_rules=CLEANING_RULES_VERSION)
+    all_pdfs = sorted(folder.glob("*.pdf"))
+    pdfs, unchanged = manifest.partition(all_pdfs, fingerprint, force)
+
+    if jobs > 1:
+        if backend == 'symspell' and SymSpell:
+            # Build the SymSpell index once here rather than in every worker at the same time
+            build_index(FREQUENCY_DICTIONARY, max_edit_distance=2)
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                   initargs=(backend, lang, cache_path))
+        results = pool.map(_process_in_worker, pdfs)
+    else:
+        pool = None
+        engine = SpellEngine(backend, lang, cache_path)
+        results = (process_pdf_safe(pdf, engine, workers) for pdf in pdfs)
+
+    # Report every PDF in folder order; results arrive in the order of pdfs
+    results = iter(results)
+    for pdf in all_pdfs:
+        if pdf in unchanged:
+            print(f"- {pdf.name} (unchanged, skipped)")
+            report.append({'pdf': pdf.name, 'skipped': 'unchanged'})
+            continue
+        result = next(results)
+        if 'error' in result:
+            print(f"✗ {pdf.name}: {result['error']}")
+        else:
             print(f"✓ {pdf.name} ({result['spelling_corrections']} corrections, {result['elapsed_seconds']}s)")
-            report.append(result)
-        except Exception as e:
-            print(f"✗ {pdf.name}: {e}")
-            report.append({'pdf': pdf.name, 'error': str(e)})
+            manifest.record(pdf, fingerprint)
+        report.append(result)
+    if pool:
+        pool.shutdown()
+    else:
+        engine.cache.close()
+    manifest.save()
 
     total_time = round(time.time() - total_start, 2)
     metadata = {
         'spell_checker': backend,
         'language': lang,
         'whitelist_size': len(WHITELIST),
+        'extract_workers': workers,
+        'pdfs_processed': len(pdfs),
+        'pdfs_skipped': [pdf.name for pdf in unchanged],
+        'suggestion_cache': summarize([r['suggestion_cache'] for r in report if 'suggestion_cache' in r]),
         'total_elapsed_seconds': total_time,
         'report_generated': datetime.datetime.now().isoformat()
     }
@@ -270,6 +382,12 @@ if __name__ == '__main__':
     p.add_argument('-f', '--folder', default=str(PDF_DIR))
     p.add_argument('--lang', default='en')
     p.add_argument('--spell', default='pyspell', choices=['pyspell', 'jamspell', 'symspell', 'bert'])
+    p.add_argument('--extract-workers', type=int, help='Processes for page text extraction (default = number of CPUs)')
+    p.add_argument('-j', '--jobs', type=int, default=1, help='PDFs processed in parallel (default=1)')
+    p.add_argument('--force', action='store_true', help='Re-process PDFs even if they are unchanged since the last run')
+    p.add_argument('--no-spell-cache', action='store_true',
+                   help=f'Keep spelling suggestions in memory only, without {CACHE_NAME} in the folder')
     args = p.parse_args()
 
-    run(Path(args.folder).expanduser().resolve(), lang=args.lang, backend=args.spell)
\ No newline at end of file
+    run(Path(args.folder).expanduser().resolve(), lang=args.lang, backend=args.spell, workers=args.extract_workers,
+        jobs=args.jobs, force=args.force, spell_cache=not args.no_spell_cache)
\ No newline at end of file
@@ -0,0 +1,59 @@
+# Single-pass spelling correction rewrite
+#
+# Applying corrections with one re.sub(rf"\b{word}\b", ...) per corrected word scans
+# the whole text once per correction.  apply_corrections() builds a character trie
+# of the misspelled words, compiles it into one regular expression bounded by \b,
+# and rewrites the text in a single linear pass.  Every word is matched exactly as
+# the per-word \b...\b pattern matched it.  Because each position is rewritten at
+# most once, a replacement is never itself corrected again by a later entry, and
+# where two misspellings start at the same place the longer one wins.
+#
+# The text and audio converters used rf"\\b{word}\\b" instead, which only matches
+# a word written between literal "\b" sequences; apply_literal_corrections() keeps
+# that output unchanged without scanning the text once per correction.
+
+import re
+
+END = ''    # Key marking the end of a complete word inside the trie
+
+def _build_trie(words) -> dict:
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[END] = word
+    return trie
+
+def _trie_to_regex(node: dict) -> str:
+    branches = [re.escape(char) + _trie_to_regex(child)
+                for char, child in sorted(node.items()) if char != END]
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if END in node:
+        # A word ends here, but a longer one is tried first
+        pattern = '(?:' + pattern + ')?'
+    return pattern
+
+def corrections_pattern(words) -> re.Pattern:
+    """One pattern matching any of the words as a whole word."""
+    return re.compile(r'\b(?:' + _trie_to_regex(_build_trie(words)) + r')\b')
+
+def apply_corrections(text: str, corrections: dict) -> str:
+    """Replaces every whole-word occurrence of each key with its value, in one pass."""
+    corrections = {wrong: right for wrong, right in corrections.items() if wrong}
+    if not corrections:
+        return text
+    return corrections_pattern(corrections).sub(lambda m: corrections[m.group()], text)
+
+def apply_literal_corrections(text: str, corrections: dict) -> str:
+    """Replaces each key written between two literal "\\b" sequences, delimiters included,
+    exactly as the old per-word rf"\\\\b{word}\\\\b" loop did."""
+    # Without a literal "\b" nothing can match, which is the case for all real text.
+    # Otherwise keep the loop: replacements that share a delimiter depend on its order.
+    if '\\b' not in text:
+        return text
+    for wrong, right in corrections.items():
+        text = re.sub(rf"\\b{re.escape(wrong)}\\b", right, text)
+    return text
@@ -0,0 +1,102 @@
+# Memoized spelling suggestions
+#
+# Generating candidates for an unknown word (edit distance 2 in pyspellchecker,
+# a SymSpell lookup, ...) is the slowest part of spell correction, and the same OCR
+# misspellings come back in PDF after PDF.  SuggestionCache keeps the suggestion
+# for every word it has seen in a bounded in-memory LRU and, optionally, in a
+# SQLite file keyed by (backend, language, word), so a word is only ever looked up
+# once across PDFs, worker processes and runs.  "No suggestion" is cached too.
+#
+# New suggestions are written to disk in one transaction by flush().
+#
+# The backend's data (its word list or dictionary) can change between runs, so
+# every (backend, language) in the file is stored with a version string that
+# identifies it; when a cache is opened with a different version, the old rows
+# for that backend and language are dropped.
+
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+
+CACHE_NAME = '.spell_cache.sqlite'
+MEMORY_SIZE = 100_000       # Words kept in memory per process
+_MISSING = object()
+
+class SuggestionCache:
+    def __init__(self, backend: str, lang: str, path: Path | None = None, maxsize: int = MEMORY_SIZE,
+                 version: str = ''):
+        self.backend, self.lang, self.maxsize, self.version = backend, lang, maxsize, version
+        self.memory = OrderedDict()
+        self.pending = {}
+        self.memory_hits = self.disk_hits = self.misses = 0
+        self.db = None
+        if path:
+            self.db = sqlite3.connect(str(path), timeout=30)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("CREATE TABLE IF NOT EXISTS suggestions (backend TEXT NOT NULL, lang TEXT NOT NULL, "
+                            "word TEXT NOT NULL, suggestion TEXT, PRIMARY KEY (backend, lang, word))")
+            self.db.execute("CREATE TABLE IF NOT EXISTS versions (backend TEXT NOT NULL, lang TEXT NOT NULL, "
+                            "version TEXT NOT NULL, PRIMARY KEY (backend, lang))")
+            self.db.commit()
+            self._check_version()
+
+    def _check_version(self):
+        # One transaction, so workers opening the cache together clear it at most once
+        self.db.execute("BEGIN IMMEDIATE")
+        row = self.db.execute("SELECT version FROM versions WHERE backend = ? AND lang = ?",
+                              (self.backend, self.lang)).fetchone()
+        if row is None or row[0] != self.version:
+            self.db.execute("DELETE FROM suggestions WHERE backend = ? AND lang = ?", (self.backend, self.lang))
+            self.db.execute("INSERT OR REPLACE INTO versions VALUES (?, ?, ?)", (self.backend, self.lang, self.version))
+        self.db.commit()
+
+    def _remember(self, word: str, suggestion: str | None):
+        self.memory[word] = suggestion
+        if len(self.memory) > self.maxsize:
+            self.memory.popitem(last=False)
+
+    def suggest(self, word: str, compute) -> str | None:
+        """Returns the cached suggestion for word, calling compute(word) on a miss."""
+        suggestion = self.memory.get(word, _MISSING)
+        if suggestion is not _MISSING:
+            self.memory.move_to_end(word)
+            self.memory_hits += 1
+            return suggestion
+
+        if self.db:
+            row = self.db.execute("SELECT suggestion FROM suggestions WHERE backend = ? AND lang = ? AND word = ?",
+                                  (self.backend, self.lang, word)).fetchone()
+            if row:
+                self.disk_hits += 1
+                self._remember(word, row[0])
+                return row[0]
+
+        self.misses += 1
+        suggestion = compute(word)
+        self._remember(word, suggestion)
+        if self.db:
+            self.pending[word] = suggestion
+        return suggestion
+
+    def flush(self):
+        if self.db and self.pending:
+            self.db.executemany("INSERT OR REPLACE INTO suggestions VALUES (?, ?, ?, ?)",
+                                [(self.backend, self.lang, w, s) for w, s in self.pending.items()])
+            self.db.commit()
+        self.pending.clear()
+
+    def close(self):
+        self.flush()
+        if self.db:
+            self.db.close()
+            self.db = None
+
+    def stats(self) -> dict:
+        return {'memory_hits': self.memory_hits, 'disk_hits': self.disk_hits, 'misses': self.misses}
+
+def summarize(stats: list[dict]) -> dict:
+    """Totals per-PDF stats() deltas into report metadata with an overall hit rate."""
+    total = {key: sum(s.get(key, 0) for s in stats) for key in ('memory_hits', 'disk_hits', 'misses')}
+    lookups = sum(total.values())
+    total['hit_rate'] = round((total['memory_hits'] + total['disk_hits']) / lookups, 4) if lookups else None
+    return total
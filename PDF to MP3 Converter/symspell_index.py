@@ -0,0 +1,116 @@
+# Prebuilt SymSpell index
+#
+# SymSpell.load_dictionary() parses the 82,765-word frequency list and generates
+# every edit-distance-2 delete variant, which takes seconds before the first PDF.
+# load_symspell() does that once, saves the built index next to the dictionary
+# with SymSpell.save_pickle(), and unpickles it on later starts.  The index file
+# name carries the SHA-256 of the dictionary and the edit distance, so changing
+# either rebuilds it automatically (and removes the stale one).
+#
+# Usage:
+#   python symspell_index.py                 # build the index if needed
+#   python symspell_index.py --compare       # startup time and peak RSS, text vs index
+
+import argparse, hashlib, json, os, resource, subprocess, sys, tempfile, time
+from pathlib import Path
+
+from symspellpy import SymSpell
+
+DEFAULT_DICTIONARY = Path(__file__).resolve().parent / "frequency_dictionary_en_82_765.txt"
+
+def index_path(dictionary: Path, max_edit_distance: int = 2) -> Path:
+    digest = hashlib.sha256(dictionary.read_bytes()).hexdigest()[:16]
+    return dictionary.with_name(f"{dictionary.stem}.d{max_edit_distance}.{digest}.symspell")
+
+def build_symspell(dictionary: Path, max_edit_distance: int = 2) -> SymSpell:
+    sym = SymSpell(max_dictionary_edit_distance=max_edit_distance)
+    sym.load_dictionary(str(dictionary), term_index=0, count_index=1)
+    return sym
+
+def _write_index(sym: SymSpell, path: Path):
+    # Every writer gets its own temp file, so workers racing to build the index each
+    # rename a complete pickle into place and the last rename simply wins
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        sym.save_pickle(tmp, compressed=False)
+        os.replace(tmp, path)
+    except OSError:
+        # e.g. Windows refusing to replace an index another process has open
+        if not path.exists():
+            raise
+    finally:
+        Path(tmp).unlink(missing_ok=True)
+
+def _remove_stale(dictionary: Path, max_edit_distance: int, path: Path):
+    for stale in dictionary.parent.glob(f"{dictionary.stem}.d{max_edit_distance}.*.symspell"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+def build_index(dictionary: Path = DEFAULT_DICTIONARY, max_edit_distance: int = 2) -> Path:
+    """Makes sure the index for dictionary exists and returns its path, without loading it.
+    Call this before starting worker processes that load_symspell()."""
+    dictionary = Path(dictionary)
+    path = index_path(dictionary, max_edit_distance)
+    if not path.exists():
+        _write_index(build_symspell(dictionary, max_edit_distance), path)
+        _remove_stale(dictionary, max_edit_distance, path)
+    return path
+
+def load_symspell(dictionary: Path = DEFAULT_DICTIONARY, max_edit_distance: int = 2) -> SymSpell:
+    """Returns a SymSpell loaded from the prebuilt index, building the index first if needed."""
+    dictionary = Path(dictionary)
+    path = index_path(dictionary, max_edit_distance)
+    if path.exists():
+        sym = SymSpell(max_dictionary_edit_distance=max_edit_distance)
+        # load_pickle() returns False for indexes written by another symspellpy version
+        if sym.load_pickle(str(path), compressed=False):
+            return sym
+
+    sym = build_symspell(dictionary, max_edit_distance)
+    _write_index(sym, path)
+    _remove_stale(dictionary, max_edit_distance, path)
+    return sym
+
+# Runs in a fresh interpreter so the timing and peak RSS cover a single load
+def _measure(mode: str, dictionary: Path, max_edit_distance: int) -> dict:
+    start = time.perf_counter()
+    if mode == 'text':
+        build_symspell(dictionary, max_edit_distance)
+    else:
+        load_symspell(dictionary, max_edit_distance)
+    return {
+        'mode': mode,
+        'seconds': round(time.perf_counter() - start, 3),
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    }
+
+def compare(dictionary: Path, max_edit_distance: int) -> list[dict]:
+    load_symspell(dictionary, max_edit_distance)    # make sure the index exists
+    results = []
+    for mode in ('text', 'index'):
+        out = subprocess.run([sys.executable, __file__, str(dictionary), '-d', str(max_edit_distance),
+                              '--measure', mode], capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(out))
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the prebuilt SymSpell index for a frequency dictionary.')
+    parser.add_argument('dictionary', nargs='?', default=str(DEFAULT_DICTIONARY))
+    parser.add_argument('-d', '--max-edit-distance', type=int, default=2)
+    parser.add_argument('--compare', action='store_true',
+                        help='Report startup time and peak RSS of loading the text file vs the index')
+    parser.add_argument('--measure', choices=['text', 'index'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    dictionary = Path(args.dictionary).expanduser().resolve()
+
+    if args.measure:
+        print(json.dumps(_measure(args.measure, dictionary, args.max_edit_distance)))
+    elif args.compare:
+        for r in compare(dictionary, args.max_edit_distance):
+            print(f"{r['mode']:>6}: {r['seconds']:>7.3f} s startup, {r['peak_rss_mb']:>8.1f} MB peak RSS")
+    else:
+        start = time.perf_counter()
+        load_symspell(dictionary, args.max_edit_distance)
+        print(f"[DONE] {index_path(dictionary, args.max_edit_distance).name} ready "
+              f"({time.perf_counter() - start:.2f}s)")
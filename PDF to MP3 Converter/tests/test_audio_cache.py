@@ -0,0 +1,45 @@
+import asyncio
+import os
+
+from audio_cache import AudioChunkCache, chunk_key
+from tts_synthesis import FakeSynthesizer, synthesize_to_file
+
+TEXT = "\n\n".join(f"Paragraph {p} is short." for p in range(10))
+
+
+def synthesize(tmp_path, text, cache, synthesizer=None):
+    synthesizer = synthesizer or FakeSynthesizer()
+    stats = asyncio.run(synthesize_to_file(text, 'v', tmp_path / 'book.mp3', synthesizer, max_chars=30,
+                                           cache=cache))
+    return stats, synthesizer.calls
+
+
+def test_keys_depend_on_text_voice_and_settings():
+    keys = {chunk_key('text', 'v', {'rate': '+0%'}), chunk_key('text ', 'v', {'rate': '+0%'}),
+            chunk_key('text', 'w', {'rate': '+0%'}), chunk_key('text', 'v', {'rate': '+10%'})}
+    assert len(keys) == 4
+
+
+def test_only_changed_chunks_are_synthesized_again(tmp_path):
+    cache = AudioChunkCache(tmp_path / 'cache')
+    stats, calls = synthesize(tmp_path, TEXT, cache)
+    first = (tmp_path / 'book.mp3').read_bytes()
+    assert (stats['cache_hits'], stats['cache_misses'], calls) == (0, 10, 10)
+
+    stats, calls = synthesize(tmp_path, TEXT, cache)
+    assert (stats['cache_hits'], calls) == (10, 0)
+    assert (tmp_path / 'book.mp3').read_bytes() == first
+
+    stats, calls = synthesize(tmp_path, TEXT.replace("Paragraph 3", "Paragraph three"), cache)
+    assert (stats['cache_hits'], stats['cache_misses'], calls) == (9, 1, 1)
+
+
+def test_least_recently_used_segments_are_evicted(tmp_path):
+    cache = AudioChunkCache(tmp_path / 'cache', max_bytes=25)
+    for index, key in enumerate('abcd'):
+        cache.put(key * 64, b'0123456789')
+        os.utime(cache._path(key * 64), ns=(index * 10 ** 9, index * 10 ** 9))
+    assert cache.get('a' * 64) is not None     # Now the most recently used
+    cache.evict()
+    assert [key for key in 'abcd' if cache.get(key * 64) is not None] == ['a', 'd']
+    assert cache.total_bytes == 20 and cache.evictions == 2
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from pdf_manifest import Manifest, settings_fingerprint
+
+FINGERPRINT = settings_fingerprint(lang='en', cleaning_rules=1)
+
+
+@pytest.fixture
+def folder(tmp_path):
+    for name in ('a', 'b', 'c'):
+        (tmp_path / f"{name}.pdf").write_bytes(f"%PDF {name}".encode())
+        (tmp_path / f"{name}.txt").write_text(name)
+    manifest = Manifest(tmp_path)
+    for pdf in sorted(tmp_path.glob('*.pdf')):
+        manifest.record(pdf, FINGERPRINT)
+    manifest.save()
+    return tmp_path
+
+
+def partition(folder, fingerprint=FINGERPRINT, force=False):
+    todo, unchanged = Manifest(folder).partition(sorted(folder.glob('*.pdf')), fingerprint, force)
+    return [pdf.name for pdf in todo], [pdf.name for pdf in unchanged]
+
+
+def test_recorded_pdfs_are_unchanged(folder):
+    assert partition(folder) == ([], ['a.pdf', 'b.pdf', 'c.pdf'])
+
+
+def test_changed_content_missing_text_and_force(folder):
+    (folder / 'b.pdf').write_bytes(b"%PDF changed")
+    (folder / 'c.txt').unlink()
+    assert partition(folder) == (['b.pdf', 'c.pdf'], ['a.pdf'])
+    assert partition(folder, force=True) == (['a.pdf', 'b.pdf', 'c.pdf'], [])
+
+
+def test_new_settings_reprocess_everything(folder):
+    assert partition(folder, settings_fingerprint(lang='de', cleaning_rules=1))[1] == []
+
+
+def test_unchanged_size_and_mtime_skip_hashing(folder, monkeypatch):
+    monkeypatch.setattr('pdf_manifest.file_sha256', lambda path: pytest.fail(f"{path.name} was hashed"))
+    assert partition(folder)[0] == []
+
+
+def test_report_lists_pdfs_in_folder_order(tmp_path):
+    canvas = pytest.importorskip('reportlab.pdfgen.canvas')
+    pdf_batch_cleaner = pytest.importorskip('pdf_batch_cleaner')
+
+    def write_pdf(name, text):
+        page = canvas.Canvas(str(tmp_path / name))
+        page.drawString(100, 700, text)
+        page.save()
+
+    for name in ('a.pdf', 'b.pdf', 'c.pdf'):
+        write_pdf(name, 'hello world')
+    pdf_batch_cleaner.run(tmp_path)
+    write_pdf('b.pdf', 'changed text')
+    report = json.loads(pdf_batch_cleaner.run(tmp_path).read_text())
+    assert [(entry['pdf'], entry.get('skipped')) for entry in report] == [
+        ('a.pdf', 'unchanged'), ('b.pdf', None), ('c.pdf', 'unchanged')]
+
+
+def test_fallback_backend_is_recorded_as_such(tmp_path, monkeypatch):
+    canvas = pytest.importorskip('reportlab.pdfgen.canvas')
+    converter = pytest.importorskip('pdf_to_text_converter')
+    if converter.SymSpell is None:
+        pytest.skip('symspellpy is not installed')
+    dictionary = tmp_path / 'dictionary' / 'words.txt'
+    dictionary.parent.mkdir()
+    dictionary.write_text('hello 10\nworld 5\n', encoding='utf-8')
+    monkeypatch.setattr(converter, 'FREQUENCY_DICTIONARY', dictionary)
+    page = canvas.Canvas(str(tmp_path / 'a.pdf'))
+    page.drawString(100, 700, 'hello world')
+    page.save()
+
+    # Without symspellpy the text comes from pyspell and must not count as symspell output
+    with monkeypatch.context() as patch:
+        patch.setattr(converter, 'SymSpell', None)
+        report = json.loads(converter.run(tmp_path, backend='symspell', spell_cache=False).read_text())
+    assert report[0]['spell_checker'] == 'pyspell'
+    report = json.loads(converter.run(tmp_path, backend='symspell', spell_cache=False).read_text())
+    assert report[0]['spell_checker'] == 'symspell'
+    assert 'skipped' not in report[1]
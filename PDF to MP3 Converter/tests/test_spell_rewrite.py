@@ -0,0 +1,65 @@
+import random
+import re
+
+import pytest
+
+from spell_rewrite import apply_corrections, apply_literal_corrections
+
+
+def per_word_sub(text, corrections):
+    # What the spell-check functions did before spell_rewrite
+    for wrong, right in corrections.items():
+        text = re.sub(rf"\b{re.escape(wrong)}\b", right, text)
+    return text
+
+
+def literal_loop(text, corrections):
+    # What the text and audio converters did before spell_rewrite
+    for wrong, right in corrections.items():
+        text = re.sub(rf"\\b{re.escape(wrong)}\\b", right, text)
+    return text
+
+
+def test_matches_the_per_word_loop():
+    rng = random.Random(0)
+    words = [''.join(rng.choices('abcdefgh', k=rng.randint(2, 8))) for _ in range(300)]
+    # Misspellings contain a 'z' and replacements never do, so no replacement is corrected again
+    corrections = {word[:1] + 'z' + word[1:]: word for word in words}
+    vocabulary = list(corrections) + words + ["don't", 'x-ray', "'quoted'", 'ÜBER', '42']
+    text = ''.join(rng.choice(vocabulary) + rng.choice((' ', ', ', '.\n', '-', "'")) for _ in range(5000))
+    assert apply_corrections(text, corrections) == per_word_sub(text, corrections)
+
+
+def test_whole_words_only_and_longest_first():
+    corrections = {'teh': 'the', 'tehm': 'them', 'adn': 'and'}
+    assert apply_corrections('teh tehm tehmx xteh adn, adn.', corrections) == 'the them tehmx xteh and, and.'
+
+
+def test_replacements_are_not_corrected_again():
+    assert apply_corrections('a b', {'a': 'b', 'b': 'c'}) == 'b c'
+
+
+def test_no_corrections_returns_the_text():
+    assert apply_corrections('text', {}) == 'text'
+    assert apply_corrections('text', {'': 'x'}) == 'text'
+
+
+def test_literal_corrections_match_the_converters_loop():
+    rng = random.Random(1)
+    corrections = {'ab': 'ba', 'b': 'ab', 'abc': 'c', 'c': '\\b'}
+    pieces = ['ab', 'b', 'abc', 'c', '\\b', ' ', 'x']
+    for _ in range(500):
+        text = ''.join(rng.choices(pieces, k=12))
+        assert apply_literal_corrections(text, corrections) == literal_loop(text, corrections)
+
+
+@pytest.mark.parametrize('module', ['pdf_to_text_converter', 'pdf_to_audio_converter'])
+def test_converters_output_is_unchanged(module):
+    module = pytest.importorskip(module)
+    text = 'The quick brown fox jumpd over the lazzy dog. \\bjumpd\\b'
+    if hasattr(module, 'SpellEngine'):
+        fixed, changes = module.SpellEngine('pyspell').correct(text)
+    else:
+        fixed, changes = module.spellcheck(text)
+    assert changes
+    assert fixed == literal_loop(text, changes)
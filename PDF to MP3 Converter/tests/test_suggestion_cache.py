@@ -0,0 +1,69 @@
+from suggestion_cache import SuggestionCache, summarize
+
+
+class Counting:
+    def __init__(self, suggestions):
+        self.suggestions, self.calls = suggestions, []
+
+    def __call__(self, word):
+        self.calls.append(word)
+        return self.suggestions.get(word)
+
+
+def test_words_are_computed_once_including_no_suggestion():
+    compute = Counting({'teh': 'the'})
+    cache = SuggestionCache('pyspell', 'en')
+    assert [cache.suggest(w, compute) for w in ('teh', 'zxq', 'teh', 'zxq')] == ['the', None, 'the', None]
+    assert compute.calls == ['teh', 'zxq']
+    assert cache.stats() == {'memory_hits': 2, 'disk_hits': 0, 'misses': 2}
+
+
+def test_memory_is_a_bounded_lru():
+    compute = Counting({})
+    cache = SuggestionCache('pyspell', 'en', maxsize=2)
+    for word in ('a', 'b', 'a', 'c', 'a', 'b'):
+        cache.suggest(word, compute)
+    assert compute.calls == ['a', 'b', 'c', 'b']
+    assert list(cache.memory) == ['a', 'b']
+
+
+def test_flushed_suggestions_are_shared_through_disk(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    first = SuggestionCache('symspell', 'en', path)
+    first.suggest('teh', Counting({'teh': 'the'}))
+    first.suggest('zxq', Counting({}))
+    first.close()
+
+    compute = Counting({})
+    second = SuggestionCache('symspell', 'en', path)
+    assert second.suggest('teh', compute) == 'the'
+    assert second.suggest('zxq', compute) is None
+    assert compute.calls == []
+    assert second.stats()['disk_hits'] == 2
+
+    # Other backends and languages have their own entries
+    other = SuggestionCache('pyspell', 'en', path)
+    assert other.suggest('teh', Counting({'teh': 'ten'})) == 'ten'
+
+
+def test_summarize():
+    stats = [{'memory_hits': 3, 'disk_hits': 1, 'misses': 0}, {'memory_hits': 0, 'disk_hits': 0, 'misses': 4}]
+    assert summarize(stats) == {'memory_hits': 3, 'disk_hits': 1, 'misses': 4, 'hit_rate': 0.5}
+    assert summarize([])['hit_rate'] is None
+
+
+def test_rows_from_other_backend_data_are_dropped(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    old = SuggestionCache('symspell', 'en', path, version='dictionary 1')
+    old.suggest('teh', Counting({'teh': 'ten'}))
+    other = SuggestionCache('pyspell', 'en', path, version='pyspellchecker 1')
+    other.suggest('teh', Counting({'teh': 'tea'}))
+    old.close()
+    other.close()
+
+    assert SuggestionCache('symspell', 'en', path, version='dictionary 1').suggest('teh', Counting({})) == 'ten'
+    compute = Counting({'teh': 'the'})
+    assert SuggestionCache('symspell', 'en', path, version='dictionary 2').suggest('teh', compute) == 'the'
+    assert compute.calls == ['teh']
+    # Other backends keep their rows
+    assert SuggestionCache('pyspell', 'en', path, version='pyspellchecker 1').suggest('teh', Counting({})) == 'tea'
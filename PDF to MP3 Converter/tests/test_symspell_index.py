@@ -0,0 +1,65 @@
+import random
+import string
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+pytest.importorskip('symspellpy')
+from symspellpy import Verbosity
+
+from symspell_index import build_index, build_symspell, index_path, load_symspell
+
+WORDS = {'the': 500, 'quick': 40, 'brown': 30, 'fox': 20, 'jumps': 10, 'over': 90, 'lazy': 5, 'dog': 25}
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    path = tmp_path / 'words.txt'
+    path.write_text(''.join(f"{word} {count}\n" for word, count in WORDS.items()), encoding='utf-8')
+    return path
+
+
+def suggestions(sym, words=('teh', 'quikc', 'brwn', 'fx', 'lazzy', 'zzzzzz')):
+    return [[s.term for s in sym.lookup(word, Verbosity.CLOSEST, max_edit_distance=2)] for word in words]
+
+
+def test_index_loads_the_same_dictionary(dictionary):
+    built = load_symspell(dictionary)
+    assert index_path(dictionary).exists()
+    loaded = load_symspell(dictionary)
+    assert suggestions(loaded) == suggestions(built) == suggestions(build_symspell(dictionary))
+
+
+def test_changed_dictionary_replaces_the_index(dictionary):
+    old = build_index(dictionary)
+    with open(dictionary, 'a', encoding='utf-8') as f:
+        f.write('elephant 7\n')
+    new = build_index(dictionary)
+    assert new != old and new.exists() and not old.exists()
+    assert suggestions(load_symspell(dictionary), ['elefant']) == [['elephant']]
+
+
+def _load(dictionary):
+    return suggestions(load_symspell(dictionary))
+
+
+def test_concurrent_first_loads(dictionary):
+    # Large enough that the workers' builds overlap
+    rng = random.Random(0)
+    with open(dictionary, 'a', encoding='utf-8') as f:
+        for count in range(3000):
+            f.write(f"{''.join(rng.choices(string.ascii_lowercase, k=rng.randint(6, 10)))} {count + 1}\n")
+    with ProcessPoolExecutor(6) as pool:
+        results = list(pool.map(_load, [dictionary] * 6))
+    assert results == [suggestions(build_symspell(dictionary))] * 6
+    assert sorted(p.name for p in dictionary.parent.iterdir()) == sorted(['words.txt', index_path(dictionary).name])
+
+
+def test_edited_dictionary_invalidates_cached_suggestions_and_outputs(dictionary, monkeypatch):
+    converter = pytest.importorskip('pdf_to_text_converter')
+    monkeypatch.setattr(converter, 'FREQUENCY_DICTIONARY', dictionary)
+    before = converter.backend_data_version('symspell')
+    with open(dictionary, 'a', encoding='utf-8') as f:
+        f.write('elephant 7\n')
+    # Used as the suggestion cache version and in the manifest fingerprint
+    assert converter.backend_data_version('symspell') != before
@@ -0,0 +1,57 @@
+import random
+import re
+
+import pytest
+
+from text_cleaner import LIGATURES, SMART_QUOTES, TextCleaner, clean_in_passes, join_broken_word
+
+# The patterns each script used before the fused cleaner, applied in the same order
+OLD_PATTERNS = {
+    'pdf_batch_cleaner': (r"([A-Za-z])-\n([a-z])", r" {2,}", r"\s*\n\s+"),
+    'pdf_to_text_converter': (r"([A-Za-z])-?\\n([a-z])", r" {2,}", r"\\s*\\n\\s*"),
+    'pdf_to_audio_converter': (r"([A-Za-z])-\\n([a-z])", r" {2,}", r"\\s*\\n\\s+"),
+}
+
+
+def three_passes(raw, patterns):
+    hyphen_break, multi_space, line_end_hard = map(re.compile, patterns)
+    txt = hyphen_break.sub(lambda m: m.group(1) + m.group(2), raw)
+    return line_end_hard.sub(' ', multi_space.sub(' ', txt))
+
+
+def samples(count=20000, seed=0):
+    rng = random.Random(seed)
+    pieces = ['a', 's', 'n', 'Word', '-', '\\', ' ', '  ', '\n', '\t', '\\n', '\\s', '-\n', '-\\n']
+    for _ in range(count):
+        yield ''.join(rng.choice(pieces) for _ in range(rng.randint(1, 16)))
+    words = ['the', 'extraordinary', 'consciousness', 'of', 'a', 'Mind']
+    for _ in range(200):
+        yield ''.join(rng.choice(words) + rng.choice([' ', ' ', '  ', '-\n', '\n', '\n   ', '\\n', '-\\n'])
+                      for _ in range(200))
+
+
+@pytest.mark.parametrize('module', sorted(OLD_PATTERNS))
+def test_clean_text_matches_the_three_passes(module):
+    clean_text = pytest.importorskip(module).clean_text
+    # Only the text is compared: spaces merged into a line break now count as one fix
+    for raw in samples():
+        assert clean_text(raw)[0] == three_passes(raw, OLD_PATTERNS[module]), repr(raw)
+
+
+def test_every_fix_is_counted():
+    cleaner = TextCleaner([('hyphen_join', r"(?<=[A-Za-z])-\n(?=[a-z])", join_broken_word),
+                           ('multispace', r" {2,}", ' ')])
+    assert cleaner.clean("a  b   c-\nd e-\nf") == ("a b cd ef", {'multispace': 2, 'hyphen_join': 2})
+    # The old pattern consumed both letters, so a break right after a joined one stays
+    assert cleaner.clean("a-\nb-\nc") == ("ab-\nc", {'hyphen_join': 1})
+
+
+def test_clean_in_passes_applies_rules_in_order():
+    rules = [('x_to_y', 'x', 'y'), ('y_to_z', 'y', 'z')]
+    assert clean_in_passes('xy', rules) == ('zz', {'x_to_y': 1, 'y_to_z': 2})
+    assert TextCleaner(rules).clean('xy') == ('yz', {'x_to_y': 1, 'y_to_z': 1})
+
+
+def test_ligatures_and_smart_quotes():
+    cleaner = TextCleaner([LIGATURES, SMART_QUOTES])
+    assert cleaner.clean("“ﬁne” oﬃce’s") == ('"fine" office\'s', {'smart_quote': 3, 'ligature': 2})
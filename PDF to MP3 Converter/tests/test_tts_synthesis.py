@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+import tts_synthesis
+from tts_synthesis import FakeSynthesizer, split_text, synthesize_to_file
+
+TEXT = "\n\n".join(f"Paragraph {p}. " + " ".join(f"Sentence {p}.{s} has a few words." for s in range(8))
+                   for p in range(12))
+
+
+def expected_audio(text, max_chars, voice='v'):
+    fake = FakeSynthesizer()
+    return b''.join(asyncio.run(fake.synthesize(chunk, voice)) for chunk in split_text(text, max_chars))
+
+
+def test_split_text_keeps_every_word_within_the_limit():
+    chunks = split_text(TEXT + " " + "x" * 250, max_chars=100)
+    assert all(0 < len(chunk) <= 100 for chunk in chunks)
+    assert "".join(" ".join(chunks).split()) == "".join((TEXT + " " + "x" * 250).split())
+
+
+@pytest.mark.parametrize('concurrency', [1, 4])
+def test_chunks_are_written_in_order(tmp_path, concurrency):
+    out = tmp_path / 'book.mp3'
+    stats = asyncio.run(synthesize_to_file(TEXT, 'v', out, FakeSynthesizer(delay=0.001), concurrency, max_chars=80))
+    assert out.read_bytes() == expected_audio(TEXT, 80)
+    assert stats['chunks'] == len(split_text(TEXT, 80)) and stats['retries'] == 0
+
+
+def test_failed_chunks_are_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(tts_synthesis, 'RETRY_DELAY', 0)
+    out = tmp_path / 'book.mp3'
+    stats = asyncio.run(synthesize_to_file(TEXT, 'v', out, FakeSynthesizer(failures=2), max_chars=200, retries=2))
+    assert out.read_bytes() == expected_audio(TEXT, 200)
+    assert stats['retries'] == 2 * stats['chunks']
+
+
+def test_a_chunk_out_of_retries_leaves_no_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(tts_synthesis, 'RETRY_DELAY', 0)
+    out = tmp_path / 'book.mp3'
+    with pytest.raises(ConnectionError):
+        asyncio.run(synthesize_to_file(TEXT, 'v', out, FakeSynthesizer(failures=3), max_chars=200, retries=2))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_single_job_run_prepares_pdfs_without_a_process_pool(tmp_path, monkeypatch):
+    canvas = pytest.importorskip('reportlab.pdfgen.canvas')
+    converter = pytest.importorskip('pdf_to_audio_converter')
+    page = canvas.Canvas(str(tmp_path / 'a.pdf'))
+    page.drawString(100, 700, 'hello world')
+    page.save()
+
+    extract_workers = []
+    extract_pages = converter.extract_pages
+    monkeypatch.setattr(converter, 'extract_pages',
+                        lambda path, workers: extract_workers.append(workers) or extract_pages(path, workers))
+    monkeypatch.setattr(converter, 'ProcessPoolExecutor', lambda *args, **kwargs: pytest.fail('pool created'))
+    asyncio.run(converter.run(tmp_path, workers=3, synthesizer=FakeSynthesizer(), cache_bytes=0, jobs=1))
+    # Extraction runs in this process, so it may still use its own pool of page workers
+    assert extract_workers == [3]
+    assert (tmp_path / 'a.mp3').read_bytes()
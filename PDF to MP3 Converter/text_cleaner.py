@@ -0,0 +1,77 @@
+# Single-pass text cleaner
+#
+# clean_text() used to run one re.sub() per rule over the whole document and
+# compare the result with its input after each pass, only to record 0 or 1 per
+# rule.  TextCleaner joins every rule into one alternation of named groups and
+# rewrites the text in a single linear pass, counting every individual fix.
+#
+# A rule is (name, pattern, replacement).  The replacement is a string, or a
+# function of (match, end of this rule's previous fix or -1) that returns the new
+# text, or None to leave the match alone without counting it.  Rules are tried
+# in list order at each position, so put a rule before any rule that would match
+# a prefix of its matches (e.g. line-break merging before multi-space collapsing).
+# `starts` is a character class body covering the first character of every
+# possible match; it lets the regex engine skip straight to candidate positions.
+# Adding a rule, such as LIGATURES or SMART_QUOTES below, adds no extra pass.
+#
+# A single pass gives the same text as one pass per rule unless a fix of one rule
+# can create, destroy or overlap a match of another.  clean_in_passes() keeps the
+# one-pass-per-rule behaviour for the inputs where that can happen.
+
+import re
+from collections import Counter
+from functools import lru_cache
+
+def join_broken_word(m: re.Match, previous_end: int) -> str | None:
+    """Removes a line break matched between two letters with lookarounds.  The old
+    ([A-Za-z])-\\n([a-z]) pattern consumed both letters, so a break right after the
+    letter that the previous join consumed was left as it was; keep doing that."""
+    return None if previous_end == m.start() - 1 else ''
+
+# Ready-made rules for text extracted from typeset PDFs
+LIGATURE_MAP = {'ﬀ': 'ff', 'ﬁ': 'fi', 'ﬂ': 'fl', 'ﬃ': 'ffi', 'ﬄ': 'ffl', 'ﬅ': 'st', 'ﬆ': 'st'}
+QUOTE_MAP = {'‘': "'", '’': "'", '‚': "'", '“': '"', '”': '"', '„': '"'}
+LIGATURES = ('ligature', '[' + ''.join(LIGATURE_MAP) + ']', lambda m, _: LIGATURE_MAP[m.group()])
+SMART_QUOTES = ('smart_quote', '[' + ''.join(QUOTE_MAP) + ']', lambda m, _: QUOTE_MAP[m.group()])
+
+class TextCleaner:
+    def __init__(self, rules: list[tuple], starts: str | None = None):
+        self.replacements = {}
+        branches = []
+        for name, pattern, replacement in rules:
+            branches.append(f"(?P<{name}>{pattern})")
+            self.replacements[name] = replacement
+        guard = f"(?=[{starts}])" if starts else ''
+        self.pattern = re.compile(guard + '(?:' + '|'.join(branches) + ')')
+
+    def clean(self, text: str) -> tuple[str, dict]:
+        """Returns the cleaned text and the number of fixes made by each rule."""
+        fixes = Counter()
+        previous_end = {}
+
+        def fix(m: re.Match) -> str:
+            # Inner groups close before their rule's group, so lastgroup is the rule
+            name = m.lastgroup
+            replacement = self.replacements[name]
+            if not isinstance(replacement, str):
+                replacement = replacement(m, previous_end.get(name, -1))
+                if replacement is None:
+                    return m.group()
+            fixes[name] += 1
+            previous_end[name] = m.end()
+            return replacement
+
+        return self.pattern.sub(fix, text), dict(fixes)
+
+@lru_cache(maxsize=None)
+def _single_rule(rule: tuple) -> TextCleaner:
+    return TextCleaner([rule])
+
+def clean_in_passes(text: str, rules: list[tuple]) -> tuple[str, dict]:
+    """Applies the rules one after another, one pass over the text each, and returns
+    the cleaned text and the number of fixes made by each rule."""
+    fixes = Counter()
+    for rule in rules:
+        text, counts = _single_rule(rule).clean(text)
+        fixes.update(counts)
+    return text, dict(fixes)
@@ -0,0 +1,153 @@
+# Chunked, concurrent text-to-speech
+#
+# A whole book sent to one edge_tts.Communicate() call is synthesized serially,
+# fails completely on any network hiccup and is held in memory until it is saved.
+# synthesize_to_file() splits the text on paragraph and sentence boundaries into
+# chunks of at most CHUNK_CHARS characters, synthesizes them concurrently under a
+# semaphore, retries failed chunks on their own, and appends the MP3 segments to
+# the output strictly in order.  At most a window of segments is in flight, so
+# memory is bounded regardless of the book's length.
+#
+# Synthesizers are pluggable: anything with an async synthesize(text, voice) that
+# returns MP3 bytes, and a settings() dict of everything else that affects the audio
+# (used in audio cache keys).  FakeSynthesizer needs no network and can inject
+# failures.  With an AudioChunkCache, chunks synthesized before are read from disk.
+
+import asyncio, os, re, zlib
+from collections import deque
+from pathlib import Path
+
+from audio_cache import chunk_key
+
+CHUNK_CHARS = 3000          # Upper bound on the text in one request
+CONCURRENCY = 4             # Requests in flight at once
+RETRIES = 3                 # Extra attempts per chunk
+RETRY_DELAY = 1.0           # Seconds before the first retry, doubled for each one
+
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+def _pieces(text: str, max_chars: int):
+    """Yields paragraphs, else sentences, else words, else slices no longer than max_chars."""
+    for paragraph in PARAGRAPH_BREAK.split(text):
+        paragraph = paragraph.strip()
+        if len(paragraph) <= max_chars:
+            yield paragraph
+            continue
+        for sentence in SENTENCE_END.split(paragraph):
+            if len(sentence) <= max_chars:
+                yield sentence
+                continue
+            for word in sentence.split():
+                for start in range(0, len(word), max_chars):
+                    yield word[start:start + max_chars]
+
+def split_text(text: str, max_chars: int = CHUNK_CHARS) -> list[str]:
+    """Packs consecutive pieces of text into chunks of at most max_chars characters."""
+    chunks, current = [], ''
+    for piece in _pieces(text, max_chars):
+        if not piece:
+            continue
+        if current and len(current) + 1 + len(piece) > max_chars:
+            chunks.append(current)
+            current = ''
+        current = f"{current} {piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+class EdgeSynthesizer:
+    """Microsoft Edge online TTS via edge-tts."""
+
+    def __init__(self, rate: str = '+0%', pitch: str = '+0Hz'):
+        self.rate, self.pitch = rate, pitch
+
+    def settings(self) -> dict:
+        return {'backend': 'edge-tts', 'rate': self.rate, 'pitch': self.pitch}
+
+    async def synthesize(self, text: str, voice: str) -> bytes:
+        import edge_tts
+        audio = bytearray()
+        async for message in edge_tts.Communicate(text, voice, rate=self.rate, pitch=self.pitch).stream():
+            if message['type'] == 'audio':
+                audio += message['data']
+        if not audio:
+            raise RuntimeError('edge-tts returned no audio')
+        return bytes(audio)
+
+class FakeSynthesizer:
+    """Offline stand-in for tests: returns deterministic bytes for each chunk and
+    fails the first `failures` attempts of every chunk it is given."""
+
+    def __init__(self, delay: float = 0.0, failures: int = 0):
+        self.delay, self.failures = delay, failures
+        self.attempts = {}
+        self.calls = 0
+
+    def settings(self) -> dict:
+        return {'backend': 'fake'}
+
+    async def synthesize(self, text: str, voice: str) -> bytes:
+        self.calls += 1
+        self.attempts[text] = self.attempts.get(text, 0) + 1
+        await asyncio.sleep(self.delay)
+        if self.attempts[text] <= self.failures:
+            raise ConnectionError('fake synthesizer failure')
+        return f"[{voice}:{zlib.crc32(text.encode('utf-8')):08x}]".encode('ascii')
+
+async def _synthesize_chunk(synthesizer, text: str, voice: str, semaphore: asyncio.Semaphore,
+                            retries: int, stats: dict, cache=None) -> bytes:
+    if cache:
+        key = chunk_key(text, voice, synthesizer.settings())
+        audio = cache.get(key)
+        if audio is not None:
+            stats['cache_hits'] += 1
+            return audio
+        stats['cache_misses'] += 1
+
+    for attempt in range(retries + 1):
+        try:
+            async with semaphore:
+                audio = await synthesizer.synthesize(text, voice)
+            break
+        except Exception:
+            if attempt == retries:
+                raise
+            stats['retries'] += 1
+            await asyncio.sleep(RETRY_DELAY * 2 ** attempt)
+    if cache:
+        cache.put(key, audio)
+    return audio
+
+async def synthesize_to_file(text: str, voice: str, out_path: Path, synthesizer=None,
+                             concurrency: int = CONCURRENCY, max_chars: int = CHUNK_CHARS,
+                             retries: int = RETRIES, cache=None) -> dict:
+    """Synthesizes text chunk by chunk into out_path and returns chunk statistics.
+    The file is only replaced once every chunk has been synthesized."""
+    synthesizer = synthesizer or EdgeSynthesizer()
+    chunks = split_text(text, max_chars)
+    semaphore = asyncio.Semaphore(concurrency)
+    stats = {'chunks': len(chunks), 'retries': 0, 'audio_bytes': 0, 'cache_hits': 0, 'cache_misses': 0}
+
+    tmp = out_path.with_suffix(out_path.suffix + '.part')
+    pending = deque()
+    try:
+        with open(tmp, 'wb') as out:
+            for chunk in chunks:
+                pending.append(asyncio.ensure_future(
+                    _synthesize_chunk(synthesizer, chunk, voice, semaphore, retries, stats, cache)))
+                # Keep a bounded window in flight and write the oldest segment first
+                if len(pending) >= concurrency * 2:
+                    stats['audio_bytes'] += out.write(await pending.popleft())
+            while pending:
+                stats['audio_bytes'] += out.write(await pending.popleft())
+        os.replace(tmp, out_path)
+    finally:
+        for task in pending:
+            task.cancel()
+        tmp.unlink(missing_ok=True)
+        if cache:
+            evicted = cache.evictions
+            cache.evict()
+            stats['cache_evictions'] = cache.evictions - evicted
+    return stats
@@ -24,18 +24,234 @@ HOW IT WORKS:
    - By default, the script saves the QR code image to 'qrcode.png' in the
      current directory.
    - You can specify a different directory and filename if you wish.
+   - render_qr_bytes() returns the encoded file in memory instead; qr_server.py
+     uses it to serve codes over HTTP from a warm process pool.
+
+4. Vector Output:
+   - A filename ending in .svg or .pdf writes the code as vector graphics
+     instead of a raster image (see qr_vector.py). Dark modules are merged
+     into one rectangle per run in each row, so the file stays small at any
+     print size. The logos and text overlay are placed as in the PNG.
+   - generate_qr_pdf_sheet() lays out many codes per page in a multi-page
+     PDF, e.g. for badges or labels:
+       python QR_code_generator.py --batch badges.csv --pdf-sheet badges.pdf
+
+5. Batch Mode:
+   - Reads rows of (data, filename, optional text) from a CSV or JSONL file
+     and generates the codes in parallel over a process pool.
+   - Writes a JSON manifest with per-item timing and failures, and reports
+     throughput in codes per second.
+   - Example:
+       python QR_code_generator.py --batch badges.csv -o badges/ --logo logo.png
+   - With --sheets, the codes are laid out on large raster sheets (e.g. A4
+     at 300 dpi) with optional captions, and each sheet is written once
+     instead of one file per code:
+       python QR_code_generator.py --batch labels.csv -o sheets/ --sheets --captions
+
+6. Auto-Tuning:
+   - With autotune=True (or --autotune), the code is rendered with its logos
+     and text and read back with a QR decoder (pyzbar or OpenCV), to find
+     the smallest version that still scans and the strongest error
+     correction that fits in it. The batch manifest records the chosen
+     version and error correction level for each code.
+
+7. Output Cache:
+   - With cache_path (or --cache), outputs whose parameters and logo/font
+     files are unchanged since the last run are not rendered again
+     (see qr_cache.py). A batch only sends the changed rows to the pool.
 
 Dependencies:
 -------------
 - qrcode (pip install qrcode)
 - Pillow (pip install Pillow)
+- NumPy (optional, pip install numpy) for renderer="numpy"
+- pyzbar or OpenCV (optional, pip install pyzbar / opencv-python) for autotune
 
 """
 
 
+import argparse
+import csv
+import datetime
+import functools
+import inspect
+import io
+import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import qrcode
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+from qr_cache import CACHE_FILENAME, QRCache, cache_key, file_digest, open_cache
+from qr_vector import A4, LETTER, PdfSheetWriter, qr_svg
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from pyzbar import pyzbar
+except ImportError:
+    pyzbar = None
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+
+# Error correction levels by name, for the batch command line.
+ERROR_CORRECTION_LEVELS = {
+    'L': qrcode.constants.ERROR_CORRECT_L,
+    'M': qrcode.constants.ERROR_CORRECT_M,
+    'Q': qrcode.constants.ERROR_CORRECT_Q,
+    'H': qrcode.constants.ERROR_CORRECT_H,
+}
+
+# Extra versions tried past the smallest H-level fit before autotune gives up.
+AUTOTUNE_EXTRA_VERSIONS = 2
+
+# Page sizes for --pdf-sheet, in PDF points.
+PAGE_SIZES = {'a4': A4, 'letter': LETTER}
+
+# Sheet sizes for --sheets, in pixels at 300 dpi.
+SHEET_SIZES = {'a4': (2480, 3508), 'letter': (2550, 3300)}
+
+# Number of decoded logos and loaded fonts kept in memory per process.
+LOGO_CACHE_SIZE = 32
+FONT_CACHE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=LOGO_CACHE_SIZE)
+def _cached_logo(path, mtime_ns, size):
+    logo = Image.open(path)
+    logo.thumbnail((size, size), Image.Resampling.LANCZOS)
+    logo.load()
+    return logo
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def _cached_font(path, mtime_ns, size):
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def _default_font(size=None):
+    # load_default(size) needs Pillow 10.1+; without a size it is the original fixed-size font
+    return ImageFont.load_default(size) if size else ImageFont.load_default()
+
+
+def load_logo(path, size):
+    """
+    Returns the image at path, decoded and resized to fit in a size x size box.
+
+    Results are cached by (path, modification time, size), so a batch that reuses
+    the same logo only decodes and resizes it once per process.
+    """
+    return _cached_logo(os.path.abspath(path), os.stat(path).st_mtime_ns, size)
+
+
+def load_font(path, size, size_default=False):
+    """
+    Returns the TrueType font at path in the given size, or PIL's default font
+    if no valid path is given (in the given size too, with size_default=True).
+    Fonts are cached like logos.
+    """
+    if path and os.path.isfile(path):
+        return _cached_font(os.path.abspath(path), os.stat(path).st_mtime_ns, size)
+    return _default_font(size if size_default else None)
+
+
+def _rgb(color):
+    # Resolve a color name, hex string or tuple to an (r, g, b) tuple
+    if isinstance(color, str):
+        return ImageColor.getcolor(color, "RGB")
+    return tuple(color)[:3]
+
+
+def render_qr_matrix(qr, fill_color="black", back_color="white"):
+    """
+    Renders a made qrcode.QRCode straight from its module matrix with NumPy.
+
+    The boolean matrix (border included) is mapped through a two-entry color
+    table and widened by box_size once, then broadcast box_size times into a
+    preallocated RGB buffer that PIL takes over in a single fromarray call.
+    This gives the same pixels as qr.make_image(...).convert("RGB") without
+    drawing every box through PIL or converting the color mode afterwards.
+
+    :param qr: A qrcode.QRCode on which make() has been called.
+    :param fill_color: Color of the QR code modules.
+    :param back_color: Background color.
+    :return: RGB PIL image.
+    """
+    modules = np.array(qr.get_matrix(), dtype=np.uint8)
+    palette = np.array([_rgb(back_color), _rgb(fill_color)], dtype=np.uint8)
+    count, box = len(modules), qr.box_size
+    pixels = np.empty((count * box, count * box, 3), dtype=np.uint8)
+    # Every module row becomes one pixel row, written box times through a (row, box) view
+    pixels.reshape(count, box, count * box, 3)[...] = palette[modules].repeat(box, axis=1)[:, np.newaxis]
+    return Image.fromarray(pixels)
+
+
+def vector_overlays(size, logo_path=None, corner_logo_path=None, text=None, text_font_path=None,
+                    text_size=20, text_color="black", logo_scale=0.25):
+    """
+    Computes the logo and text placement for a vector code, with the same
+    positions the raster path uses for a size x size pixel image.
+
+    :return: ([(logo image, x, y), ...], text dict for qr_svg/draw_code or None).
+    """
+    images = []
+    if logo_path and os.path.isfile(logo_path):
+        logo = load_logo(logo_path, int(size * logo_scale))
+        images.append((logo, (size - logo.width) // 2, (size - logo.height) // 2))
+    if corner_logo_path and os.path.isfile(corner_logo_path):
+        corner_logo = load_logo(corner_logo_path, int(size * 0.15))
+        images.append((corner_logo, size - corner_logo.width - 10, size - corner_logo.height - 10))
+
+    text_spec = None
+    if text:
+        font = load_font(text_font_path, text_size)
+        left, top, right, bottom = font.getbbox(text)
+        text_y = size - (bottom - top) - 20
+        # PIL places text by its top edge, vector formats by the baseline
+        ascent = font.getmetrics()[0] if hasattr(font, 'getmetrics') else int(text_size * 0.8)
+        text_spec = {
+            'text': text,
+            'x': (size - (right - left)) // 2,
+            'baseline': text_y + ascent,
+            'family': font.getname()[0] if hasattr(font, 'getname') else 'sans-serif',
+            'size': getattr(font, 'size', text_size),
+            'color': text_color
+        }
+    return images, text_spec
+
+
+def output_cache_key(data, filename, error_correction, box_size, border, fill_color, back_color,
+                     logo_path, corner_logo_path, text, text_font_path, text_size, text_color,
+                     version=None, logo_scale=0.25, autotune=False):
+    """Returns the cache key of a generate_qr_code() output (the renderer does not change the pixels)."""
+    return cache_key(
+        data=data,
+        format=os.path.splitext(filename)[1].lower(),
+        error_correction=error_correction,
+        box_size=box_size,
+        border=border,
+        fill_color=fill_color,
+        back_color=back_color,
+        logo=file_digest(logo_path),
+        corner_logo=file_digest(corner_logo_path),
+        text=text,
+        font=file_digest(text_font_path),
+        text_size=text_size,
+        text_color=text_color,
+        version=version,
+        logo_scale=logo_scale,
+        autotune=autotune
+    )
 
 
 def generate_qr_code(
@@ -52,14 +268,20 @@ def generate_qr_code(
     text=None,
     text_font_path=None,
     text_size=20,
-    text_color="black"
+    text_color="black",
+    verbose=True,
+    renderer="pil",
+    cache_path=None,
+    version=None,
+    logo_scale=0.25,
+    autotune=False
 ):
     """
     Generates a QR code with customization options.
 
     :param data: Text or URL to encode in the QR code.
     :param save_directory: Directory path where the QR code will be saved.
-    :param filename: Name of the output image file.
+    :param filename: Name of the output file; .svg and .pdf write vector output.
     :param error_correction: Error correction level from qrcode.constants.
     :param box_size: Pixel size of each 'box' in the QR code.
     :param border: Thickness of the border (in boxes).
@@ -71,27 +293,149 @@ def generate_qr_code(
     :param text_font_path: (Optional) Path to a .ttf font file for the text.
     :param text_size: Font size for the overlay text.
     :param text_color: Color of the overlay text.
+    :param verbose: Print the path of the saved image.
+    :param renderer: "pil" (default) or "numpy" to render straight from the module
+                     matrix. Falls back to "pil" without NumPy or for a transparent background.
+    :param cache_path: (Optional) Path of a qr_cache index; an unchanged output is not rendered again.
+    :param version: QR version (1-40), or None for the smallest that fits the data.
+    :param logo_scale: Width of the center logo as a fraction of the code width.
+    :param autotune: Choose the version and error correction with autotune_qr_code().
+    :return: Path of the saved file.
+    """
+
+    # Ensure the save directory exists
+    os.makedirs(save_directory, exist_ok=True)
+    full_path = os.path.join(save_directory, filename)
+
+    # Skip rendering if an up-to-date output already exists
+    if cache_path:
+        cache = open_cache(os.path.abspath(cache_path))
+        key = output_cache_key(data, filename, error_correction, box_size, border, fill_color, back_color,
+                               logo_path, corner_logo_path, text, text_font_path, text_size, text_color,
+                               version, logo_scale, autotune)
+        hit = cache.lookup(key, full_path)
+        cache.flush()
+        if hit:
+            if verbose:
+                print(f"QR code up to date: {full_path}")
+            return full_path
+
+    if autotune:
+        settings = autotune_qr_code(data, box_size, border, fill_color, back_color, logo_path, corner_logo_path,
+                                    text, text_font_path, text_size, text_color, logo_scale, renderer)
+        version = settings['version']
+        error_correction = ERROR_CORRECTION_LEVELS[settings['error_correction']]
+        if verbose:
+            print(f"Autotune: version {version}, error correction {settings['error_correction']}"
+                  + ("" if settings['decodable'] else " (did not decode)"))
+
+    _render_qr_code(data, full_path, os.path.splitext(filename)[1].lower().lstrip('.'), version, error_correction,
+                    box_size, border, fill_color, back_color, logo_path, logo_scale, corner_logo_path, text,
+                    text_font_path, text_size, text_color, renderer)
+    if cache_path:
+        cache.store(key, full_path)
+    if verbose:
+        print(f"QR code saved as: {full_path}")
+    return full_path
+
+
+def render_qr_bytes(
+    data,
+    output_format="png",
+    error_correction=qrcode.constants.ERROR_CORRECT_H,
+    box_size=10,
+    border=4,
+    fill_color="black",
+    back_color="white",
+    logo_path=None,
+    corner_logo_path=None,
+    text=None,
+    text_font_path=None,
+    text_size=20,
+    text_color="black",
+    renderer="pil",
+    version=None,
+    logo_scale=0.25,
+    autotune=False
+):
+    """
+    Generates a QR code in memory instead of saving it, e.g. for an HTTP response.
+
+    Takes the same options as generate_qr_code(), with output_format ("png",
+    "svg", "pdf" or any other Pillow format) in place of the filename.
+
+    :return: The encoded file as bytes.
     """
+    if autotune:
+        settings = autotune_qr_code(data, box_size, border, fill_color, back_color, logo_path, corner_logo_path,
+                                    text, text_font_path, text_size, text_color, logo_scale, renderer)
+        version = settings['version']
+        error_correction = ERROR_CORRECTION_LEVELS[settings['error_correction']]
+
+    buffer = io.BytesIO()
+    _render_qr_code(data, buffer, output_format.lower(), version, error_correction, box_size, border, fill_color,
+                    back_color, logo_path, logo_scale, corner_logo_path, text, text_font_path, text_size,
+                    text_color, renderer)
+    return buffer.getvalue()
 
+
+def _render_qr_code(data, destination, output_format, version, error_correction, box_size, border, fill_color,
+                    back_color, logo_path, logo_scale, corner_logo_path, text, text_font_path, text_size,
+                    text_color, renderer):
+    # destination is a file path or a binary file object
     # Initialize the QRCode object
     qr = qrcode.QRCode(
-        version=None,
+        version=version,
         error_correction=error_correction,
         box_size=box_size,
         border=border,
     )
     qr.add_data(data)
-    qr.make(fit=True)
+    qr.make(fit=version is None)
 
+    # Write vector output straight from the module matrix
+    if output_format in ('svg', 'pdf'):
+        matrix = qr.get_matrix()
+        size = len(matrix) * box_size
+        images, text_spec = vector_overlays(size, logo_path, corner_logo_path, text, text_font_path,
+                                            text_size, text_color, logo_scale)
+        if output_format == 'svg':
+            svg = qr_svg(matrix, box_size, fill_color, back_color, images, text_spec).encode('utf-8')
+            if isinstance(destination, str):
+                with open(destination, 'wb') as f:
+                    f.write(svg)
+            else:
+                destination.write(svg)
+        else:
+            with PdfSheetWriter(destination, page_size=(size, size)) as pdf:
+                pdf.draw_code(matrix, 0, 0, size, fill_color, back_color,
+                              [(image, x, y, image.width, image.height) for image, x, y in images], text_spec)
+        return
+
+    img = compose_qr_image(qr, fill_color, back_color, logo_path, logo_scale, corner_logo_path, text,
+                           text_font_path, text_size, text_color, renderer)
+
+    # Save the final image
+    if isinstance(destination, str):
+        img.save(destination)
+    else:
+        img.save(destination, format=output_format)
+
+
+def compose_qr_image(qr, fill_color="black", back_color="white", logo_path=None, logo_scale=0.25,
+                     corner_logo_path=None, text=None, text_font_path=None, text_size=20, text_color="black",
+                     renderer="pil"):
+    """Renders a made qrcode.QRCode with its logos and text overlay, and returns the RGB image."""
     # Generate the QR code image
-    img = qr.make_image(fill_color=fill_color, back_color=back_color).convert("RGB")
+    if renderer == "numpy" and np is not None and str(back_color).lower() != "transparent":
+        img = render_qr_matrix(qr, fill_color, back_color)
+    else:
+        img = qr.make_image(fill_color=fill_color, back_color=back_color).convert("RGB")
 
     # Add the center logo, if provided
     if logo_path and os.path.isfile(logo_path):
-        logo = Image.open(logo_path)
         qr_width, qr_height = img.size
-        logo_size = int(qr_width * 0.25)
-        logo.thumbnail((logo_size, logo_size), Image.Resampling.LANCZOS)
+        logo = load_logo(logo_path, int(qr_width * logo_scale))
 
         # Center the logo
         logo_x = (qr_width - logo.width) // 2
@@ -100,10 +444,8 @@ def generate_qr_code(
 
     # Add the corner logo, if provided
     if corner_logo_path and os.path.isfile(corner_logo_path):
-        corner_logo = Image.open(corner_logo_path)
         qr_width, qr_height = img.size
-        corner_logo_size = int(qr_width * 0.15)
-        corner_logo.thumbnail((corner_logo_size, corner_logo_size), Image.Resampling.LANCZOS)
+        corner_logo = load_logo(corner_logo_path, int(qr_width * 0.15))
 
         # Position the corner logo at the bottom-right
         corner_x = qr_width - corner_logo.width - 10
@@ -115,10 +457,7 @@ def generate_qr_code(
         draw = ImageDraw.Draw(img)
 
         # Use default font if no font path is provided
-        if text_font_path and os.path.isfile(text_font_path):
-            font = ImageFont.truetype(text_font_path, text_size)
-        else:
-            font = ImageFont.load_default()
+        font = load_font(text_font_path, text_size)
 
         # Calculate text position
         qr_width, qr_height = img.size
@@ -131,30 +470,519 @@ def generate_qr_code(
         # Draw the text
         draw.text((text_x, text_y), text, fill=text_color, font=font)
 
-    # Ensure the save directory exists
+    return img
+
+
+def decode_qr_image(img):
+    """
+    Returns the text of the QR code in a PIL image, or None if it cannot be read.
+
+    Uses pyzbar if it is installed, otherwise OpenCV.
+    """
+    if pyzbar is not None:
+        results = pyzbar.decode(img.convert("L"), symbols=[pyzbar.ZBarSymbol.QRCODE])
+        return results[0].data.decode("utf-8", "replace") if results else None
+    if cv2 is not None:
+        text, _, _ = cv2.QRCodeDetector().detectAndDecode(np.asarray(img.convert("L")))
+        return text or None
+    raise RuntimeError("autotune needs a QR decoder: pip install pyzbar (with the zbar library) or opencv-python")
+
+
+def autotune_qr_code(data, box_size=10, border=4, fill_color="black", back_color="white", logo_path=None,
+                     corner_logo_path=None, text=None, text_font_path=None, text_size=20, text_color="black",
+                     logo_scale=0.25, renderer="pil"):
+    """
+    Finds the smallest QR version that still decodes with the logos and text in place.
+
+    Versions are tried from the smallest that fits the data at level L upwards.
+    At each version the levels that fit are tried from strongest to weakest, since
+    a stronger level costs nothing once the size is fixed. If nothing decodes, the
+    smallest H-level fit is returned with decodable=False.
+
+    :return: {'version', 'error_correction' (L, M, Q or H), 'decodable', 'attempts'}.
+    """
+    smallest = {}
+    for name, level in ERROR_CORRECTION_LEVELS.items():
+        qr = qrcode.QRCode(error_correction=level)
+        qr.add_data(data)
+        smallest[name] = qr.best_fit()
+    last_version = min(40, smallest['H'] + AUTOTUNE_EXTRA_VERSIONS)
+
+    attempts = 0
+    for version in range(smallest['L'], last_version + 1):
+        for name in reversed(ERROR_CORRECTION_LEVELS):
+            if smallest[name] > version:
+                continue
+            qr = qrcode.QRCode(version=version, error_correction=ERROR_CORRECTION_LEVELS[name],
+                               box_size=box_size, border=border)
+            qr.add_data(data)
+            qr.make(fit=False)
+            img = compose_qr_image(qr, fill_color, back_color, logo_path, logo_scale, corner_logo_path, text,
+                                   text_font_path, text_size, text_color, renderer)
+            attempts += 1
+            if decode_qr_image(img) == data:
+                return {'version': version, 'error_correction': name, 'decodable': True, 'attempts': attempts}
+    return {'version': smallest['H'], 'error_correction': 'H', 'decodable': False, 'attempts': attempts}
+
+
+def read_batch_rows(rows_path):
+    """
+    Reads batch rows from a CSV file (with a header row) or a JSONL file.
+
+    Each row needs a 'data' value and may have 'filename' and 'text' values.
+
+    :param rows_path: Path to a .csv or .jsonl file.
+    :return: List of row dictionaries.
+    """
+    with open(rows_path, newline='', encoding='utf-8') as f:
+        if rows_path.lower().endswith(('.jsonl', '.json')):
+            return [json.loads(line) for line in f if line.strip()]
+        return list(csv.DictReader(f))
+
+
+def _batch_filename(index, row, output_format):
+    return row.get('filename') or f"qrcode-{index:05d}.{output_format}"
+
+
+def _generate_batch_item(task):
+    # Runs inside a worker process; failures are recorded instead of raised
+    index, row, output_format, options = task
+    filename = _batch_filename(index, row, output_format)
+    start = time.perf_counter()
+    result = {'index': index, 'filename': filename}
+    try:
+        if not row.get('data'):
+            raise ValueError("row has no 'data' value")
+        if options.get('autotune'):
+            # Tune here rather than inside generate_qr_code() so the manifest gets the settings
+            tune_options = {name: value for name, value in options.items()
+                            if name in inspect.signature(autotune_qr_code).parameters}
+            settings = autotune_qr_code(row['data'], text=row.get('text') or None, **tune_options)
+            result.update(settings)
+            options = dict(options, autotune=False, version=settings['version'],
+                           error_correction=ERROR_CORRECTION_LEVELS[settings['error_correction']])
+        result['path'] = generate_qr_code(row['data'], filename=filename, text=row.get('text') or None,
+                                          verbose=False, **options)
+    except Exception as e:
+        result['error'] = str(e)
+    result['elapsed_seconds'] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def generate_qr_batch(rows_path, save_directory='.', workers=None, output_format='png', cache_path=None,
+                      **options):
+    """
+    Generates one QR code per row of a CSV or JSONL file, in parallel.
+
+    :param rows_path: CSV or JSONL file with 'data', 'filename' and optional 'text' values.
+    :param save_directory: Directory where the QR codes and the manifest are saved.
+    :param workers: Number of worker processes (default = number of CPUs).
+    :param output_format: File extension for rows without a filename ("png", "svg" or "pdf").
+    :param cache_path: (Optional) Path of a qr_cache index; rows with an up-to-date output are skipped.
+    :param options: Any other generate_qr_code() arguments, applied to every code.
+    :return: Path of the JSON manifest.
+    """
+    rows = read_batch_rows(rows_path)
+    workers = workers or os.cpu_count() or 1
+    options = dict(options, save_directory=save_directory)
     os.makedirs(save_directory, exist_ok=True)
-    full_path = os.path.join(save_directory, filename)
 
-    # Save the final image
-    img.save(full_path)
-    print(f"QR code saved as: {full_path}")
+    start = time.perf_counter()
+    cache = QRCache(cache_path) if cache_path else None
+    if cache:
+        # Same defaults as generate_qr_code(), so the keys match single-code calls
+        params = {name: parameter.default for name, parameter in inspect.signature(generate_qr_code).parameters.items()
+                  if name in inspect.signature(output_cache_key).parameters}
+        params.update((name, value) for name, value in options.items() if name in params)
+
+    # Only rows without an up-to-date output are sent to the pool
+    items, tasks, keys = [], [], {}
+    for index, row in enumerate(rows):
+        if cache and row.get('data'):
+            filename = _batch_filename(index, row, output_format)
+            key = output_cache_key(**dict(params, data=row['data'], filename=filename, text=row.get('text') or None))
+            if cache.lookup(key, os.path.join(save_directory, filename)):
+                items.append({'index': index, 'filename': filename, 'path': os.path.join(save_directory, filename),
+                              'cached': True, 'elapsed_seconds': 0.0})
+                continue
+            keys[index] = key
+        tasks.append((index, row, output_format, options))
+
+    if tasks:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            items += pool.map(_generate_batch_item, tasks, chunksize=max(1, len(tasks) // (workers * 16)))
+        items.sort(key=lambda item: item['index'])
+    if cache:
+        for item in items:
+            if item['index'] in keys and 'path' in item:
+                cache.store(keys[item['index']], item['path'], commit=False)
+        cache.close()
+    elapsed = time.perf_counter() - start
+
+    failures = [item for item in items if 'error' in item]
+    for item in failures:
+        print(f"✗ {item['filename']}: {item['error']}")
+    metadata = {
+        'source': os.path.abspath(rows_path),
+        'workers': workers,
+        'codes_requested': len(items),
+        'codes_generated': len(items) - len(failures),
+        'failures': len(failures),
+        'cache_hits': len(items) - len(tasks),
+        'total_elapsed_seconds': round(elapsed, 2),
+        'codes_per_second': round(len(items) / elapsed, 1) if elapsed else 0.0,
+        'report_generated': datetime.datetime.now().isoformat()
+    }
+    manifest = [metadata] + items
+
+    ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    manifest_path = os.path.join(save_directory, f"qr_batch_manifest_{ts}.json")
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"[DONE] {metadata['codes_generated']}/{len(items)} codes in {metadata['total_elapsed_seconds']}s "
+          f"({metadata['codes_per_second']} codes/s). Manifest saved to: {manifest_path}")
+    return manifest_path
+
+
+def generate_qr_pdf_sheet(
+    rows,
+    pdf_path,
+    columns=3,
+    rows_per_page=4,
+    page_size=A4,
+    margin=36,
+    spacing=18,
+    error_correction=qrcode.constants.ERROR_CORRECT_H,
+    box_size=10,
+    border=4,
+    fill_color="black",
+    back_color="white",
+    logo_path=None,
+    corner_logo_path=None,
+    text_font_path=None,
+    text_size=20,
+    text_color="black",
+    logo_scale=0.25
+):
+    """
+    Lays out one vector QR code per row on the pages of a single PDF.
+
+    The logos and text are placed as on a box_size PNG of the same code and
+    scaled with it to the cell size, so box_size only sets the resolution of
+    the embedded logos.
+
+    :param rows: Row dictionaries with a 'data' value and an optional 'text' value. Rows that
+                 fail (e.g. without data) leave their cell empty and are reported.
+    :param pdf_path: Output PDF path.
+    :param columns: Codes per row of the page.
+    :param rows_per_page: Rows of codes per page.
+    :param page_size: (width, height) in points, e.g. A4 or LETTER.
+    :param margin: Page margin in points.
+    :param spacing: Space between codes in points.
+    :return: Path of the saved PDF.
+    """
+    page_width, page_height = page_size
+    cell_width = (page_width - 2 * margin) / columns
+    cell_height = (page_height - 2 * margin) / rows_per_page
+    code_size = min(cell_width, cell_height) - spacing
+    if code_size <= 0:
+        raise ValueError("page is too small for the requested columns and rows")
+    per_page = columns * rows_per_page
+
+    start = time.perf_counter()
+    directory = os.path.dirname(pdf_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    failures = []
+    with PdfSheetWriter(pdf_path, page_size) as pdf:
+        for index, row in enumerate(rows):
+            if index % per_page == 0:
+                pdf.add_page()
+            # A bad row leaves its cell empty and is reported instead of aborting the PDF
+            try:
+                if not row.get('data'):
+                    raise ValueError("row has no 'data' value")
+                qr = qrcode.QRCode(version=None, error_correction=error_correction, box_size=box_size, border=border)
+                qr.add_data(row['data'])
+                qr.make(fit=True)
+                matrix = qr.get_matrix()
+
+                size = len(matrix) * box_size
+                scale = code_size / size
+                images, text_spec = vector_overlays(size, logo_path, corner_logo_path, row.get('text') or None,
+                                                    text_font_path, text_size, text_color, logo_scale)
+                images = [(image, x * scale, y * scale, image.width * scale, image.height * scale)
+                          for image, x, y in images]
+                if text_spec:
+                    text_spec.update(x=text_spec['x'] * scale, baseline=text_spec['baseline'] * scale,
+                                     size=text_spec['size'] * scale)
+            except Exception as e:
+                failures.append({'index': index, 'error': str(e)})
+                continue
+
+            # Center the code in its cell
+            slot = index % per_page
+            x = margin + (slot % columns) * cell_width + (cell_width - code_size) / 2
+            y = margin + (slot // columns) * cell_height + (cell_height - code_size) / 2
+            pdf.draw_code(matrix, x, y, code_size, fill_color, back_color, images, text_spec)
+        pages = len(pdf.page_ids) + (pdf.content is not None)
+    elapsed = time.perf_counter() - start
+
+    for item in failures:
+        print(f"✗ row {item['index']}: {item['error']}")
+    print(f"[DONE] {len(rows) - len(failures)}/{len(rows)} codes on {pages} pages in {elapsed:.2f}s. "
+          f"Sheet saved to: {pdf_path}")
+    return pdf_path
+
+
+def _render_sheet(task):
+    # Runs inside a worker process: draws one sheet on a single canvas and writes it once
+    sheet_path, first_index, rows, layout, options = task
+    columns, sheet_size, margin, cell_width, cell_height, code_size, captions, caption_size, compress_level = layout
+    back_color = options.get('back_color', "white")
+    sheet = Image.new("RGB", sheet_size, "white" if str(back_color).lower() == "transparent" else back_color)
+    draw = ImageDraw.Draw(sheet)
+    caption_font = load_font(options.get('text_font_path'), caption_size, size_default=True) if captions else None
+    caption_height = caption_size + caption_size // 2 if captions else 0
+    code_options = {name: value for name, value in options.items()
+                    if name in inspect.signature(compose_qr_image).parameters}
+
+    items = []
+    for slot, row in enumerate(rows):
+        index = first_index + slot
+        column, line = slot % columns, slot // columns
+        item = {'index': index, 'sheet': os.path.basename(sheet_path), 'column': column + 1, 'row': line + 1}
+        try:
+            if not row.get('data'):
+                raise ValueError("row has no 'data' value")
+            qr = qrcode.QRCode(version=None, error_correction=options.get('error_correction',
+                                                                          qrcode.constants.ERROR_CORRECT_H),
+                               border=options.get('border', 4))
+            qr.add_data(row['data'])
+            qr.make(fit=True)
+            # Largest whole box size that fits the cell, so codes are never resampled
+            qr.box_size = max(1, code_size // (qr.modules_count + 2 * qr.border))
+            text = row.get('text') or None
+            img = compose_qr_image(qr, **dict(code_options, text=None if captions else text))
+
+            cell_x = margin + column * cell_width
+            cell_y = margin + line * cell_height
+            code_x = cell_x + (cell_width - img.width) // 2
+            code_y = cell_y + (cell_height - caption_height - img.height) // 2
+            sheet.paste(img, (code_x, code_y))
+            if captions and text:
+                left, top, right, bottom = draw.textbbox((0, 0), text, font=caption_font)
+                draw.text((cell_x + (cell_width - (right - left)) // 2, code_y + img.height + caption_size // 4),
+                          text, fill=options.get('text_color', "black"), font=caption_font)
+            item['version'] = qr.version
+        except Exception as e:
+            item['error'] = str(e)
+        items.append(item)
+
+    # compress_level only applies to PNG; other formats ignore it
+    sheet.save(sheet_path, compress_level=compress_level)
+    return items
+
+
+def generate_qr_sheets(
+    rows,
+    save_directory='.',
+    columns=4,
+    rows_per_sheet=6,
+    sheet_size=SHEET_SIZES['a4'],
+    margin=60,
+    spacing=30,
+    captions=False,
+    caption_size=28,
+    sheet_format='png',
+    compress_level=1,
+    workers=None,
+    **options
+):
+    """
+    Lays out many QR codes on large raster sheets, one file per sheet.
+
+    Each sheet is drawn on a single pre-allocated canvas and written once, so a
+    worker only holds one sheet in memory at a time. Codes are rendered with
+    compose_qr_image() at the largest whole box size that fits their cell.
+
+    :param rows: Row dictionaries with a 'data' value and an optional 'text' value.
+    :param save_directory: Directory where the sheets and the manifest are saved.
+    :param columns: Codes per row of the sheet.
+    :param rows_per_sheet: Rows of codes per sheet.
+    :param sheet_size: (width, height) of a sheet in pixels, e.g. SHEET_SIZES['a4'].
+    :param margin: Sheet margin in pixels.
+    :param spacing: Minimum space between codes in pixels.
+    :param captions: Print each row's text as a caption under its code instead of on it.
+    :param caption_size: Font size of the captions.
+    :param sheet_format: Image format of the sheets, as a file extension ("png", "tiff", ...).
+    :param compress_level: PNG zlib level (0-9). The default of 1 encodes a full sheet about twice as
+                           fast as PIL's default of 6, for files about three times larger.
+    :param workers: Number of worker processes (default = number of CPUs).
+    :param options: Any other compose_qr_image() arguments, plus error_correction and border.
+    :return: Path of the JSON manifest, which maps every row to its sheet, column and row.
+    """
+    width, height = sheet_size
+    cell_width = (width - 2 * margin) // columns
+    cell_height = (height - 2 * margin) // rows_per_sheet
+    caption_height = caption_size + caption_size // 2 if captions else 0
+    code_size = min(cell_width, cell_height - caption_height) - spacing
+    if code_size <= 0:
+        raise ValueError("sheet is too small for the requested columns and rows")
+    layout = (columns, tuple(sheet_size), margin, cell_width, cell_height, code_size, captions, caption_size,
+              compress_level)
+    per_sheet = columns * rows_per_sheet
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(save_directory, exist_ok=True)
+
+    tasks = [(os.path.join(save_directory, f"qr_sheet_{number + 1:04d}.{sheet_format}"), first,
+              rows[first:first + per_sheet], layout, options)
+             for number, first in enumerate(range(0, len(rows), per_sheet))]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        items = [item for sheet_items in pool.map(_render_sheet, tasks) for item in sheet_items]
+    elapsed = time.perf_counter() - start
+
+    failures = [item for item in items if 'error' in item]
+    for item in failures:
+        print(f"✗ row {item['index']}: {item['error']}")
+    metadata = {
+        'sheets': len(tasks),
+        'sheet_size': list(sheet_size),
+        'codes_per_sheet': per_sheet,
+        'workers': workers,
+        'codes_requested': len(items),
+        'codes_generated': len(items) - len(failures),
+        'failures': len(failures),
+        'total_elapsed_seconds': round(elapsed, 2),
+        'codes_per_second': round(len(items) / elapsed, 1) if elapsed else 0.0,
+        'report_generated': datetime.datetime.now().isoformat()
+    }
+
+    ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+    manifest_path = os.path.join(save_directory, f"qr_sheets_manifest_{ts}.json")
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump([metadata] + items, f, indent=2)
+    print(f"[DONE] {metadata['codes_generated']}/{len(items)} codes on {len(tasks)} sheets in "
+          f"{metadata['total_elapsed_seconds']}s ({metadata['codes_per_second']} codes/s). "
+          f"Manifest saved to: {manifest_path}")
+    return manifest_path
 
 
 if __name__ == "__main__":
-    # Example usage
-    generate_qr_code(   
-        data="https://linktr.ee/TotallyTubularParty",
-        save_directory="D:/",
-        filename="qrcode-TotallyTubularParty.png",
-        error_correction=qrcode.constants.ERROR_CORRECT_H,
-        box_size=10,
-        border=4,
-        fill_color="black",
-        back_color="white",
-        logo_path="C:/Users/Joshu/OneDrive/Pictures/90s.png",
-        corner_logo_path="C:/Users/Joshu/OneDrive/Pictures/Solo_Jazz_design.png",
-        text=None,  # Set to None if you don't want text
-        text_font_path="C:/Windows/Fonts/arial.ttf",  # Update with your font path, if different
-        text_size=20,
-        text_color="blue"
-    )
+    parser = argparse.ArgumentParser(description='Generate QR codes, one at a time or in batches.')
+    parser.add_argument('--batch', help='CSV or JSONL file with data, filename and optional text columns')
+    parser.add_argument('-o', '--save-directory', default='.', help='Directory for the generated codes')
+    parser.add_argument('--workers', type=int, help='Worker processes for --batch (default = number of CPUs)')
+    parser.add_argument('--error-correction', default='H', choices=ERROR_CORRECTION_LEVELS)
+    parser.add_argument('--box-size', type=int, default=10)
+    parser.add_argument('--border', type=int, default=4)
+    parser.add_argument('--fill-color', default='black')
+    parser.add_argument('--back-color', default='white')
+    parser.add_argument('--logo', help='Center logo image')
+    parser.add_argument('--corner-logo', help='Bottom-right corner logo image')
+    parser.add_argument('--font', help='.ttf font for the text overlay')
+    parser.add_argument('--text-size', type=int, default=20)
+    parser.add_argument('--text-color', default='black')
+    parser.add_argument('--renderer', default='pil', choices=['pil', 'numpy'])
+    parser.add_argument('--logo-scale', type=float, default=0.25,
+                        help='Center logo width as a fraction of the code width (default=0.25)')
+    parser.add_argument('--autotune', action='store_true',
+                        help='Pick the smallest version and error correction that still decode (needs pyzbar or OpenCV)')
+    parser.add_argument('--cache', action='store_true',
+                        help=f'Skip unchanged codes, using an index at {CACHE_FILENAME} in the save directory')
+    parser.add_argument('--format', default='png', choices=['png', 'svg', 'pdf'],
+                        help='Output format for batch rows without a filename (default=png)')
+    parser.add_argument('--pdf-sheet', help='Write all --batch codes into this PDF, many codes per page')
+    parser.add_argument('--sheets', action='store_true',
+                        help='Lay out all --batch codes on raster sheets in the save directory')
+    parser.add_argument('--sheet-format', default='png', help='Image format of --sheets (default=png)')
+    parser.add_argument('--captions', action='store_true', help='--sheets: print the row text under each code')
+    parser.add_argument('--caption-size', type=int, default=28, help='--sheets: caption font size (default=28)')
+    parser.add_argument('--columns', type=int, help='Codes per row on each page or sheet (default=3 PDF, 4 sheets)')
+    parser.add_argument('--rows', type=int, help='Rows of codes per page or sheet (default=4 PDF, 6 sheets)')
+    parser.add_argument('--page-size', default='a4', choices=PAGE_SIZES)
+    cli = parser.parse_args()
+
+    if cli.batch and cli.sheets:
+        generate_qr_sheets(
+            read_batch_rows(cli.batch),
+            save_directory=cli.save_directory,
+            columns=cli.columns or 4,
+            rows_per_sheet=cli.rows or 6,
+            sheet_size=SHEET_SIZES[cli.page_size],
+            captions=cli.captions,
+            caption_size=cli.caption_size,
+            sheet_format=cli.sheet_format,
+            workers=cli.workers,
+            error_correction=ERROR_CORRECTION_LEVELS[cli.error_correction],
+            border=cli.border,
+            fill_color=cli.fill_color,
+            back_color=cli.back_color,
+            logo_path=cli.logo,
+            logo_scale=cli.logo_scale,
+            corner_logo_path=cli.corner_logo,
+            text_font_path=cli.font,
+            text_size=cli.text_size,
+            text_color=cli.text_color,
+            renderer=cli.renderer
+        )
+    elif cli.batch and cli.pdf_sheet:
+        generate_qr_pdf_sheet(
+            read_batch_rows(cli.batch),
+            cli.pdf_sheet,
+            columns=cli.columns or 3,
+            rows_per_page=cli.rows or 4,
+            page_size=PAGE_SIZES[cli.page_size],
+            error_correction=ERROR_CORRECTION_LEVELS[cli.error_correction],
+            box_size=cli.box_size,
+            border=cli.border,
+            fill_color=cli.fill_color,
+            back_color=cli.back_color,
+            logo_path=cli.logo,
+            corner_logo_path=cli.corner_logo,
+            text_font_path=cli.font,
+            text_size=cli.text_size,
+            text_color=cli.text_color,
+            logo_scale=cli.logo_scale
+        )
+    elif cli.batch:
+        generate_qr_batch(
+            cli.batch,
+            save_directory=cli.save_directory,
+            workers=cli.workers,
+            output_format=cli.format,
+            cache_path=os.path.join(cli.save_directory, CACHE_FILENAME) if cli.cache else None,
+            logo_scale=cli.logo_scale,
+            autotune=cli.autotune,
+            error_correction=ERROR_CORRECTION_LEVELS[cli.error_correction],
+            box_size=cli.box_size,
+            border=cli.border,
+            fill_color=cli.fill_color,
+            back_color=cli.back_color,
+            logo_path=cli.logo,
+            corner_logo_path=cli.corner_logo,
+            text_font_path=cli.font,
+            text_size=cli.text_size,
+            text_color=cli.text_color,
+            renderer=cli.renderer
+        )
+    else:
+        # Example usage
+        generate_qr_code(
+            data="https://linktr.ee/TotallyTubularParty",
+            save_directory="D:/",
+            filename="qrcode-TotallyTubularParty.png",
+            error_correction=qrcode.constants.ERROR_CORRECT_H,
+            box_size=10,
+            border=4,
+            fill_color="black",
+            back_color="white",
+            logo_path="C:/Users/Joshu/OneDrive/Pictures/90s.png",
+            corner_logo_path="C:/Users/Joshu/OneDrive/Pictures/Solo_Jazz_design.png",
+            text=None,  # Set to None if you don't want text
+            text_font_path="C:/Windows/Fonts/arial.ttf",  # Update with your font path, if different
+            text_size=20,
+            text_color="blue"
+        )
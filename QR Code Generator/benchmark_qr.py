@@ -0,0 +1,136 @@
+"""
+============================================================================
+QR Code Generator Benchmarks
+============================================================================
+
+logos:    Times generate_qr_code() with a center logo, corner logo and text
+          overlay, with the in-process logo/font caches warm versus cleared
+          before every call.
+renderer: Times the PIL renderer (make_image + convert) against the NumPy
+          module-matrix renderer at several box sizes, and checks that both
+          produce identical pixels.
+formats:  Times generate_qr_code() writing PNG, SVG and PDF at print-sized
+          box sizes and compares the file sizes.
+
+Usage:
+    python benchmark_qr.py                 # both benchmarks
+    python benchmark_qr.py logos -n 1000 --logo my_logo.png --font arial.ttf
+    python benchmark_qr.py renderer --box-sizes 10,40,100
+    python benchmark_qr.py formats --box-sizes 40,80 --logo my_logo.png
+
+"""
+
+
+import argparse
+import os
+import tempfile
+import time
+
+import qrcode
+from PIL import Image, ImageChops
+
+import QR_code_generator as qr_gen
+
+
+def make_logo(path, size=1024):
+    """Writes a synthetic RGBA logo so the benchmark runs without any assets."""
+    logo = Image.new("RGBA", (size, size))
+    logo.putdata([(x % 256, y % 256, (x + y) % 256, 255 if (x // 64 + y // 64) % 2 else 128)
+                  for y in range(size) for x in range(size)])
+    logo.save(path)
+    return path
+
+
+def clear_caches():
+    qr_gen._cached_logo.cache_clear()
+    qr_gen._cached_font.cache_clear()
+    qr_gen._default_font.cache_clear()
+
+
+def bench_logo_cache(count, save_directory, logo_path, font_path):
+    """Returns (cached seconds, uncached seconds) for count generations."""
+    options = dict(save_directory=save_directory, logo_path=logo_path, corner_logo_path=logo_path,
+                   text="Benchmark", text_font_path=font_path, verbose=False)
+    results = {}
+    for label in ('uncached', 'cached'):
+        clear_caches()
+        start = time.perf_counter()
+        for i in range(count):
+            if label == 'uncached':
+                clear_caches()
+            qr_gen.generate_qr_code(f"https://example.com/badge/{i}", filename=f"{label}-{i % 100}.png", **options)
+        results[label] = time.perf_counter() - start
+    return results['cached'], results['uncached']
+
+
+def bench_renderers(box_sizes, repeats, data="https://example.com/" + "x" * 200):
+    """Prints PIL vs NumPy render times for each box size."""
+    print(f"Rendering a {len(data)}-character code, best of {repeats}:")
+    for box_size in box_sizes:
+        qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_H, box_size=box_size, border=4)
+        qr.add_data(data)
+        qr.make(fit=True)
+
+        timings = {}
+        for label, render in (('pil', lambda: qr.make_image(fill_color="black", back_color="white").convert("RGB")),
+                              ('numpy', lambda: qr_gen.render_qr_matrix(qr, "black", "white"))):
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                img = render()
+                best = min(best, time.perf_counter() - start)
+            timings[label] = (best, img)
+
+        (pil_seconds, pil_img), (np_seconds, np_img) = timings['pil'], timings['numpy']
+        identical = ImageChops.difference(pil_img, np_img).getbbox() is None
+        print(f"  box_size {box_size:>4} ({pil_img.width}px): pil {pil_seconds * 1000:8.2f} ms, "
+              f"numpy {np_seconds * 1000:8.2f} ms, {pil_seconds / np_seconds:6.1f}x faster, "
+              f"identical={identical}")
+
+
+def bench_formats(box_sizes, repeats, save_directory, logo_path, data="https://example.com/" + "x" * 200):
+    """Prints the write time and file size of PNG, SVG and PDF output for each box size."""
+    print(f"Writing a {len(data)}-character code with a center logo and text, best of {repeats}:")
+    options = dict(save_directory=save_directory, logo_path=logo_path, text="Benchmark", verbose=False)
+    load_logo_once = qr_gen.generate_qr_code(data, filename="warm-up.svg", **options)
+    os.remove(load_logo_once)
+    for box_size in box_sizes:
+        results = []
+        for extension in ('png', 'svg', 'pdf'):
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                path = qr_gen.generate_qr_code(data, filename=f"format.{extension}", box_size=box_size, **options)
+                best = min(best, time.perf_counter() - start)
+            results.append(f"{extension} {best * 1000:8.2f} ms {os.path.getsize(path) / 1024:9.1f} KiB")
+        print(f"  box_size {box_size:>4}: " + " | ".join(results))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark QR code generation.')
+    parser.add_argument('benchmark', nargs='?', default='all', choices=['all', 'logos', 'renderer', 'formats'])
+    parser.add_argument('-n', '--count', type=int, default=10000, help='Generations per run (default=10000)')
+    parser.add_argument('--logo', help='Logo image to use (default = a generated 1024x1024 RGBA image)')
+    parser.add_argument('--font', help='.ttf font for the text overlay (default = PIL default font)')
+    parser.add_argument('--box-sizes', default='10,20,40,80',
+                        help='Comma separated box sizes for the renderer and formats benchmarks (default=10,20,40,80)')
+    parser.add_argument('--repeats', type=int, default=5, help='Repeats per renderer and format timing (default=5)')
+    args = parser.parse_args()
+
+    if args.benchmark in ('all', 'logos'):
+        with tempfile.TemporaryDirectory() as tmp:
+            logo_path = args.logo or make_logo(os.path.join(tmp, "logo.png"))
+            cached, uncached = bench_logo_cache(args.count, tmp, logo_path, args.font)
+
+        print(f"{args.count} generations with center logo, corner logo and text:")
+        print(f"  uncached: {uncached:8.2f}s ({args.count / uncached:7.1f} codes/s)")
+        print(f"  cached:   {cached:8.2f}s ({args.count / cached:7.1f} codes/s)")
+        print(f"  speed-up: {uncached / cached:8.2f}x")
+
+    if args.benchmark in ('all', 'renderer'):
+        bench_renderers([int(size) for size in args.box_sizes.split(',')], args.repeats)
+
+    if args.benchmark in ('all', 'formats'):
+        with tempfile.TemporaryDirectory() as tmp:
+            logo_path = args.logo or make_logo(os.path.join(tmp, "logo.png"))
+            bench_formats([int(size) for size in args.box_sizes.split(',')], args.repeats, tmp, logo_path)
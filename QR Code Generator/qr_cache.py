@@ -0,0 +1,240 @@
+"""
+============================================================================
+Content-Addressed Output Cache for the QR Code Generator
+============================================================================
+
+HOW IT WORKS:
+-------------
+1. generate_qr_code() hashes every parameter that affects the output (data,
+   error correction, sizes, colors, text, output format and the contents of
+   the logo and font files) into a cache key.
+
+2. The key is looked up in a small SQLite index next to the outputs:
+   - If the output file was written with the same key and its size and
+     modification time are unchanged, rendering is skipped (a hit).
+   - If another output with the same key is still intact, it is copied
+     instead of rendered (also a hit).
+   - Otherwise the code is rendered and the new output is recorded (a miss).
+
+3. Hit and miss counters are kept in the index, and stale entries can be
+   pruned from the command line:
+       python qr_cache.py stats badges/.qr_cache.sqlite
+       python qr_cache.py prune badges/.qr_cache.sqlite --older-than 30 --delete-files
+
+Dependencies:
+-------------
+- None (standard library only)
+
+"""
+
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import time
+
+
+# Default index file name, created in the save directory.
+CACHE_FILENAME = ".qr_cache.sqlite"
+
+# Bump when the rendering changes, so outputs from older code are regenerated.
+CACHE_VERSION = 1
+
+# Number of file digests kept in memory per process.
+DIGEST_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=DIGEST_CACHE_SIZE)
+def _cached_digest(path, mtime_ns, size):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_digest(path):
+    """
+    Returns the SHA-256 of the file at path, or None if there is no such file.
+
+    Digests are cached by (path, modification time, size), so a logo shared by
+    a whole batch is only read once per process.
+    """
+    if not path or not os.path.isfile(path):
+        return None
+    stat = os.stat(path)
+    return _cached_digest(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def cache_key(**params):
+    """Returns a hex digest of the given JSON-serializable parameters."""
+    payload = json.dumps(dict(params, cache_version=CACHE_VERSION), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class QRCache:
+    """
+    On-disk index of generated outputs, keyed by cache key.
+
+    Usage:
+        with QRCache("out/.qr_cache.sqlite") as cache:
+            if not cache.lookup(key, path):
+                ...  # render and save to path
+                cache.store(key, path)
+
+    Last-used times and the hit/miss counters are written in one transaction
+    by flush() or close(), so a batch of lookups does not write per code.
+
+    :param index_path: Path of the SQLite index file.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        directory = os.path.dirname(index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(index_path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS entries (path TEXT PRIMARY KEY, key TEXT NOT NULL, "
+                        "size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, last_used REAL NOT NULL)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_key ON entries (key)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self.db.commit()
+        self.hits = 0
+        self.misses = 0
+        self.used = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def _intact(path, size, mtime_ns):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return stat.st_size == size and stat.st_mtime_ns == mtime_ns
+
+    def lookup(self, key, path):
+        """
+        Returns True if path holds an up-to-date output for key, copying an
+        intact output with the same key to path if needed.
+        """
+        path = os.path.abspath(path)
+        row = self.db.execute("SELECT key, size, mtime_ns FROM entries WHERE path = ?", (path,)).fetchone()
+        if row and row[0] == key and self._intact(path, row[1], row[2]):
+            self.hits += 1
+            self.used.append(path)
+            return True
+
+        for source, size, mtime_ns in self.db.execute(
+                "SELECT path, size, mtime_ns FROM entries WHERE key = ? AND path != ?", (key, path)).fetchall():
+            if self._intact(source, size, mtime_ns):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                shutil.copyfile(source, path)
+                self.store(key, path)
+                self.hits += 1
+                self.used.append(source)
+                return True
+
+        self.misses += 1
+        return False
+
+    def store(self, key, path, commit=True):
+        """Records path as the output for key."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        self.db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                        (path, key, stat.st_size, stat.st_mtime_ns, time.time()))
+        if commit:
+            self.db.commit()
+
+    def flush(self):
+        """Writes last-used times and hit/miss counters to the index."""
+        now = time.time()
+        self.db.executemany("UPDATE entries SET last_used = ? WHERE path = ?", ((now, path) for path in self.used))
+        for name, value in (("hits", self.hits), ("misses", self.misses)):
+            self.db.execute("INSERT INTO counters VALUES (?, ?) "
+                            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value", (name, value))
+        self.db.commit()
+        self.hits = self.misses = 0
+        self.used = []
+
+    def stats(self):
+        """Returns the number of entries and the stored hit/miss counters (including unflushed ones)."""
+        counters = dict(self.db.execute("SELECT name, value FROM counters").fetchall())
+        hits = counters.get("hits", 0) + self.hits
+        misses = counters.get("misses", 0) + self.misses
+        entries, total_bytes = self.db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {
+            'entries': entries,
+            'total_bytes': total_bytes,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0
+        }
+
+    def prune(self, older_than_days=None, delete_files=False):
+        """
+        Removes entries whose output is missing or was changed by something else,
+        and, with older_than_days, entries not used for that many days.
+
+        :param older_than_days: (Optional) Also remove entries unused for this many days.
+        :param delete_files: Delete the output files of entries removed for age.
+        :return: (entries removed, files deleted).
+        """
+        cutoff = time.time() - older_than_days * 86400 if older_than_days is not None else None
+        stale, deleted = [], 0
+        for path, size, mtime_ns, last_used in self.db.execute(
+                "SELECT path, size, mtime_ns, last_used FROM entries").fetchall():
+            if not self._intact(path, size, mtime_ns):
+                stale.append(path)
+            elif cutoff is not None and last_used < cutoff:
+                stale.append(path)
+                if delete_files:
+                    os.remove(path)
+                    deleted += 1
+        self.db.executemany("DELETE FROM entries WHERE path = ?", ((path,) for path in stale))
+        self.db.commit()
+        self.db.execute("VACUUM")
+        return len(stale), deleted
+
+    def close(self):
+        """Flushes pending updates and closes the index."""
+        if self.db is None:
+            return
+        self.flush()
+        self.db.close()
+        self.db = None
+
+
+@functools.lru_cache(maxsize=None)
+def open_cache(index_path):
+    """Returns one shared QRCache per index path in this process."""
+    return QRCache(index_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Inspect or prune a QR output cache index.')
+    parser.add_argument('command', choices=['stats', 'prune'])
+    parser.add_argument('index', nargs='?', default=CACHE_FILENAME,
+                        help=f'Path of the cache index (default={CACHE_FILENAME})')
+    parser.add_argument('--older-than', type=float, help='prune: also drop entries unused for this many days')
+    parser.add_argument('--delete-files', action='store_true',
+                        help='prune: delete the outputs of entries dropped for age')
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.index):
+        parser.error(f"no cache index at {args.index}")
+    with QRCache(args.index) as cache:
+        if args.command == 'prune':
+            removed, deleted = cache.prune(args.older_than, args.delete_files)
+            print(f"[DONE] Removed {removed} entries, deleted {deleted} files.")
+        print(json.dumps(cache.stats(), indent=2))
@@ -0,0 +1,108 @@
+"""
+============================================================================
+QR Code HTTP Service Load Test
+============================================================================
+
+Sends QR code requests to a running qr_server.py over keep-alive
+connections and reports latency percentiles and requests per second.
+Fewer distinct payloads (--distinct) means more response cache hits.
+
+Usage:
+    python qr_server.py &
+    python qr_load_test.py --requests 5000 --concurrency 32 --format svg
+    python qr_load_test.py --distinct 100000 --logo logo.png
+
+"""
+
+
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlencode
+
+from qr_server import DEFAULT_PORT
+
+
+# Function to read one HTTP response and return its status code and body
+async def read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('Server closed the connection')
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    body = await reader.readexactly(length)
+    return int(status_line.split()[1]), body
+
+
+# Function run by each simulated client: send requests back to back on one connection
+async def client(host, port, targets, count, latencies, sizes, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(count):
+            request = f"GET {targets[i % len(targets)]} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1')
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, body = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            sizes.append(len(body))
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(host, port, requests, concurrency, distinct, options):
+    targets = ['/qr?' + urlencode(dict(options, data=f"https://example.com/item/{i}")) for i in range(distinct)]
+
+    latencies, sizes, errors = [], [], []
+    per_client = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, targets[i::concurrency] or targets, count, latencies, sizes, errors)
+                           for i, count in enumerate(per_client) if count))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    print(f"Requests:    {len(latencies)} ({len(errors)} errors) with {concurrency} connections")
+    print(f"Throughput:  {len(latencies) / elapsed:,.0f} requests/s, "
+          f"mean response {statistics.mean(sizes) / 1024:,.1f} KiB")
+    print(f"Latency p50: {cuts[49] * 1000:.2f} ms")
+    print(f"Latency p90: {cuts[89] * 1000:.2f} ms")
+    print(f"Latency p99: {cuts[98] * 1000:.2f} ms")
+
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /stats HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+    _, body = await read_response(reader)
+    writer.close()
+    print(f"Server:      {body.decode('utf-8')}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Load-test a running qr_server.py instance.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--requests', type=int, default=2000, help='Total number of requests (default=2000)')
+    parser.add_argument('--concurrency', type=int, default=16, help='Number of parallel connections (default=16)')
+    parser.add_argument('--distinct', type=int, default=2000,
+                        help='Number of distinct codes requested; fewer means more cache hits (default=2000)')
+    parser.add_argument('--format', default='png', choices=['png', 'svg', 'pdf'])
+    parser.add_argument('--box-size', type=int, default=10)
+    parser.add_argument('--logo', help='Logo file name in the server --assets directory')
+    parser.add_argument('--text', help='Text overlay for every code')
+    args = parser.parse_args()
+
+    options = {'format': args.format, 'box_size': args.box_size}
+    if args.logo:
+        options['logo'] = args.logo
+    if args.text:
+        options['text'] = args.text
+    asyncio.run(run(args.host, args.port, args.requests, args.concurrency, args.distinct, options))
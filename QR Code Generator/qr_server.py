@@ -0,0 +1,305 @@
+"""
+============================================================================
+QR Code HTTP Service
+============================================================================
+
+HOW IT WORKS:
+-------------
+1. A long-running asyncio HTTP/1.1 server (standard library only) wraps
+   render_qr_bytes() from QR_code_generator.py and returns the PNG, SVG or
+   PDF bytes in the response. Nothing is written to disk.
+
+2. Rendering runs in a process pool that is started and warmed up (imports,
+   default font) before the server accepts connections. Each worker keeps
+   its decoded logos and fonts in memory between requests, and the server
+   keeps the most recent responses in a bounded LRU cache.
+
+3. Logos and fonts are named by file name and looked up in the --assets
+   directory only, so clients cannot read other files from the server.
+
+Endpoints:
+----------
+    GET  /qr?data=hello&format=svg&box_size=8     query string options
+    POST /qr                                      JSON object of options
+    GET  /stats                                   cache and render statistics
+
+Options: data (required), format (png, svg or pdf), error_correction (L, M,
+Q or H), box_size, border, version, fill_color, back_color, logo,
+corner_logo, logo_scale, text, font, text_size, text_color, autotune.
+
+Errors come back as a JSON object {"error": message}, with status 400 for bad
+options or unreadable assets and 500 for any other render failure.
+
+Usage:
+    python qr_server.py --port 8338 --assets ./assets --workers 4
+    curl -o code.png "http://127.0.0.1:8338/qr?data=https://example.com&logo=logo.png"
+
+"""
+
+
+import argparse
+import asyncio
+import collections
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from qrcode.exceptions import DataOverflowError
+
+import QR_code_generator as qr_gen
+
+
+DEFAULT_PORT = 8338
+CACHE_SIZE = 1024                      # Number of responses kept in the LRU cache
+MAX_BODY_SIZE = 64 * 1024              # Larger requests are rejected with 413
+MAX_DATA_LENGTH = 4096                 # Longer data does not fit in a QR code anyway
+MAX_BOX_SIZE = 50                      # Bounds the size of a rendered image
+MAX_BORDER = 20
+MAX_TEXT_SIZE = 200
+
+CONTENT_TYPES = {'png': 'image/png', 'svg': 'image/svg+xml', 'pdf': 'application/pdf'}
+
+
+def _render(options):
+    # Runs inside a worker process; bad options come back as ValueError
+    try:
+        return qr_gen.render_qr_bytes(**options)
+    except (TypeError, DataOverflowError) as e:
+        raise ValueError(str(e)) from None
+    except OSError as e:
+        # PIL.UnidentifiedImageError and unreadable fonts: the client named a bad asset
+        raise ValueError(f"cannot read asset: {e}") from None
+
+
+def _warm_up(_):
+    # Import and cache everything a first request would otherwise pay for
+    qr_gen.render_qr_bytes("warm-up", "png", text="warm-up")
+    return os.getpid()
+
+
+class QRServer:
+    """
+    Serves QR codes over HTTP with keep-alive connections.
+
+    :param workers: Number of render processes.
+    :param assets: Directory that logo, corner_logo and font names are looked up in.
+    :param cache_size: Maximum number of cached responses.
+    """
+
+    def __init__(self, workers=None, assets='.', cache_size=CACHE_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.assets = os.path.abspath(assets)
+        self.cache_size = cache_size
+        self.cache = collections.OrderedDict()
+        self.pool = None
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+        self.render_seconds = 0.0
+
+    def start(self):
+        """Starts the process pool and waits until every worker has rendered once."""
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        pids = set(self.pool.map(_warm_up, range(self.workers * 4)))
+        print(f"[INFO] {len(pids)} render workers ready")
+
+    def close(self):
+        if self.pool:
+            self.pool.shutdown(cancel_futures=True)
+
+    def asset(self, name):
+        # Only plain file names inside the assets directory are accepted
+        if not name:
+            return None
+        path = os.path.join(self.assets, os.path.basename(name))
+        if os.path.basename(name) != name or not os.path.isfile(path):
+            raise ValueError(f"unknown asset: {name}")
+        return path
+
+    def parse_options(self, params):
+        data = params.get('data')
+        if not isinstance(data, str) or not data:
+            raise ValueError("data is required")
+        if len(data) > MAX_DATA_LENGTH:
+            raise ValueError(f"data is longer than {MAX_DATA_LENGTH} characters")
+        output_format = str(params.get('format', 'png')).lower()
+        if output_format not in CONTENT_TYPES:
+            raise ValueError("format must be png, svg or pdf")
+        level = str(params.get('error_correction', 'H')).upper()
+        if level not in qr_gen.ERROR_CORRECTION_LEVELS:
+            raise ValueError("error_correction must be L, M, Q or H")
+
+        options = {
+            'data': data,
+            'output_format': output_format,
+            'error_correction': qr_gen.ERROR_CORRECTION_LEVELS[level],
+            'box_size': int(params.get('box_size', 10)),
+            'border': int(params.get('border', 4)),
+            'version': int(params['version']) if params.get('version') else None,
+            'fill_color': str(params.get('fill_color', 'black')),
+            'back_color': str(params.get('back_color', 'white')),
+            'logo_path': self.asset(params.get('logo')),
+            'corner_logo_path': self.asset(params.get('corner_logo')),
+            'logo_scale': float(params.get('logo_scale', 0.25)),
+            'text': str(params['text']) if params.get('text') else None,
+            'text_font_path': self.asset(params.get('font')),
+            'text_size': int(params.get('text_size', 20)),
+            'text_color': str(params.get('text_color', 'black')),
+            'autotune': str(params.get('autotune', '')).lower() in ('1', 'true', 'yes'),
+            'renderer': 'numpy' if qr_gen.np is not None else 'pil'
+        }
+        if not 1 <= options['box_size'] <= MAX_BOX_SIZE:
+            raise ValueError(f"box_size must be between 1 and {MAX_BOX_SIZE}")
+        if not 0 <= options['border'] <= MAX_BORDER:
+            raise ValueError(f"border must be between 0 and {MAX_BORDER}")
+        if options['version'] is not None and not 1 <= options['version'] <= 40:
+            raise ValueError("version must be between 1 and 40")
+        if not 0 < options['logo_scale'] <= 0.5:
+            raise ValueError("logo_scale must be between 0 and 0.5")
+        if not 1 <= options['text_size'] <= MAX_TEXT_SIZE:
+            raise ValueError(f"text_size must be between 1 and {MAX_TEXT_SIZE}")
+        if options['autotune'] and qr_gen.pyzbar is None and qr_gen.cv2 is None:
+            raise ValueError("autotune is not available: the server has no QR decoder installed")
+        return options
+
+    async def render(self, options):
+        # Logo and font files are part of the key, so a replaced asset is picked up
+        key = json.dumps(options, sort_keys=True) + ''.join(
+            str(os.stat(options[name]).st_mtime_ns) for name in ('logo_path', 'corner_logo_path', 'text_font_path')
+            if options[name])
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        self.misses += 1
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        body = await loop.run_in_executor(self.pool, _render, options)
+        self.renders += 1
+        self.render_seconds += loop.time() - start
+
+        self.cache[key] = body
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return body
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'workers': self.workers,
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'cache_hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'cache_size': len(self.cache),
+            'cache_max_size': self.cache_size,
+            'renders': self.renders,
+            'mean_render_ms': round(self.render_seconds / self.renders * 1000, 2) if self.renders else 0.0
+        }
+
+    async def route(self, method, target, body):
+        url = urlsplit(target)
+
+        if url.path == '/stats' and method == 'GET':
+            return HTTPStatus.OK, 'application/json', json.dumps(self.stats()).encode('utf-8')
+        if url.path != '/qr':
+            return HTTPStatus.NOT_FOUND, 'text/plain', b'Not found'
+
+        if method == 'GET':
+            params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        elif method == 'POST':
+            try:
+                params = json.loads(body.decode('utf-8'))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                params = None
+            if not isinstance(params, dict):
+                return self.error(HTTPStatus.BAD_REQUEST, 'Body must be a JSON object of options')
+        else:
+            return HTTPStatus.METHOD_NOT_ALLOWED, 'text/plain', b'Use GET or POST'
+
+        try:
+            options = self.parse_options(params)
+            payload = await self.render(options)
+        except (ValueError, TypeError) as e:
+            return self.error(HTTPStatus.BAD_REQUEST, str(e))
+        except Exception as e:
+            # Anything else is a server-side failure; keep serving other requests
+            print(f"[ERROR] Render failed: {e!r}")
+            return self.error(HTTPStatus.INTERNAL_SERVER_ERROR, 'render failed')
+        return HTTPStatus.OK, CONTENT_TYPES[options['output_format']], payload
+
+    @staticmethod
+    def error(status, message):
+        return status, 'application/json', json.dumps({'error': message}).encode('utf-8')
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode('latin-1').split(maxsplit=2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY_SIZE:
+                    self.respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'text/plain', b'Body too large', False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, content_type, payload = await self.route(method, target, body)
+                keep_alive = (version.strip() == 'HTTP/1.1'
+                              and headers.get('connection', '').lower() != 'close')
+                self.respond(writer, status, content_type, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def respond(writer, status, content_type, payload, keep_alive):
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + payload)
+
+
+async def serve(host='127.0.0.1', port=DEFAULT_PORT, workers=None, assets='.', cache_size=CACHE_SIZE):
+    service = QRServer(workers, assets, cache_size)
+    service.start()
+    try:
+        server = await asyncio.start_server(service.handle, host, port)
+        print(f"[INFO] Serving QR codes on http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve QR codes over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default=127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to listen on (default={DEFAULT_PORT})')
+    parser.add_argument('--workers', type=int, help='Render processes (default = number of CPUs)')
+    parser.add_argument('--assets', default='.', help='Directory of logos and fonts clients may use (default=.)')
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE,
+                        help=f'Number of responses kept in the LRU cache (default={CACHE_SIZE})')
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.assets, args.cache_size))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,277 @@
+"""
+============================================================================
+Vector Output for the QR Code Generator (SVG and PDF)
+============================================================================
+
+HOW IT WORKS:
+-------------
+1. The dark modules of each row of the QR matrix are merged into runs, and
+   every run is drawn as a single rectangle, so a code is a few hundred
+   path segments no matter how large it is printed.
+
+2. SVG:
+   - qr_svg() returns one <svg> document with a background rectangle, a
+     single <path> for all runs, the logos as embedded PNG images and the
+     text overlay as a <text> element.
+
+3. PDF:
+   - PdfSheetWriter writes a multi-page PDF with any number of codes per
+     page. Pages are streamed to disk one at a time, and a logo used by
+     many codes is embedded only once.
+   - Text uses the built-in Helvetica font, so only Latin-1 characters are
+     printed.
+
+Dependencies:
+-------------
+- Pillow (pip install Pillow) for encoding the logos
+
+"""
+
+
+import base64
+import io
+import struct
+import zlib
+from xml.sax.saxutils import escape, quoteattr
+
+from PIL import ImageColor
+
+
+# Page sizes in PDF points (1/72 inch).
+A4 = (595.28, 841.89)
+LETTER = (612.0, 792.0)
+
+
+def dark_runs(matrix):
+    """Yields (row, start column, length) for every horizontal run of dark modules."""
+    for y, row in enumerate(matrix):
+        x, width = 0, len(row)
+        while x < width:
+            if row[x]:
+                start = x
+                while x < width and row[x]:
+                    x += 1
+                yield y, start, x - start
+            else:
+                x += 1
+
+
+def _rgb(color):
+    if isinstance(color, str):
+        return ImageColor.getcolor(color, "RGB")
+    return tuple(color)[:3]
+
+
+def _svg_color(color):
+    if isinstance(color, str):
+        return color
+    return "rgb({},{},{})".format(*_rgb(color))
+
+
+def _png_data_uri(image):
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def qr_svg(matrix, box_size, fill_color="black", back_color="white", images=(), text=None):
+    """
+    Builds an SVG document for a QR code.
+
+    :param matrix: Module matrix from qrcode.QRCode.get_matrix() (border included).
+    :param box_size: Size of one module in SVG pixels.
+    :param fill_color: Color of the QR code modules.
+    :param back_color: Background color ("transparent" for none).
+    :param images: Sequence of (PIL image, x, y) placed at pixel positions.
+    :param text: (Optional) dict with 'text', 'x', 'baseline', 'family', 'size' and 'color'.
+    :return: SVG document as a string.
+    """
+    size = len(matrix) * box_size
+    path = "".join(f"M{x * box_size} {y * box_size}h{length * box_size}v{box_size}h-{length * box_size}z"
+                   for y, x, length in dark_runs(matrix))
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+             f'viewBox="0 0 {size} {size}" shape-rendering="crispEdges">']
+    if str(back_color).lower() != "transparent":
+        parts.append(f'<rect width="{size}" height="{size}" fill={quoteattr(_svg_color(back_color))}/>')
+    parts.append(f'<path fill={quoteattr(_svg_color(fill_color))} d="{path}"/>')
+    for image, x, y in images:
+        parts.append(f'<image x="{x}" y="{y}" width="{image.width}" height="{image.height}" '
+                     f'href="{_png_data_uri(image)}"/>')
+    if text:
+        parts.append(f'<text x="{text["x"]}" y="{text["baseline"]}" font-family={quoteattr(text["family"])} '
+                     f'font-size="{text["size"]}" fill={quoteattr(_svg_color(text["color"]))}>'
+                     f'{escape(text["text"])}</text>')
+    parts.append('</svg>\n')
+    return "\n".join(parts)
+
+
+def _png_idat(image):
+    # The IDAT data of a PNG is a Flate stream with PNG row filters, which a PDF
+    # reader decodes with /Predictor 15, so logos compress as well as in a PNG
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    data, position, chunks = buffer.getvalue(), 8, []
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position + 8])
+        if kind == b"IDAT":
+            chunks.append(data[position + 8:position + 8 + length])
+        position += length + 12
+    return b"".join(chunks)
+
+
+class PdfSheetWriter:
+    """
+    Writes QR codes as vector graphics into a multi-page PDF.
+
+    Usage:
+        with PdfSheetWriter("sheet.pdf") as pdf:
+            pdf.add_page()
+            pdf.draw_code(matrix, x=36, y=36, size=144)
+
+    Positions are in points, measured from the top-left corner of the page.
+
+    :param path: Output file path, or a binary file object (which is left open).
+    :param page_size: (width, height) in points.
+    """
+
+    def __init__(self, path, page_size=A4):
+        self.owns_file = isinstance(path, str)
+        self.file = open(path, "wb") if self.owns_file else path
+        self.page_width, self.page_height = page_size
+        self.offsets = {}
+        self.page_ids = []
+        self.images = {}
+        self.content = None
+        self.page_images = None
+        # Objects 1-3 are the catalog, the page tree and the font
+        self.next_id = 4
+        self.file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._write_object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+                              b"/Encoding /WinAnsiEncoding >>")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _reserve(self):
+        object_id = self.next_id
+        self.next_id += 1
+        return object_id
+
+    def _write_object(self, object_id, body, stream=None):
+        self.offsets[object_id] = self.file.tell()
+        self.file.write(f"{object_id} 0 obj\n".encode("ascii") + body)
+        if stream is not None:
+            self.file.write(b"\nstream\n" + stream + b"\nendstream")
+        self.file.write(b"\nendobj\n")
+
+    def _image_object(self, image):
+        # Embed each distinct image once; cached logos are the same object every time
+        key = id(image)
+        if key in self.images:
+            return self.images[key][0]
+        smask = None
+        if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+            alpha = image.convert("RGBA").getchannel("A")
+            smask = self._reserve()
+            self._write_image(smask, alpha, "/DeviceGray", 1)
+        object_id = self._reserve()
+        self._write_image(object_id, image.convert("RGB"), "/DeviceRGB", 3,
+                          f" /SMask {smask} 0 R" if smask else "")
+        # Keep the image alive so its id() cannot be reused by another image
+        self.images[key] = (object_id, image)
+        return object_id
+
+    def _write_image(self, object_id, image, color_space, colors, extra=""):
+        data = _png_idat(image)
+        self._write_object(object_id, (f"<< /Type /XObject /Subtype /Image /Width {image.width} "
+                                       f"/Height {image.height} /ColorSpace {color_space} /BitsPerComponent 8{extra} "
+                                       f"/Filter /FlateDecode /DecodeParms << /Predictor 15 /Colors {colors} "
+                                       f"/BitsPerComponent 8 /Columns {image.width} >> "
+                                       f"/Length {len(data)} >>").encode("ascii"), data)
+
+    def add_page(self):
+        """Finishes the current page (if any) and starts a new one."""
+        self._finish_page()
+        self.content = []
+        self.page_images = {}
+
+    def draw_code(self, matrix, x, y, size, fill_color="black", back_color="white", images=(), text=None):
+        """
+        Draws one QR code on the current page.
+
+        :param matrix: Module matrix from qrcode.QRCode.get_matrix() (border included).
+        :param x: Left edge of the code, in points.
+        :param y: Top edge of the code, in points.
+        :param size: Width and height of the code, in points.
+        :param fill_color: Color of the QR code modules.
+        :param back_color: Background color ("transparent" for none).
+        :param images: Sequence of (PIL image, x, y, width, height) in points, relative to the code.
+        :param text: (Optional) dict with 'text', 'x', 'baseline', 'size' and 'color', relative to the code.
+        """
+        if self.content is None:
+            self.add_page()
+        module = size / len(matrix)
+        top = self.page_height - y
+        ops = self.content
+
+        if str(back_color).lower() != "transparent":
+            ops.append("{:.4f} {:.4f} {:.4f} rg".format(*(c / 255 for c in _rgb(back_color))))
+            ops.append(f"{x:.3f} {top - size:.3f} {size:.3f} {size:.3f} re f")
+        ops.append("{:.4f} {:.4f} {:.4f} rg".format(*(c / 255 for c in _rgb(fill_color))))
+        ops.extend(f"{x + col * module:.3f} {top - (row + 1) * module:.3f} {length * module:.3f} {module:.3f} re"
+                   for row, col, length in dark_runs(matrix))
+        ops.append("f")
+
+        for image, image_x, image_y, width, height in images:
+            object_id = self._image_object(image)
+            name = f"Im{object_id}"
+            self.page_images[name] = object_id
+            ops.append(f"q {width:.3f} 0 0 {height:.3f} {x + image_x:.3f} {top - image_y - height:.3f} cm "
+                       f"/{name} Do Q")
+
+        if text:
+            string = (text["text"].encode("cp1252", "replace")
+                      .replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)"))
+            ops.append("{:.4f} {:.4f} {:.4f} rg".format(*(c / 255 for c in _rgb(text["color"]))))
+            ops.append(f"BT /F1 {text['size']:.2f} Tf {x + text['x']:.3f} {top - text['baseline']:.3f} Td "
+                       f"({string.decode('latin-1')}) Tj ET")
+
+    def _finish_page(self):
+        if self.content is None:
+            return
+        data = zlib.compress("\n".join(self.content).encode("latin-1"))
+        content_id = self._reserve()
+        self._write_object(content_id, f"<< /Filter /FlateDecode /Length {len(data)} >>".encode("ascii"), data)
+        xobjects = " ".join(f"/{name} {object_id} 0 R" for name, object_id in self.page_images.items())
+        page_id = self._reserve()
+        self._write_object(page_id, (f"<< /Type /Page /Parent 2 0 R "
+                                     f"/MediaBox [0 0 {self.page_width:.2f} {self.page_height:.2f}] "
+                                     f"/Resources << /Font << /F1 3 0 R >> /XObject << {xobjects} >> >> "
+                                     f"/Contents {content_id} 0 R >>").encode("ascii"))
+        self.page_ids.append(page_id)
+        self.content = None
+        self.page_images = None
+
+    def close(self):
+        """Finishes the last page and writes the page tree, catalog and cross-reference table."""
+        if self.file is None:
+            return
+        self._finish_page()
+        kids = " ".join(f"{page_id} 0 R" for page_id in self.page_ids)
+        self._write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} >>".encode("ascii"))
+        self._write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+
+        xref_offset = self.file.tell()
+        count = self.next_id
+        lines = [f"xref\n0 {count}\n", "0000000000 65535 f \n"]
+        lines += [f"{self.offsets.get(i, 0):010d} 00000 {'n' if i in self.offsets else 'f'} \n"
+                  for i in range(1, count)]
+        lines.append(f"trailer\n<< /Size {count} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n")
+        self.file.write("".join(lines).encode("ascii"))
+        if self.owns_file:
+            self.file.close()
+        self.file = None
@@ -0,0 +1,55 @@
+import os
+
+from PIL import Image
+
+from QR_code_generator import generate_qr_code, load_logo
+from qr_cache import QRCache
+
+
+def generate(directory, data, filename="code.png", **options):
+    return generate_qr_code(data, save_directory=str(directory), filename=filename, verbose=False,
+                            cache_path=str(directory / ".qr_cache.sqlite"), **options)
+
+
+def test_unchanged_output_is_not_rendered_again(tmp_path):
+    path = generate(tmp_path, "hello")
+    mtime_ns = os.stat(path).st_mtime_ns
+    assert generate(tmp_path, "hello") == path
+    assert os.stat(path).st_mtime_ns == mtime_ns
+
+    generate(tmp_path, "changed")
+    assert os.stat(path).st_mtime_ns != mtime_ns
+    with QRCache(str(tmp_path / ".qr_cache.sqlite")) as cache:
+        stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['entries']) == (1, 2, 1)
+
+
+def test_output_changed_on_disk_is_rendered_again(tmp_path):
+    path = generate(tmp_path, "hello")
+    original = open(path, "rb").read()
+    with open(path, "wb") as f:
+        f.write(b"not a png")
+    generate(tmp_path, "hello")
+    assert open(path, "rb").read() == original
+
+
+def test_same_key_under_another_name_is_copied(tmp_path):
+    first = generate(tmp_path, "shared")
+    second = generate(tmp_path, "shared", filename="other.png")
+    assert open(first, "rb").read() == open(second, "rb").read()
+    with QRCache(str(tmp_path / ".qr_cache.sqlite")) as cache:
+        assert cache.stats()['hits'] == 1
+
+
+def test_replaced_logo_changes_the_key_and_the_cached_image(tmp_path):
+    logo = tmp_path / "logo.png"
+    Image.new("RGB", (40, 40), "red").save(logo)
+    path = generate(tmp_path, "logo", logo_path=str(logo))
+    assert load_logo(str(logo), 20).getpixel((0, 0)) == (255, 0, 0)
+    mtime_ns = os.stat(path).st_mtime_ns
+
+    Image.new("RGB", (40, 40), "blue").save(logo)
+    os.utime(logo, ns=(mtime_ns + 10 ** 9, mtime_ns + 10 ** 9))
+    assert load_logo(str(logo), 20).getpixel((0, 0)) == (0, 0, 255)
+    generate(tmp_path, "logo", logo_path=str(logo))
+    assert os.stat(path).st_mtime_ns != mtime_ns
@@ -0,0 +1,34 @@
+import pytest
+import qrcode
+
+np = pytest.importorskip("numpy")
+
+from QR_code_generator import compose_qr_image, render_qr_matrix
+
+
+def made_qr(data, box_size, border, version=None):
+    qr = qrcode.QRCode(version=version, error_correction=qrcode.constants.ERROR_CORRECT_H,
+                       box_size=box_size, border=border)
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr
+
+
+@pytest.mark.parametrize("data, box_size, border", [
+    ("hello", 1, 0),
+    ("https://example.com/some/longer/path?query=1", 10, 4),
+    ("x" * 300, 3, 2),
+])
+@pytest.mark.parametrize("fill_color, back_color", [("black", "white"), ("#123456", (250, 240, 10))])
+def test_numpy_renderer_matches_pil(data, box_size, border, fill_color, back_color):
+    qr = made_qr(data, box_size, border)
+    expected = qr.make_image(fill_color=fill_color, back_color=back_color).convert("RGB")
+    rendered = render_qr_matrix(qr, fill_color, back_color)
+    assert rendered.mode == "RGB" and rendered.size == expected.size
+    assert rendered.tobytes() == expected.tobytes()
+
+
+def test_compose_qr_image_renderers_match_with_text():
+    qr = made_qr("overlay", 8, 4)
+    images = [compose_qr_image(qr, text="caption", renderer=renderer) for renderer in ("pil", "numpy")]
+    assert images[0].tobytes() == images[1].tobytes()
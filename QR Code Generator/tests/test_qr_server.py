@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+import pytest
+
+import QR_code_generator as qr_gen
+from qr_server import QRServer
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / 'broken.png').write_bytes(b'not an image')
+    service = QRServer(workers=1, assets=str(tmp_path))
+    service.start()
+    yield service
+    service.close()
+
+
+def get(service, target):
+    status, content_type, payload = asyncio.run(service.route('GET', target, b''))
+    return status.value, content_type, payload
+
+
+@pytest.mark.parametrize('query, message', [
+    ('', 'data is required'),
+    ('data=x&box_size=0', 'box_size'),
+    ('data=x&text=hi&text_size=5000', 'text_size'),
+    ('data=x&logo=../secret.png', 'unknown asset'),
+    ('data=x&logo=broken.png', 'cannot read asset'),
+    ('data=x&fill_color=nope', 'color'),
+])
+def test_bad_requests_get_a_json_400(server, query, message):
+    status, content_type, payload = get(server, f'/qr?{query}')
+    assert (status, content_type) == (400, 'application/json')
+    assert message in json.loads(payload)['error']
+
+
+def test_autotune_without_a_decoder_is_rejected(server, monkeypatch):
+    monkeypatch.setattr(qr_gen, 'pyzbar', None)
+    monkeypatch.setattr(qr_gen, 'cv2', None)
+    status, _, payload = get(server, '/qr?data=x&autotune=1')
+    assert status == 400 and 'autotune' in json.loads(payload)['error']
+
+
+def test_other_render_failures_get_a_json_500(server):
+    server.pool.shutdown()
+    status, content_type, payload = get(server, '/qr?data=x')
+    assert (status, content_type, json.loads(payload)) == (500, 'application/json', {'error': 'render failed'})
+
+
+def test_png_and_cache_hit(server):
+    first = get(server, '/qr?data=hello&format=png')
+    assert first[:2] == (200, 'image/png') and first[2].startswith(b'\x89PNG')
+    assert get(server, '/qr?data=hello&format=png') == first
+    assert (server.hits, server.misses) == (1, 1)